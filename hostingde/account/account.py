@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import List, Optional
 
 from hostingde.hostingde import HostingDeCore
 from hostingde.model.account import Account
@@ -30,6 +30,10 @@ class AccountClient(HostingDeCore):
         limit: Optional[int] = None,
         filter: Optional[FilterElement] = None,
         sort: Optional[SortConfiguration] = None,
+        raw: bool = False,
+        fields: Optional[List[str]] = None,
+        lazy: bool = False,
+        prefetch: int = 0,
         *args: list,
         **kwargs: dict
     ) -> HostingDePaginator[Account]:
@@ -39,18 +43,24 @@ class AccountClient(HostingDeCore):
         :param limit: The limit of objects to retrieve per call. If not set, defaults to 25.
         :param filter: A filter that is applied to the query
         :param sort: Configuration how results are sorted.
+        :param raw: Yield the raw response dicts instead of models.
+        :param fields: Yield tuples of the given response fields instead of models, e.g. ['name', 'content'].
+        :param lazy: Yield proxies that only decode the fields which are accessed.
+        :param prefetch: The number of pages to fetch ahead in the background.
         :return: An iterator that yields Zone objects.
         """
 
         uri = self._build_uri('account', 'subaccountsFind')
 
-        return self._iter(uri, Account, filter, limit, sort)
+        return self._iter(
+            uri, Account, filter, limit, sort, raw=raw, fields=fields, lazy=lazy, prefetch=prefetch
+        )
 
     def get_own_account(self, **kwargs):
         uri = self._build_uri('account', 'getOwnAccount')
 
         response = self._request(uri)
 
-        data = response.json().get('response', {})
+        data = response.response
 
         return self._instance(Account, data)
@@ -0,0 +1,4 @@
+from .client import AsyncHostingDeClient, login
+from .paginator import AsyncHostingDePaginator
+
+__all__ = ['AsyncHostingDeClient', 'AsyncHostingDePaginator', 'login']
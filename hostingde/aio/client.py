@@ -0,0 +1,51 @@
+from hostingde.aio.clients import (
+    AsyncAccountClient,
+    AsyncBillingClient,
+    AsyncDnsClient,
+    AsyncDomainClient,
+    AsyncSslClient,
+)
+from hostingde.aio.core import AsyncHostingDeCore
+from hostingde.aio.transport import AsyncTransport
+from hostingde.exceptions import ClientException
+
+
+class AsyncHostingDeClient(AsyncHostingDeCore):
+    """
+    The main asyncio client.
+
+    Separates the different problem domains by building clients in this class attributes. All clients share the
+    session and the transport of this client. Close the client when done, or use it with async with.
+    """
+
+    def __init__(self, transport: AsyncTransport = None):
+        """
+        Construct a new client.
+
+        :param transport: The transport to send requests with. Defaults to a new AsyncTransport.
+        """
+        super().__init__()
+        self.transport = transport or self.transport
+        self.dns: AsyncDnsClient = AsyncDnsClient(self)
+        self.domain: AsyncDomainClient = AsyncDomainClient(self)
+        self.account: AsyncAccountClient = AsyncAccountClient(self)
+        self.billing: AsyncBillingClient = AsyncBillingClient(self)
+        self.ssl: AsyncSslClient = AsyncSslClient(self)
+
+
+def login(base_url: str, token: str, transport: AsyncTransport = None) -> AsyncHostingDeClient:
+    """
+    Entry point for the asyncio client. Builds the client and sets the token. No request is sent.
+
+    :param base_url: The base url for the backend, e.g. 'https://demo.routing.net/api'
+    :param token: The token for authorization
+    :param transport: The transport to send requests with
+    :return:
+    """
+
+    if base_url is None or base_url.strip() == "":
+        raise ClientException('No base url set!')
+
+    client = AsyncHostingDeClient(transport)
+    client.login(base_url, token)
+    return client
@@ -0,0 +1,295 @@
+from typing import Any, List, Optional, Union
+
+from hostingde.account.account import AccountClient
+from hostingde.aio.core import AsyncHostingDeCore
+from hostingde.aio.job_waiter import AsyncJobWaiter
+from hostingde.billing.billing import BillingClient
+from hostingde.dns.dns import DnsClient
+from hostingde.dns.requests.create_new_zone import CreateZoneRequest
+from hostingde.dns.requests.delete_zone import DeleteZoneRequest
+from hostingde.dns.requests.update_records_request import UpdateRecordsRequest
+from hostingde.dns.requests.update_zone_request import UpdateZoneRequest
+from hostingde.domain.domain import DomainClient
+from hostingde.domain.requests.check_availability import (
+    CheckAvailabilityRequest,
+    CheckAvailabilityResponse,
+)
+from hostingde.domain.requests.register_domain import RegisterDomainRequest
+from hostingde.exceptions import ClientException
+from hostingde.model.account import Account
+from hostingde.model.billing import DomainPrice
+from hostingde.model.domain import Domain, DomainContactRef, Nameserver
+from hostingde.model.lazy import hydrate, hydrate_all
+from hostingde.model.record import Record
+from hostingde.model.zone import Zone
+from hostingde.model.zone_config import ZoneConfig
+from hostingde.ssl.ssl import SslClient
+
+# The asyncio clients inherit the listing methods of the synchronous clients, which return an AsyncHostingDePaginator
+# through AsyncHostingDeCore._iter(). Every method that sends a request on its own is overridden by a coroutine.
+
+
+class AsyncDnsClient(AsyncHostingDeCore, DnsClient):
+    """
+    The asyncio counterpart of DnsClient.
+    """
+
+    async def get_default_nameserver(self) -> List[str]:  # type: ignore
+        uri = self.build_uri('nameserverSetGetDefault')
+
+        response = await self._request(uri)
+
+        data = response.response
+
+        return data.get('nameservers', [])
+
+    async def delete_zone(  # type: ignore
+        self, zone_config_id: Optional[str] = None, zone_name: Optional[str] = None, asynchronous: bool = None
+    ) -> bool:
+        """
+        The complete zone, ie. the zoneConfig and all records, will be deleted. See DnsClient.delete_zone().
+
+        :param zone_config_id: The ID of the zone to delete
+        :param zone_name: The name of the zone to delete
+        :param asynchronous: Do not wait for the deletion. Waiting is only supported for a given zone_config_id.
+        :return: True
+        :raise JobFailedException: If the operation was waited for and its job failed or was canceled
+        """
+        if zone_config_id is None and zone_name is None:
+            raise ClientException('At least one parameter has to be provided.')
+
+        if zone_config_id is not None and zone_name is not None:
+            raise ClientException('Only one parameter must be provided: Either the name, or the id, but not both.')
+
+        if zone_name and not asynchronous:
+            raise ClientException('Deleting a zone synchronously by name is currently not supported!')
+
+        url = self.build_uri('zoneDelete')
+        await self._request(url, DeleteZoneRequest(zone_config_id=zone_config_id, zone_name=zone_name))
+
+        if not asynchronous and zone_config_id is not None:
+            await AsyncJobWaiter(self, zone_config_id).wait_successful()
+
+        return True
+
+    async def update_zone(  # type: ignore
+        self,
+        zone_config: ZoneConfig,
+        records_to_add: Optional[List[Record]] = None,
+        records_to_delete: Optional[List[Record]] = None,
+        records_to_modify: Optional[List[Record]] = None,
+        asynchronous: Optional[bool] = None,
+    ) -> Zone:
+        """
+        Update the zoneConfig and the records of a zone. See DnsClient.update_zone().
+
+        :param zone_config: zoneConfig to be updated
+        :param records_to_add: Records to be added
+        :param records_to_delete: Records to be deleted
+        :param records_to_modify: Records to be modified
+        :param asynchronous: Do not wait for the jobs of the zone
+        :return: The updated zone
+        :raise JobFailedException: If the operation was waited for and its job failed or was canceled
+        """
+        url = self.build_uri('zoneUpdate')
+
+        response = await self._request(
+            url,
+            UpdateZoneRequest(
+                zone_config=hydrate(zone_config),
+                records_to_add=hydrate_all(records_to_add),
+                records_to_delete=hydrate_all(records_to_delete),
+                records_to_modify=hydrate_all(records_to_modify),
+            ),
+        )
+
+        zone = self._instance(Zone, response.response)
+
+        if not asynchronous and zone.zone_config.id is not None:
+            await AsyncJobWaiter(self, zone.zone_config.id).wait_successful()
+
+        return zone
+
+    async def records_update(  # type: ignore
+        self,
+        zone_config_id: Optional[str] = None,
+        zone_config_name: Optional[str] = None,
+        records_to_add: Optional[List[Record]] = None,
+        records_to_delete: Optional[List[Record]] = None,
+        records_to_modify: Optional[List[Record]] = None,
+        asynchronous: Optional[bool] = None,
+        dry_run: Optional[bool] = False,
+    ) -> Zone:
+        """
+        Update the records of a zone. See DnsClient.records_update().
+
+        :param zone_config_id: id of the zone to update
+        :param zone_config_name: name of the zone to update
+        :param records_to_add: Records to be added
+        :param records_to_delete: Records to be deleted
+        :param records_to_modify: Records to be modified
+        :param asynchronous: Do not wait for the jobs of the zone
+        :param dry_run: Don't perform the zone update, but only check if it might succeed.
+        :return: The updated zone
+        :raise JobFailedException: If the operation was waited for and its job failed or was canceled
+        """
+        url = self.build_uri('recordsUpdate')
+        if dry_run:
+            url += "Check"
+
+        response = await self._request(
+            url,
+            UpdateRecordsRequest(
+                zone_config_id=zone_config_id,
+                zone_config_name=zone_config_name,
+                records_to_add=hydrate_all(records_to_add),
+                records_to_delete=hydrate_all(records_to_delete),
+                records_to_modify=hydrate_all(records_to_modify),
+            ),
+        )
+
+        zone = self._instance(Zone, response.response)
+
+        if not dry_run and not asynchronous and zone.zone_config.id is not None:
+            await AsyncJobWaiter(self, zone.zone_config.id).wait_successful()
+
+        return zone
+
+    async def create_zone(  # type: ignore
+        self,
+        zone_config: ZoneConfig,
+        records: List = None,
+        nameserver_set_id: Optional[str] = None,
+        use_default_nameserver_set: Optional[bool] = None,
+        asynchronous: Optional[bool] = None,
+        dry_run: Optional[bool] = False,
+    ) -> Zone:
+        """
+        Create a zone. See DnsClient.create_zone().
+
+        :param zone_config: zoneConfig of the zone
+        :param records: Records of the zone
+        :param nameserver_set_id: NameserverSet to use for automatic creation of NS records. Default: 0
+        :param use_default_nameserver_set: Use your account's default nameserver set. Default: false
+        :param asynchronous: Do not wait for the jobs of the zone
+        :param dry_run: Don't perform the zone creation, but only check if it might succeed.
+        :return: The created zone
+        :raise JobFailedException: If the operation was waited for and its job failed or was canceled
+        """
+        url = self.build_uri('zoneCreate')
+        if dry_run:
+            url += "Check"
+
+        response = await self._request(
+            url,
+            CreateZoneRequest(
+                zone_config=hydrate(zone_config),
+                records=hydrate_all(records or []),
+                nameserver_set_id=nameserver_set_id,
+                use_default_nameserver_set=use_default_nameserver_set,
+            ),
+        )
+
+        zone: Zone = self._instance(Zone, response.response)
+
+        if not dry_run and not asynchronous and zone.zone_config.id is not None:
+            await AsyncJobWaiter(self, zone.zone_config.id).wait_successful()
+
+        return zone
+
+
+class AsyncDomainClient(AsyncHostingDeCore, DomainClient):
+    """
+    The asyncio counterpart of DomainClient.
+    """
+
+    async def check_domain_name_availability(  # type: ignore
+        self, domain_names: Union[str, List[str]]
+    ) -> List[CheckAvailabilityResponse]:
+        uri = self.build_uri('domainStatus')
+
+        if isinstance(domain_names, str):
+            domain_names = [domain_names]
+
+        response = await self._request(uri, CheckAvailabilityRequest(domain_names=domain_names))
+
+        return [self._instance(CheckAvailabilityResponse, x) for x in response.responses]
+
+    async def register_domain(  # type: ignore
+        self,
+        name: str,
+        contacts: List[DomainContactRef],
+        nameservers: List[Nameserver],
+        transfer_lock_enabled: bool = True,
+        asynchronous: Optional[bool] = None,
+    ) -> Domain:
+        """
+        Register a domain. See DomainClient.register_domain().
+
+        :param name: The name of the domain
+        :param contacts: The contacts of the domain
+        :param nameservers: The nameservers of the domain
+        :param transfer_lock_enabled: Lock the domain against transfers
+        :param asynchronous: Do not wait for the creation of the domain
+        :return: The domain
+        :raise JobFailedException: If the operation was waited for and its job failed or was canceled
+        """
+        url = self.build_uri('domainCreate')
+
+        response = await self._request(
+            url,
+            RegisterDomainRequest(
+                domain=Domain(
+                    name=name,
+                    contacts=contacts,
+                    nameservers=nameservers,
+                    transfer_lock_enabled=transfer_lock_enabled,
+                )
+            ),
+        )
+
+        domain: Domain = self._instance(Domain, response.response)
+
+        if not asynchronous and domain.id is not None:
+            await AsyncJobWaiter(self, domain.id, 'domainCreate').wait_successful()
+
+        return domain
+
+
+class AsyncAccountClient(AsyncHostingDeCore, AccountClient):
+    """
+    The asyncio counterpart of AccountClient.
+    """
+
+    async def get_own_account(self, **kwargs: Any) -> Account:  # type: ignore
+        uri = self._build_uri('account', 'getOwnAccount')
+
+        response = await self._request(uri)
+
+        return self._instance(Account, response.response)
+
+
+class AsyncBillingClient(AsyncHostingDeCore, BillingClient):
+    """
+    The asyncio counterpart of BillingClient.
+    """
+
+    async def price_list_domains(self) -> List[DomainPrice]:  # type: ignore
+        """
+        Get the price list of all domains
+
+        :return:
+        """
+        uri = self._build_uri('billing', 'priceListDomains')
+
+        response = await self._request(uri, None)
+
+        return [self._instance(DomainPrice, x) for x in response.responses]
+
+
+class AsyncSslClient(AsyncHostingDeCore, SslClient):
+    """
+    The asyncio counterpart of SslClient.
+    """
+
+    pass
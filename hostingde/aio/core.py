@@ -0,0 +1,150 @@
+import asyncio
+from typing import Any, Dict, List, Optional, Type, TypeVar
+
+import hostingde.aio
+from hostingde.aio.transport import AsyncTransport
+from hostingde.exceptions import ApiException, ClientException
+from hostingde.hostingde import HostingDeCore
+from hostingde.model import Model
+from hostingde.model.filter import FilterElement
+from hostingde.model.sort import SortConfiguration
+from hostingde.response import ApiResponse
+from hostingde.session import HostingDeAuth
+
+T = TypeVar('T', bound='Model')
+
+
+class AsyncHostingDeCore(HostingDeCore):
+    """
+    Base of the asyncio clients. The configuration (endpoint, authorization, codec) is kept in a HostingDeSession like
+    for the synchronous clients, requests are sent through an AsyncTransport without blocking the event loop.
+    """
+
+    def __init__(self, parent: Any = None):
+        """
+        Initialize a new asyncio Hosting.de API client.
+
+        :param parent: The parent resource, used to retrieve session information and the transport. If not provided,
+                       a new session is generated. WARNING: In this case, you must authenticate.
+        """
+        super().__init__(parent)
+        self.transport: AsyncTransport = getattr(parent, 'transport', None) or AsyncTransport()
+
+    async def _request(self, url: str, model: Optional[Model] = None, **kwargs: Any) -> ApiResponse:  # type: ignore
+        """
+        Execute a new request, given an URL and a model. Responses are served from the ResponseCache of the session
+        and identical concurrent reads are shared, if the session has a SingleFlight.
+
+        :param url: The URL resource to request
+        :param model: The model to pass to the endpoint
+        :param kwargs: Supports headers, additional headers of the request
+        :return: The parsed response
+        """
+        payload = model.to_json() if model is not None else None
+        auth = self.session.auth
+
+        if isinstance(auth, HostingDeAuth):
+            payload = auth.inject(payload if payload is not None else {})
+
+        body = self.session.codec.dumps(payload) if payload is not None else b''
+        headers = {'Content-Type': 'application/json', **kwargs.get('headers', {})}
+
+        cache, flight = self._response_cache(url), self._single_flight(url)
+        account_id = self._account_id()
+
+        if cache is not None:
+            cached = cache.lookup(url, account_id, body)
+            if cached is not None:
+                return self._parse(cached)
+
+        if flight is not None:
+            result = await flight.do_async((url, account_id, body), lambda: self._send(url, body, headers))
+        else:
+            result = await self._send(url, body, headers)
+
+        if cache is not None:
+            cache.save(url, account_id, body, result)
+
+        return result
+
+    async def _send(self, url: str, body: bytes, headers: Dict[str, str]) -> ApiResponse:  # type: ignore
+        """
+        Send a prepared request. Requests are paced by the rate limiter of the session and transient failures are
+        retried according to its retry policy.
+
+        :param url: The URL resource to request
+        :param body: The encoded body
+        :param headers: The headers of the request
+        :return: The parsed response
+        """
+        schedule = self._retry_schedule(url)
+
+        while True:
+            delay = self._rate_limit_delay(url)
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            response = None
+            try:
+                response = await self.transport.post(url, body, headers)
+                return self._parse(response)
+            except (ClientException, ApiException) as e:
+                delay = schedule.next_delay(e, response) if schedule is not None else None
+                if delay is None:
+                    raise
+
+            await asyncio.sleep(delay)
+
+    def _iter(  # type: ignore
+        self,
+        url: str,
+        instance_class: Type[T],
+        filter: Optional[FilterElement] = None,
+        limit: Optional[int] = None,
+        sort: Optional[SortConfiguration] = None,
+        page: Optional[int] = None,
+        raw: bool = False,
+        fields: Optional[List[str]] = None,
+        lazy: bool = False,
+        prefetch: int = 0,
+    ) -> 'hostingde.aio.AsyncHostingDePaginator[T]':
+        """
+        Use the generic filtering and sorting API to paginate over results with async for.
+
+        :param url: The URL of the resources to paginate.
+        :param instance_class: The expected response container
+        :param filter: The filter to be applied to the query
+        :param limit: The maximum number of items retrieved per call
+        :param sort: The sorting of the resulting list
+        :param page: Which page to query
+        :param raw: Yield the raw response dicts instead of models
+        :param fields: Yield tuples of the given response fields instead of models
+        :param lazy: Yield proxies that only decode the fields which are accessed
+        :param prefetch: The number of pages to request ahead, while the current page is consumed
+        :return: The iterator for the resultset
+        """
+        return hostingde.aio.AsyncHostingDePaginator(
+            self,
+            instance_class,
+            url,
+            filter=filter,
+            limit=limit,
+            sort=sort,
+            page=page,
+            raw=raw,
+            fields=fields,
+            lazy=lazy,
+            prefetch=prefetch,
+        )
+
+    async def close(self) -> None:
+        """
+        Close the connections of the transport.
+        """
+        await self.transport.close()
+
+    async def __aenter__(self) -> 'AsyncHostingDeCore':
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
@@ -0,0 +1,99 @@
+import asyncio
+from typing import Dict, Iterable, Optional
+
+from hostingde.job_waiter import Backoff, job_backoff, MultiJobWaiter, raise_for_status
+from hostingde.model.job import Job, JobStatus
+
+
+class AsyncMultiJobWaiter(MultiJobWaiter):
+    """
+    The asyncio counterpart of MultiJobWaiter. Waiting sleeps on the event loop instead of blocking it.
+    """
+
+    def __init__(self, service: object, ids: Iterable[str], action_name: Optional[str] = None, chunk_size: int = 50):
+        """
+        Track the jobs of a set of objects.
+
+        :param service: The asyncio client to query the jobs with
+        :param ids: The ids of the objects, e.g. zone config ids
+        :param action_name: Only wait for jobs of this type, e.g. 'domainCreate'
+        :param chunk_size: The maximum number of object ids per request
+        """
+        super().__init__(service, ids, action_name, chunk_size)  # type: ignore
+
+    async def poll(self) -> Dict[str, Optional[Job]]:  # type: ignore
+        """
+        Query the jobs of all pending objects once. Objects without unfinished jobs are removed from the pending set.
+
+        :return: The objects that finished in this round, mapped to their latest job
+        """
+        finished: Dict[str, Optional[Job]] = {}
+
+        for chunk in self._chunks(self.pending):
+            busy = {job.object_id async for job in self._unfinished(chunk)}  # type: ignore
+            done = [id for id in chunk if id not in busy]
+
+            # Look up the final state of the objects which just finished, with a single query for all of them
+            if done:
+                finished.update(dict.fromkeys(done))
+                async for job in self._latest(done):  # type: ignore
+                    if self._keep_latest(done, finished, job):
+                        break
+
+        return self._finish(finished)
+
+    async def wait(self, backoff: Optional[Backoff] = None) -> Dict[str, Optional[Job]]:  # type: ignore
+        """
+        Poll until no object has unfinished jobs.
+
+        :param backoff: The polling intervals and deadline. Defaults to Backoff().
+        :return: The latest job of each object, by object id
+        :raise JobTimeoutException: If the deadline passed before the jobs finished
+        """
+        backoff = backoff or Backoff()
+        delays, deadline = backoff.delays(), self._deadline(backoff)
+
+        while True:
+            await self.poll()
+
+            if not self.pending:
+                return self.results
+
+            await asyncio.sleep(self._next_delay(delays, deadline))
+
+
+class AsyncJobWaiter:
+    def __init__(self, service: object, id: str, action_name: Optional[str] = None, backoff: Optional[Backoff] = None):
+        """
+        Wait for the jobs of a single object.
+
+        :param service: The asyncio client to query the jobs with
+        :param id: The id of the object
+        :param action_name: Only wait for jobs of this type, e.g. 'domainCreate'
+        :param backoff: The polling intervals and deadline. Defaults to the job backoff of the session of the client,
+                        see set_job_backoff(), or Backoff().
+        """
+        self.service = service
+        self.id = id
+        self.action_name = action_name
+        self.backoff = backoff if backoff is not None else job_backoff(service)
+
+    async def wait(self) -> Optional[JobStatus]:
+        """
+        Poll until the object has no unfinished jobs.
+
+        :return: The terminal status of the latest job, e.g. JobStatus.failed. None if no job was found.
+        :raise JobTimeoutException: If the deadline passed before the jobs finished
+        """
+        waiter = AsyncMultiJobWaiter(self.service, [self.id], self.action_name)
+        job = (await waiter.wait(self.backoff))[self.id]
+        return job.status if job is not None else None
+
+    async def wait_successful(self) -> None:
+        """
+        Poll until the object has no unfinished jobs, and make sure the latest one did not fail.
+
+        :raise JobFailedException: If the latest job failed or was canceled
+        :raise JobTimeoutException: If the deadline passed before the jobs finished
+        """
+        raise_for_status(self.id, await self.wait())
@@ -0,0 +1,227 @@
+import asyncio
+from collections import deque
+from typing import Any, Deque, List, Optional, Type, TypeVar
+
+from hostingde.aio.core import AsyncHostingDeCore
+from hostingde.model import Model
+from hostingde.model.filter import FilterElement
+from hostingde.model.sort import SortConfiguration
+from hostingde.paginator import PaginatorBase
+
+R = TypeVar('R', bound="Model")
+
+
+def _retrieve_exception(task: asyncio.Future) -> None:
+    # The pages of an abandoned paginator are never awaited, their errors must not be reported as unretrieved
+    if not task.cancelled():
+        task.exception()
+
+
+class AsyncHostingDePaginator(AsyncHostingDeCore, PaginatorBase[R]):
+    """
+    The asyncio counterpart of HostingDePaginator, iterated with async for.
+    """
+
+    def __init__(
+        self,
+        parent: AsyncHostingDeCore,
+        instance_class: Type[R],
+        url: str,
+        count: Optional[int] = -1,
+        limit: Optional[int] = 25,
+        filter: Optional[FilterElement] = None,
+        sort: Optional[SortConfiguration] = None,
+        page: Optional[int] = None,
+        raw: bool = False,
+        fields: Optional[List[str]] = None,
+        lazy: bool = False,
+        prefetch: int = 0,
+    ):
+        """
+        Construct a new paginator.
+
+        :param parent: The parent to get session details from
+        :param instance_class: The instance class to create
+        :param url: The URL of the resource to paginate over
+        :param count: The total amount of entries to retrieve
+        :param limit: The maximum number of entries to retrieve per API call
+        :param filter: Filter the results based on a filter expression
+        :param sort: Sort the results by a given field
+        :param page: Which page to query. Requires limit to be set, which defaults to 25.
+        :param raw: Yield the raw response dicts instead of instances of instance_class
+        :param fields: Yield tuples of the given response fields instead of instances of instance_class
+        :param lazy: Yield proxies of instance_class, which only decode a field once it is accessed
+        :param prefetch: The number of pages to request ahead, while the current page is consumed
+        """
+        super().__init__(parent)
+
+        self._setup(instance_class, url, count, limit, filter, sort, page, raw, fields, lazy, prefetch)
+        self._pending: Deque[asyncio.Future] = deque()
+
+    def __aiter__(self) -> 'AsyncHostingDePaginator[R]':
+        return self
+
+    async def __aenter__(self) -> 'AsyncHostingDePaginator[R]':
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.aclose()
+
+    async def _fetch_page(self, page: int, limit: Optional[int] = None, filter: Any = None, sort: Any = None) -> dict:
+        """
+        Request a single page from the API.
+
+        :param page: The page number
+        :param limit: The page size, defaults to the limit of this paginator
+        :param filter: The filter element, defaults to the filter of this paginator
+        :param sort: The sorting, defaults to the sorting of this paginator
+        :return: The response object of the page
+        """
+        response = await self._request(self.url, model=self._query(page, limit or self.limit, filter, sort))
+        return response.response
+
+    async def _load_next(self) -> None:
+        if self._pending:
+            data = await self._pending.popleft()
+        else:
+            data = await self._fetch_page(self.current_page)
+
+        # if this was the first call, retrieve the amount of total pages
+        if self.total_pages == -1:
+            self.total_pages = data.get('totalPages', -1)
+            self._total_entries = data.get('totalEntries', -1)
+
+        self.current_page += 1
+
+        rows = data.get('data', [])
+        if len(rows) > 0:
+            self.results.extend(rows)
+
+        if self.prefetch > 0:
+            self._schedule_prefetch()
+
+    def _schedule_prefetch(self) -> None:
+        """
+        Start the requests for the pages following the current page, up to the prefetch depth.
+        """
+        while len(self._pending) < self.prefetch:
+            page = self.current_page + len(self._pending)
+
+            if self.total_pages == -1 or page > self.total_pages:
+                break
+
+            if self.count != -1 and self.count <= len(self.results) + len(self._pending) * self.limit:
+                break
+
+            task = asyncio.ensure_future(self._fetch_page(page))
+            task.add_done_callback(_retrieve_exception)
+            self._pending.append(task)
+
+    async def __anext__(self) -> Any:
+        """
+        Get the next result.
+
+        :return: The next entry in the list
+        """
+        if self.count == 0:
+            self.cancel()
+            raise StopAsyncIteration
+
+        if len(self.results) == 0:
+            # Are there more pages to be retrieved?
+            if self.total_pages < self.current_page and self.total_pages != -1:
+                self.cancel()
+                raise StopAsyncIteration
+
+            await self._load_next()
+
+            if len(self.results) == 0:
+                self.cancel()
+                raise StopAsyncIteration
+
+        self.count -= 1
+        return self._convert(self.results.popleft())
+
+    def cancel(self) -> None:
+        """
+        Cancel the requests of prefetched pages.
+        """
+        while self._pending:
+            self._pending.popleft().cancel()
+
+    async def aclose(self) -> None:
+        """
+        Cancel the requests of prefetched pages and wait until they stopped. The paginator stays usable, the pages are
+        requested again if more results are needed.
+        """
+        pending = list(self._pending)
+        self.cancel()
+
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    async def fetchall(self, parallel: int = 1) -> List[R]:
+        """
+        Load all results into memory.
+
+        :param parallel: The maximum number of pages that are requested concurrently
+        :return: The list of objects that this paginator generates
+        """
+        self.prefetch = max(self.prefetch, parallel if parallel > 1 else 0)
+
+        try:
+            return [item async for item in self]
+        finally:
+            await self.aclose()
+
+    async def fetchone(self) -> Optional[R]:
+        """
+        Only fetch a single resource from the API.
+
+        :return: A single object returned from the API
+        """
+        try:
+            return await self.__anext__()
+        except StopAsyncIteration:
+            return None
+
+    async def first(self, n: int = 1, sort: Optional[SortConfiguration] = None) -> List[Any]:
+        """
+        Get the first entries with a single request, which asks for exactly n entries.
+
+        :param n: The number of entries
+        :param sort: Sort the results by a given field, instead of the sorting of this paginator
+        :return: Up to n entries
+        """
+        if n <= 0:
+            return []
+
+        data = await self._fetch_page(1, n, sort=sort)
+        self._remember_total(data)
+
+        return [self._convert(row) for row in data.get('data', [])[:n]]
+
+    async def exists(self, filter: Optional[FilterElement] = None) -> bool:
+        """
+        Check whether any entry matches, with a single request for one entry which is not decoded.
+
+        :param filter: An additional filter, combined with the filter of this paginator
+        :return: Whether a matching entry exists
+        """
+        data = await self._fetch_page(1, 1, filter=self._combine(filter))
+
+        if filter is None:
+            self._remember_total(data)
+
+        return len(data.get('data', [])) > 0
+
+    async def count_total(self, refresh: bool = False) -> int:
+        """
+        Get the total number of entries matching the filter. Only a single entry is requested and it is not decoded.
+
+        :param refresh: Request the total again, even if it is cached
+        :return: The number of entries
+        """
+        if self._total_entries == -1 or refresh:
+            self._total_entries = self._read_total(await self._fetch_page(1, 1))
+
+        return self._total_entries
@@ -0,0 +1,119 @@
+from typing import Any, Dict, Optional
+
+from requests.structures import CaseInsensitiveDict
+
+from hostingde.__version__ import __version__
+from hostingde.exceptions import ClientException, TransportException
+
+
+class AsyncHttpResponse:
+    """
+    A HTTP response received by the AsyncTransport. Provides the attributes of requests.Response, which are used by
+    the clients.
+    """
+
+    def __init__(self, url: str, status_code: int, reason: str, headers: CaseInsensitiveDict, content: bytes):
+        """
+        Wrap a received response.
+
+        :param url: The URL of the request
+        :param status_code: The HTTP status code
+        :param reason: The reason phrase of the status
+        :param headers: The response headers
+        :param content: The response body
+        """
+        self.url = url
+        self.status_code = status_code
+        self.reason = reason
+        self.headers = headers
+        self.content = content
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+
+class AsyncTransport:
+    """
+    Sends the requests of the asyncio clients with httpx, which must be installed, e.g. with
+    `pip install python-hostingde[aio]`. Connections are kept alive, proxies are taken from the environment and
+    redirects are followed.
+    """
+
+    def __init__(self, timeout: Optional[float] = 60.0, max_connections: int = 10, verify: bool = True, **options: Any):
+        """
+        Configure the transport.
+
+        :param timeout: The maximum time in seconds for connecting, and for each read and write. None waits forever.
+        :param max_connections: The maximum number of concurrent connections
+        :param verify: Verify the TLS certificates of the server
+        :param options: Additional arguments of httpx.AsyncClient, e.g. proxy
+        :raise ClientException: If httpx is not installed
+        """
+        try:
+            import httpx
+        except ImportError:
+            raise ClientException('The asyncio client requires httpx, please install the package "httpx".')
+
+        self.timeout = timeout
+        self.max_connections = max(max_connections, 1)
+        self.verify = verify
+        self.options = options
+        self._httpx = httpx
+        self._client: Any = None
+
+    def _connections(self) -> Any:
+        """
+        Get the httpx client holding the connections, which is created on first use.
+
+        :return: The httpx.AsyncClient
+        """
+        if self._client is None:
+            httpx = self._httpx
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=httpx.Limits(max_connections=self.max_connections),
+                verify=self.verify,
+                follow_redirects=True,
+                headers={'User-Agent': f'python-hostingde/{__version__}'},
+                **self.options,
+            )
+        return self._client
+
+    async def post(self, url: str, data: bytes, headers: Optional[Dict[str, str]] = None) -> AsyncHttpResponse:
+        """
+        Send a POST request. Failed requests are not sent again, the retry policy of the client decides about that.
+
+        :param url: The URL to post to
+        :param data: The request body
+        :param headers: Additional request headers
+        :return: The response
+        :raise TransportException: If the server could not be reached or the request timed out
+        """
+        httpx = self._httpx
+
+        try:
+            response = await self._connections().post(url, content=data, headers=headers)
+        except (httpx.InvalidURL, httpx.UnsupportedProtocol) as e:
+            raise ClientException(f'Unsupported URL "{url}".') from e
+        except (httpx.ConnectTimeout, httpx.PoolTimeout) as e:
+            raise TransportException(f'Connecting to "{url}" timed out.', request_sent=False) from e
+        except httpx.ConnectError as e:
+            raise TransportException(f'Connecting to "{url}" failed: {e}', request_sent=False) from e
+        except httpx.TimeoutException as e:
+            raise TransportException(f'Request to "{url}" timed out.') from e
+        except httpx.TransportError as e:
+            raise TransportException(f'Request to "{url}" failed: {e}') from e
+
+        return AsyncHttpResponse(
+            url, response.status_code, response.reason_phrase, CaseInsensitiveDict(response.headers), response.content
+        )
+
+    async def close(self) -> None:
+        """
+        Close all connections. The transport opens new ones, if it is used again.
+        """
+        client, self._client = self._client, None
+
+        if client is not None:
+            await client.aclose()
@@ -1,13 +1,18 @@
+from typing import Any
+
 from hostingde.client import HostingDeClient
 from hostingde.exceptions import ClientException
 
 
-def login(base_url: str, token: str) -> HostingDeClient:
+def login(base_url: str, token: str, warm_up: int = 0, **pool_options: Any) -> HostingDeClient:
     """
     Entry point for the client. Builds and logs the user in.
 
     :param base_url: The base url for the backend, e.g. 'https://demo.routing.net/api'
     :param token: The token for authorization
+    :param warm_up: The number of connections to open to the endpoint right away, see HostingDeSession.warm_up()
+    :param pool_options: Options of the connection pool, e.g. pool_maxsize=32 or read_timeout=30. See
+                         HostingDeSession.configure_pool().
     :return:
     """
 
@@ -16,4 +21,11 @@ def login(base_url: str, token: str) -> HostingDeClient:
 
     client = HostingDeClient()
     client.login(base_url, token)
+
+    if pool_options:
+        client.session.configure_pool(**pool_options)
+
+    if warm_up > 0:
+        client.session.warm_up(warm_up)
+
     return client
@@ -31,6 +31,6 @@ class BillingClient(HostingDeCore):
 
         response = self._request(uri, None)
 
-        data = response.json().get('responses', {})
+        data = response.responses
 
         return [self._instance(DomainPrice, x) for x in data]
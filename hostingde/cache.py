@@ -0,0 +1,271 @@
+import hashlib
+import os
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import Counter, OrderedDict
+from typing import Dict, Mapping, Optional, Tuple, Union
+
+from requests.structures import CaseInsensitiveDict
+
+from hostingde.response import ApiResponse
+from hostingde.retry import method_of
+
+# The time to live of cached responses in seconds, by API method
+DEFAULT_TTLS: Mapping[str, float] = {
+    'nameserverSetGetDefault': 3600.0,
+    'priceListDomains': 3600.0,
+    'getOwnAccount': 300.0,
+    'subaccountsFind': 300.0,
+}
+
+
+class CacheStore(ABC):
+    """
+    Stores the bodies of cached responses. Keys start with the API method they belong to, followed by a dash.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Get a body, unless it expired.
+
+        :param key: The key of the response
+        :return: The body, or None if it is not stored or expired
+        """
+        pass
+
+    @abstractmethod
+    def set(self, key: str, content: bytes, expires: float) -> None:
+        """
+        Store a body.
+
+        :param key: The key of the response
+        :param content: The body
+        :param expires: The time the body expires, as a timestamp
+        """
+        pass
+
+    @abstractmethod
+    def clear(self, prefix: str = '') -> None:
+        """
+        Remove bodies.
+
+        :param prefix: Only remove the bodies whose keys start with the prefix
+        """
+        pass
+
+
+class MemoryStore(CacheStore):
+    """
+    Keeps the bodies in memory. If the bodies exceed the maximum size, the least recently used ones are evicted.
+    """
+
+    def __init__(self, max_bytes: int = 32 * 1024 * 1024):
+        """
+        Create an empty store.
+
+        :param max_bytes: The maximum total size of the stored bodies
+        """
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries: 'OrderedDict[str, Tuple[bytes, float]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                return None
+
+            if entry[1] <= time.time():
+                self._remove(key)
+                return None
+
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def set(self, key: str, content: bytes, expires: float) -> None:
+        if len(content) > self.max_bytes:
+            return
+
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = (content, expires)
+            self.size += len(content)
+
+            while self.size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+
+    def clear(self, prefix: str = '') -> None:
+        with self._lock:
+            for key in [key for key in self._entries if key.startswith(prefix)]:
+                self._remove(key)
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.size -= len(entry[0])
+
+
+class DiskStore(CacheStore):
+    """
+    Keeps the bodies in files of a directory, so several processes can share them. Files are replaced atomically, so
+    readers never see a partially written body. Expired files are removed when they are read.
+    """
+
+    def __init__(self, directory: Union[str, 'os.PathLike[str]']):
+        """
+        Use a directory as store. It is created if it does not exist.
+
+        :param directory: The directory of the files
+        """
+        self.directory = os.fspath(directory)
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key)
+
+    def get(self, key: str) -> Optional[bytes]:
+        try:
+            with open(self._path(key), 'rb') as f:
+                expires = float(f.readline())
+                content = f.read()
+        except (OSError, ValueError):
+            return None
+
+        if expires <= time.time():
+            self._unlink(self._path(key))
+            return None
+
+        return content
+
+    def set(self, key: str, content: bytes, expires: float) -> None:
+        fd, temporary = tempfile.mkstemp(dir=self.directory, prefix='.')
+
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(b'%r\n' % expires)
+                f.write(content)
+            os.replace(temporary, self._path(key))
+        except OSError:
+            self._unlink(temporary)
+
+    def clear(self, prefix: str = '') -> None:
+        for name in os.listdir(self.directory):
+            if name.startswith(prefix) and not name.startswith('.'):
+                self._unlink(self._path(name))
+
+    @staticmethod
+    def _unlink(path: str) -> None:
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+
+class CachedResponse:
+    """
+    A HTTP response restored from the cache. Provides the attributes of requests.Response, which are used by the
+    clients.
+    """
+
+    def __init__(self, url: str, content: bytes):
+        self.url = url
+        self.status_code = 200
+        self.reason = 'OK'
+        self.headers: CaseInsensitiveDict = CaseInsensitiveDict()
+        self.content = content
+
+    @property
+    def ok(self) -> bool:
+        return True
+
+
+class ResponseCache:
+    """
+    Caches the successful responses of read-only methods whose data rarely changes, e.g. the price list. Responses are
+    cached per account context and payload, so different filters or pages are cached separately.
+    """
+
+    def __init__(self, store: Optional[CacheStore] = None, ttls: Optional[Mapping[str, float]] = None):
+        """
+        Configure the cache.
+
+        :param store: Stores the bodies of the responses. Defaults to a MemoryStore.
+        :param ttls: The time to live in seconds by API method, e.g. {'priceListDomains': 3600}. Responses of other
+                     methods are not cached. Defaults to DEFAULT_TTLS.
+        """
+        self.store = store or MemoryStore()
+        self.ttls: Dict[str, float] = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.hits: Counter = Counter()
+        self.misses: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def applies(self, url: str) -> bool:
+        """
+        Check whether responses of a URL are cached.
+
+        :param url: The URL of the request
+        :return: True if a TTL is configured for the method
+        """
+        return self.ttls.get(method_of(url), 0) > 0
+
+    @staticmethod
+    def key(url: str, account_id: Optional[str], body: Union[str, bytes]) -> str:
+        """
+        Build the key of a request. The body is hashed, so the token it contains is not stored.
+
+        :param url: The URL of the request
+        :param account_id: The account context of the request
+        :param body: The encoded body of the request
+        :return: The key
+        """
+        digest = hashlib.sha256()
+        for part in (url, account_id or '', body):
+            digest.update(part.encode() if isinstance(part, str) else part)
+            digest.update(b'\0')
+
+        return f'{method_of(url)}-{digest.hexdigest()}'
+
+    def lookup(self, url: str, account_id: Optional[str], body: Union[str, bytes]) -> Optional[CachedResponse]:
+        """
+        Look up the response of a request.
+
+        :param url: The URL of the request
+        :param account_id: The account context of the request
+        :param body: The encoded body of the request
+        :return: The cached response, or None
+        """
+        content = self.store.get(self.key(url, account_id, body))
+
+        with self._lock:
+            (self.misses if content is None else self.hits)[method_of(url)] += 1
+
+        return CachedResponse(url, content) if content is not None else None
+
+    def save(self, url: str, account_id: Optional[str], body: Union[str, bytes], response: ApiResponse) -> None:
+        """
+        Cache the response of a request, if it succeeded.
+
+        :param url: The URL of the request
+        :param account_id: The account context of the request
+        :param body: The encoded body of the request
+        :param response: The parsed response
+        """
+        content = getattr(response.http_response, 'content', None)
+
+        if response.status != 'success' or not isinstance(content, bytes):
+            return
+
+        self.store.set(self.key(url, account_id, body), content, time.time() + self.ttls[method_of(url)])
+
+    def invalidate(self, method: Optional[str] = None) -> None:
+        """
+        Remove cached responses.
+
+        :param method: Only remove the responses of an API method, e.g. 'priceListDomains'
+        """
+        self.store.clear(f'{method}-' if method is not None else '')
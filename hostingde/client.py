@@ -1,8 +1,12 @@
+from typing import Any, Callable, Iterable, Iterator, Optional
+
 from hostingde.account.account import AccountClient
 from hostingde.billing.billing import BillingClient
 from hostingde.dns.dns import DnsClient
 from hostingde.domain.domain import DomainClient
+from hostingde.fanout import AccountItem, for_each_account
 from hostingde.hostingde import HostingDeCore
+from hostingde.model.filter import FilterElement
 from hostingde.ssl.ssl import SslClient
 
 
@@ -20,3 +24,30 @@ class HostingDeClient(HostingDeCore):
         self.account: AccountClient = AccountClient(self)
         self.billing: BillingClient = BillingClient(self)
         self.ssl: SslClient = SslClient(self)
+
+    def for_each_account(
+        self,
+        query: Callable[['HostingDeClient'], Iterable[Any]],
+        filter: Optional[FilterElement] = None,
+        accounts: Optional[Iterable[str]] = None,
+        workers: int = 8,
+        return_exceptions: bool = False,
+        buffer: int = 1000,
+    ) -> Iterator[AccountItem]:
+        """
+        Run a query in the context of every subaccount concurrently, e.g. to list the zones of all subaccounts. The
+        items are yielded as soon as they arrive, tagged with the id of their account.
+
+        >>> for account_id, zone in client.for_each_account(lambda client: client.dns.list_zones()):
+        ...     print(account_id, zone)
+
+        :param query: Called with this client within the account context. Returns the items of the account.
+        :param filter: Filters the subaccounts, which are listed with AccountClient.list_subaccounts_names()
+        :param accounts: The account ids to query, instead of listing the subaccounts
+        :param workers: The maximum number of accounts queried at the same time
+        :param return_exceptions: Yield an exception raised by the query of an account as its item, instead of raising
+                                  it
+        :param buffer: The maximum number of items, which are fetched ahead of the consumer
+        :return: The items of all accounts
+        """
+        return for_each_account(self, query, filter, accounts, workers, return_exceptions, buffer)
@@ -0,0 +1,122 @@
+import json
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional, Type, Union
+
+from hostingde.exceptions import ClientException
+
+
+class JsonCodec(ABC):
+    """
+    Encodes request payloads and decodes response bodies. Implementations work on bytes, so response bodies can be
+    decoded without building an intermediate string.
+    """
+
+    name: str = ''
+
+    @abstractmethod
+    def dumps(self, data: Any) -> bytes:
+        """
+        Serialize data to JSON.
+
+        :param data: The data to serialize
+        :return: The UTF-8 encoded JSON document
+        """
+        pass
+
+    @abstractmethod
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """
+        Deserialize a JSON document.
+
+        :param data: The JSON document
+        :return: The decoded data
+        :raise ValueError: If the document is not valid JSON
+        """
+        pass
+
+
+class StdlibCodec(JsonCodec):
+    """
+    Codec based on the json module of the standard library. Always available.
+    """
+
+    name = 'json'
+
+    def dumps(self, data: Any) -> bytes:
+        return json.dumps(data).encode('utf-8')
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(JsonCodec):
+    """
+    Codec based on orjson, requires the orjson package.
+    """
+
+    name = 'orjson'
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._orjson = orjson
+
+    def dumps(self, data: Any) -> bytes:
+        return self._orjson.dumps(data)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return self._orjson.loads(data)
+
+
+class UjsonCodec(JsonCodec):
+    """
+    Codec based on ujson, requires the ujson package.
+    """
+
+    name = 'ujson'
+
+    def __init__(self) -> None:
+        import ujson
+
+        self._ujson = ujson
+
+    def dumps(self, data: Any) -> bytes:
+        return self._ujson.dumps(data, escape_forward_slashes=False).encode('utf-8')
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return self._ujson.loads(data)
+
+
+CODECS: Dict[str, Type[JsonCodec]] = {
+    OrjsonCodec.name: OrjsonCodec,
+    UjsonCodec.name: UjsonCodec,
+    StdlibCodec.name: StdlibCodec,
+}
+
+
+def get_codec(codec: Optional[Union[str, JsonCodec]] = None) -> JsonCodec:
+    """
+    Get a JSON codec.
+
+    :param codec: The name of the codec ('orjson', 'ujson' or 'json'), or a codec instance. If not provided, the
+                  fastest installed codec is used.
+    :return: The codec
+    :raise ClientException: If the requested codec is unknown or its library is not installed
+    """
+    if isinstance(codec, JsonCodec):
+        return codec
+
+    if codec is None:
+        for codec_class in CODECS.values():
+            try:
+                return codec_class()
+            except ImportError:
+                continue
+
+    if codec not in CODECS:
+        raise ClientException(f'Unknown JSON codec "{codec}". Available codecs are: {", ".join(CODECS.keys())}')
+
+    try:
+        return CODECS[codec]()
+    except ImportError:
+        raise ClientException(f'JSON codec "{codec}" is not available, please install the package "{codec}".')
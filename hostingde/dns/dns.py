@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import List, Optional, Union
 
 from hostingde.dns.requests.create_new_zone import CreateZoneRequest
 from hostingde.dns.requests.delete_zone import DeleteZoneRequest
@@ -6,9 +6,10 @@ from hostingde.dns.requests.update_records_request import UpdateRecordsRequest
 from hostingde.dns.requests.update_zone_request import UpdateZoneRequest
 from hostingde.exceptions import ClientException
 from hostingde.hostingde import HostingDeCore
-from hostingde.job_waiter import AsynchronousClient, JobWaiter
+from hostingde.job_waiter import AsynchronousClient, job_tracker, JobFuture, JobWaiter
 from hostingde.model.filter import FilterElement
 from hostingde.model.job import Job
+from hostingde.model.lazy import hydrate, hydrate_all
 from hostingde.model.record import Record
 from hostingde.model.sort import SortConfiguration
 from hostingde.model.zone import Zone
@@ -39,7 +40,7 @@ class DnsClient(HostingDeCore, AsynchronousClient):
 
         response = self._request(uri)
 
-        data = response.json().get('response', {})
+        data = response.response
 
         return data.get('nameservers', [])
 
@@ -49,6 +50,10 @@ class DnsClient(HostingDeCore, AsynchronousClient):
         filter: Optional[FilterElement] = None,
         sort: Optional[SortConfiguration] = None,
         page: Optional[int] = None,
+        raw: bool = False,
+        fields: Optional[List[str]] = None,
+        lazy: bool = False,
+        prefetch: int = 0,
         *args: list,
         **kwargs: dict
     ) -> HostingDePaginator[Zone]:
@@ -113,12 +118,18 @@ class DnsClient(HostingDeCore, AsynchronousClient):
         :param filter: A filter that is applied to the query
         :param sort: Configuration how results are sorted.
         :param page: The page to retrieve. If limit is unset, 25 items will be retrieved.
+        :param raw: Yield the raw response dicts instead of models.
+        :param fields: Yield tuples of the given response fields instead of models, e.g. ['name', 'content'].
+        :param lazy: Yield proxies that only decode the fields which are accessed.
+        :param prefetch: The number of pages to fetch ahead in the background.
         :return: An iterator that yields Zone objects.
         """
 
         uri = self._build_uri('dns', 'zonesFind')
 
-        return self._iter(uri, Zone, filter, limit, sort, page)
+        return self._iter(
+            uri, Zone, filter, limit, sort, page, raw=raw, fields=fields, lazy=lazy, prefetch=prefetch
+        )
 
     def list_zone_configs(
         self,
@@ -126,6 +137,10 @@ class DnsClient(HostingDeCore, AsynchronousClient):
         filter: Optional[FilterElement] = None,
         sort: Optional[SortConfiguration] = None,
         page: Optional[int] = None,
+        raw: bool = False,
+        fields: Optional[List[str]] = None,
+        lazy: bool = False,
+        prefetch: int = 0,
         *args: list,
         **kwargs: dict
     ) -> HostingDePaginator[ZoneConfig]:
@@ -176,12 +191,18 @@ class DnsClient(HostingDeCore, AsynchronousClient):
         :param filter: A filter that is applied to the query
         :param sort: Configuration how results are sorted.
         :param page: The page to retrieve. If limit is unset, 25 items will be retrieved.
+        :param raw: Yield the raw response dicts instead of models.
+        :param fields: Yield tuples of the given response fields instead of models, e.g. ['name', 'content'].
+        :param lazy: Yield proxies that only decode the fields which are accessed.
+        :param prefetch: The number of pages to fetch ahead in the background.
         :return: An iterator that yields Zone objects.
         """
 
         uri = self._build_uri('dns', 'zoneConfigsFind')
 
-        return self._iter(uri, ZoneConfig, filter, limit, sort, page)
+        return self._iter(
+            uri, ZoneConfig, filter, limit, sort, page, raw=raw, fields=fields, lazy=lazy, prefetch=prefetch
+        )
 
     def list_records(
         self,
@@ -189,6 +210,10 @@ class DnsClient(HostingDeCore, AsynchronousClient):
         filter: Optional[FilterElement] = None,
         sort: Optional[SortConfiguration] = None,
         page: Optional[int] = None,
+        raw: bool = False,
+        fields: Optional[List[str]] = None,
+        lazy: bool = False,
+        prefetch: int = 0,
         *args: list,
         **kwargs: dict
     ) -> HostingDePaginator[Record]:
@@ -219,16 +244,26 @@ class DnsClient(HostingDeCore, AsynchronousClient):
         :param filter: A filter that is applied to the query
         :param sort: Configuration how results are sorted.
         :param page: The page to retrieve. If limit is unset, 25 items will be retrieved.
+        :param raw: Yield the raw response dicts instead of models.
+        :param fields: Yield tuples of the given response fields instead of models, e.g. ['name', 'content'].
+        :param lazy: Yield proxies that only decode the fields which are accessed.
+        :param prefetch: The number of pages to fetch ahead in the background.
         :return: An iterator that yields Zone objects.
         """
 
         uri = self._build_uri('dns', 'recordsFind')
 
-        return self._iter(uri, Record, filter, limit, sort, page)
+        return self._iter(
+            uri, Record, filter, limit, sort, page, raw=raw, fields=fields, lazy=lazy, prefetch=prefetch
+        )
 
     def delete_zone(
-        self, zone_config_id: Optional[str] = None, zone_name: Optional[str] = None, asynchronous: bool = None
-    ) -> bool:
+        self,
+        zone_config_id: Optional[str] = None,
+        zone_name: Optional[str] = None,
+        asynchronous: bool = None,
+        future: bool = False,
+    ) -> Union[bool, JobFuture]:
         """
         The complete zone, ie. the zoneConfig and all records, will be deleted.
         Either the ID or the name has to be provided. If both are set, an error will be returned.
@@ -236,7 +271,10 @@ class DnsClient(HostingDeCore, AsynchronousClient):
         :param zone_config_id: The ID of the zone to delete
         :param zone_name: The name of the zone to delete
         :param asynchronous: Perform delete async. Synchronous is only supported for a given zone_config_id.
+        :param future: Return a JobFuture, which resolves once the zone was deleted. Only supported for a given
+                       zone_config_id.
         :return: EmptyResponse
+        :raise JobFailedException: If the operation was waited for and its job failed or was canceled
         """
 
         if zone_config_id is None and zone_name is None:
@@ -248,11 +286,17 @@ class DnsClient(HostingDeCore, AsynchronousClient):
         if zone_name and not asynchronous:
             raise ClientException('Deleting a zone synchronously by name is currently not supported!')
 
+        if zone_name and future:
+            raise ClientException('Tracking the deletion of a zone by name is currently not supported!')
+
         url = self.build_uri('zoneDelete')
         self._request(url, DeleteZoneRequest(zone_config_id=zone_config_id, zone_name=zone_name))
 
+        if future:
+            return job_tracker.track(self, zone_config_id, response=True)
+
         if not asynchronous and zone_config_id is not None:
-            JobWaiter(self, zone_config_id).wait()
+            JobWaiter(self, zone_config_id).wait_successful()
 
         return True
 
@@ -262,6 +306,10 @@ class DnsClient(HostingDeCore, AsynchronousClient):
         filter: Optional[FilterElement] = None,
         sort: Optional[SortConfiguration] = None,
         page: Optional[int] = None,
+        raw: bool = False,
+        fields: Optional[List[str]] = None,
+        lazy: bool = False,
+        prefetch: int = 0,
         *args: list,
         **kwargs: dict
     ) -> HostingDePaginator[Job]:
@@ -272,11 +320,17 @@ class DnsClient(HostingDeCore, AsynchronousClient):
         :param filter: A filter that is applied to the query
         :param sort: Configuration how results are sorted.
         :param page: The page to retrieve. If limit is unset, 25 items will be retrieved.
+        :param raw: Yield the raw response dicts instead of models.
+        :param fields: Yield tuples of the given response fields instead of models, e.g. ['name', 'content'].
+        :param lazy: Yield proxies that only decode the fields which are accessed.
+        :param prefetch: The number of pages to fetch ahead in the background.
         :return: An iterator that yields ZoneConfig objects.
         """
         uri = self._build_uri('dns', 'jobsFind')
 
-        return self._iter(uri, Job, filter, limit, sort, page)
+        return self._iter(
+            uri, Job, filter, limit, sort, page, raw=raw, fields=fields, lazy=lazy, prefetch=prefetch
+        )
 
     def update_zone(
         self,
@@ -284,8 +338,9 @@ class DnsClient(HostingDeCore, AsynchronousClient):
         records_to_add: Optional[List[Record]] = None,
         records_to_delete: Optional[List[Record]] = None,
         records_to_modify: Optional[List[Record]] = None,
-        asynchronous: Optional[bool] = None
-    ) -> Zone:
+        asynchronous: Optional[bool] = None,
+        future: bool = False,
+    ) -> Union[Zone, JobFuture]:
         """
         You can use zoneUpdate to make adjustments to the zone's zoneConfig, to remove records, to add new records or
         to modify existing records.
@@ -301,24 +356,30 @@ class DnsClient(HostingDeCore, AsynchronousClient):
         :param records_to_delete: Records to be modified
         :param records_to_modify: Records to be deleted
         :param asynchronous: Update the zone asynchronously. If not provided, defaults to synchronous mode.
+        :param future: Return a JobFuture instead of the zone, which resolves once the jobs of the zone finished. The
+                       zone is available as its response.
         :return:
+        :raise JobFailedException: If the operation was waited for and its job failed or was canceled
         """
         url = self.build_uri('zoneUpdate')
 
         response = self._request(
             url,
             UpdateZoneRequest(
-                zone_config=zone_config,
-                records_to_add=records_to_add,
-                records_to_delete=records_to_delete,
-                records_to_modify=records_to_modify,
+                zone_config=hydrate(zone_config),
+                records_to_add=hydrate_all(records_to_add),
+                records_to_delete=hydrate_all(records_to_delete),
+                records_to_modify=hydrate_all(records_to_modify),
             ),
         )
 
-        zone = self._instance(Zone, response.json().get('response', {}))
+        zone = self._instance(Zone, response.response)
+
+        if future:
+            return job_tracker.track(self, zone.zone_config.id, response=zone)
 
         if not asynchronous and zone.zone_config.id is not None:
-            JobWaiter(self, zone.zone_config.id).wait()
+            JobWaiter(self, zone.zone_config.id).wait_successful()
 
         return zone
 
@@ -330,8 +391,9 @@ class DnsClient(HostingDeCore, AsynchronousClient):
         records_to_delete: Optional[List[Record]] = None,
         records_to_modify: Optional[List[Record]] = None,
         asynchronous: Optional[bool] = None,
-        dry_run: Optional[bool] = False
-    ) -> Zone:
+        dry_run: Optional[bool] = False,
+        future: bool = False,
+    ) -> Union[Zone, JobFuture]:
         """
         You can use zoneUpdate to make adjustments to the zone's zoneConfig, to remove records, to add new records or
         to modify existing records.
@@ -351,7 +413,10 @@ class DnsClient(HostingDeCore, AsynchronousClient):
         :param records_to_modify: Records to be deleted
         :param asynchronous: Update the zone asynchronously. If not provided, defaults to synchronous mode.
         :param dry_run: Don't perform the zone update, but only check if it might succeed.
+        :param future: Return a JobFuture instead of the zone, which resolves once the jobs of the zone finished. The
+                       zone is available as its response.
         :return:
+        :raise JobFailedException: If the operation was waited for and its job failed or was canceled
         """
         url = self.build_uri('recordsUpdate')
         if dry_run:
@@ -362,16 +427,19 @@ class DnsClient(HostingDeCore, AsynchronousClient):
             UpdateRecordsRequest(
                 zone_config_id=zone_config_id,
                 zone_config_name=zone_config_name,
-                records_to_add=records_to_add,
-                records_to_delete=records_to_delete,
-                records_to_modify=records_to_modify,
+                records_to_add=hydrate_all(records_to_add),
+                records_to_delete=hydrate_all(records_to_delete),
+                records_to_modify=hydrate_all(records_to_modify),
             ),
         )
 
-        zone = self._instance(Zone, response.json().get('response', {}))
+        zone = self._instance(Zone, response.response)
+
+        if future:
+            return job_tracker.track(self, None if dry_run else zone.zone_config.id, response=zone)
 
         if not dry_run and not asynchronous and zone.zone_config.id is not None:
-            JobWaiter(self, zone.zone_config.id).wait()
+            JobWaiter(self, zone.zone_config.id).wait_successful()
 
         return zone
 
@@ -382,8 +450,9 @@ class DnsClient(HostingDeCore, AsynchronousClient):
         nameserver_set_id: Optional[str] = None,
         use_default_nameserver_set: Optional[bool] = None,
         asynchronous: Optional[bool] = None,
-        dry_run: Optional[bool] = False
-    ) -> Zone:
+        dry_run: Optional[bool] = False,
+        future: bool = False,
+    ) -> Union[Zone, JobFuture]:
         """
         To create a zone, you need at least a zoneConfig.
 
@@ -398,7 +467,10 @@ class DnsClient(HostingDeCore, AsynchronousClient):
         :param use_default_nameserver_set: Use your account's default nameserver set. Default: false
         :param asynchronous: Create the zone asynchronously. If not provided, defaults to False (synchronous mode).
         :param dry_run: Don't perform the zone creation, but only check if it might succeed.
+        :param future: Return a JobFuture instead of the zone, which resolves once the jobs of the zone finished. The
+                       zone is available as its response.
         :return:
+        :raise JobFailedException: If the operation was waited for and its job failed or was canceled
         """
         if records is None:
             records = []
@@ -410,16 +482,19 @@ class DnsClient(HostingDeCore, AsynchronousClient):
         response = self._request(
             url,
             CreateZoneRequest(
-                zone_config=zone_config,
-                records=records,
+                zone_config=hydrate(zone_config),
+                records=hydrate_all(records),
                 nameserver_set_id=nameserver_set_id,
                 use_default_nameserver_set=use_default_nameserver_set,
             ),
         )
 
-        zone: Zone = self._instance(Zone, response.json().get('response', {}))
+        zone: Zone = self._instance(Zone, response.response)
+
+        if future:
+            return job_tracker.track(self, None if dry_run else zone.zone_config.id, response=zone)
 
         if not dry_run and not asynchronous and zone.zone_config.id is not None:
-            JobWaiter(self, zone.zone_config.id).wait()
+            JobWaiter(self, zone.zone_config.id).wait_successful()
 
         return zone
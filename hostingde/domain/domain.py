@@ -5,7 +5,7 @@ from hostingde.domain.requests.register_domain import RegisterDomainRequest
 from hostingde.model.domain_contact import DomainContact
 from hostingde.paginator import HostingDePaginator
 from hostingde.hostingde import HostingDeCore
-from hostingde.job_waiter import AsynchronousClient, JobWaiter
+from hostingde.job_waiter import AsynchronousClient, JobFuture, JobWaiter, job_tracker
 from hostingde.model.domain import Domain, Nameserver, DomainContactRef
 from hostingde.model.filter import FilterElement
 from hostingde.model.job import Job
@@ -37,6 +37,10 @@ class DomainClient(HostingDeCore, AsynchronousClient):
         filter: Optional[FilterElement] = None,
         sort: Optional[SortConfiguration] = None,
         page: Optional[int] = None,
+        raw: bool = False,
+        fields: Optional[List[str]] = None,
+        lazy: bool = False,
+        prefetch: int = 0,
         *args: list,
         **kwargs: dict
     ) -> HostingDePaginator[Job]:
@@ -47,11 +51,17 @@ class DomainClient(HostingDeCore, AsynchronousClient):
         :param filter: A filter that is applied to the query
         :param sort: Configuration how results are sorted.
         :param page: The page to retrieve. If limit is unset, 25 items will be retrieved.
+        :param raw: Yield the raw response dicts instead of models.
+        :param fields: Yield tuples of the given response fields instead of models, e.g. ['name', 'content'].
+        :param lazy: Yield proxies that only decode the fields which are accessed.
+        :param prefetch: The number of pages to fetch ahead in the background.
         :return: An iterator that yields ZoneConfig objects.
         """
         uri = self._build_uri('domain', 'jobsFind')
 
-        return self._iter(uri, Job, filter, limit, sort, page)
+        return self._iter(
+            uri, Job, filter, limit, sort, page, raw=raw, fields=fields, lazy=lazy, prefetch=prefetch
+        )
 
     def check_domain_name_availability(self, domain_names: Union[str, List[str]]) -> List[CheckAvailabilityResponse]:
         uri = self.build_uri('domainStatus')
@@ -64,7 +74,7 @@ class DomainClient(HostingDeCore, AsynchronousClient):
             CheckAvailabilityRequest(domain_names=domain_names)
         )
 
-        data = response.json().get('responses', [])
+        data = response.responses
 
         return list(map(lambda x: self._instance(CheckAvailabilityResponse, x), data))
 
@@ -74,6 +84,10 @@ class DomainClient(HostingDeCore, AsynchronousClient):
         filter: Optional[FilterElement] = None,
         sort: Optional[SortConfiguration] = None,
         page: Optional[int] = None,
+        raw: bool = False,
+        fields: Optional[List[str]] = None,
+        lazy: bool = False,
+        prefetch: int = 0,
         *args: list,
         **kwargs: dict
     ) -> HostingDePaginator[Domain]:
@@ -84,12 +98,18 @@ class DomainClient(HostingDeCore, AsynchronousClient):
         :param filter: A filter that is applied to the query
         :param sort: Configuration how results are sorted.
         :param page: The page to retrieve. If limit is unset, 25 items will be retrieved.
+        :param raw: Yield the raw response dicts instead of models.
+        :param fields: Yield tuples of the given response fields instead of models, e.g. ['name', 'content'].
+        :param lazy: Yield proxies that only decode the fields which are accessed.
+        :param prefetch: The number of pages to fetch ahead in the background.
         :return: An iterator that yields Zone objects.
         """
 
         uri = self._build_uri('domain', 'domainsFind')
 
-        return self._iter(uri, Domain, filter, limit, sort, page)
+        return self._iter(
+            uri, Domain, filter, limit, sort, page, raw=raw, fields=fields, lazy=lazy, prefetch=prefetch
+        )
 
     def list_contacts(
         self,
@@ -97,6 +117,10 @@ class DomainClient(HostingDeCore, AsynchronousClient):
         filter: Optional[FilterElement] = None,
         sort: Optional[SortConfiguration] = None,
         page: Optional[int] = None,
+        raw: bool = False,
+        fields: Optional[List[str]] = None,
+        lazy: bool = False,
+        prefetch: int = 0,
         *args: list,
         **kwargs: dict
     ) -> HostingDePaginator[DomainContact]:
@@ -107,12 +131,18 @@ class DomainClient(HostingDeCore, AsynchronousClient):
         :param filter: A filter that is applied to the query
         :param sort: Configuration how results are sorted.
         :param page: The page to retrieve. If limit is unset, 25 items will be retrieved.
+        :param raw: Yield the raw response dicts instead of models.
+        :param fields: Yield tuples of the given response fields instead of models, e.g. ['name', 'content'].
+        :param lazy: Yield proxies that only decode the fields which are accessed.
+        :param prefetch: The number of pages to fetch ahead in the background.
         :return: An iterator that yields Zone objects.
         """
 
         uri = self._build_uri('domain', 'contactsFind')
 
-        return self._iter(uri, DomainContact, filter, limit, sort, page)
+        return self._iter(
+            uri, DomainContact, filter, limit, sort, page, raw=raw, fields=fields, lazy=lazy, prefetch=prefetch
+        )
 
     def register_domain(
         self,
@@ -121,7 +151,8 @@ class DomainClient(HostingDeCore, AsynchronousClient):
         nameservers: List[Nameserver],
         transfer_lock_enabled=True,
         asynchronous: Optional[bool] = None,
-    ) -> Domain:
+        future: bool = False,
+    ) -> Union[Domain, JobFuture]:
         """
         In order to create a domain, you need to send a domainCreate request. This request takes one parameter domain
         which contains all required information of a domain object.
@@ -131,7 +162,10 @@ class DomainClient(HostingDeCore, AsynchronousClient):
         :param nameservers:
         :param transfer_lock_enabled:
         :param asynchronous:
+        :param future: Return a JobFuture instead of the domain, which resolves once the domain was created. The domain
+                       is available as its response.
         :return:
+        :raise JobFailedException: If the operation was waited for and its job failed or was canceled
         """
         url = self.build_uri('domainCreate')
 
@@ -147,9 +181,12 @@ class DomainClient(HostingDeCore, AsynchronousClient):
             ),
         )
 
-        domain: Domain = self._instance(Domain, response.json().get('response', {}))
+        domain: Domain = self._instance(Domain, response.response)
+
+        if future:
+            return job_tracker.track(self, domain.id, 'domainCreate', response=domain)
 
         if not asynchronous and domain.id is not None:
-            JobWaiter(self, domain.id, 'domainCreate').wait()
+            JobWaiter(self, domain.id, 'domainCreate').wait_successful()
 
         return domain
\ No newline at end of file
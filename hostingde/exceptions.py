@@ -1,3 +1,6 @@
+from typing import Any, Iterable
+
+
 class ApiException(Exception):
     """
     The client throws an API exception, whenever the error was unknown. Details are included in the exception.
@@ -15,5 +18,44 @@ class ClientException(Exception):
     pass
 
 
+class TransportException(ClientException):
+    """
+    Raised if a request failed because of the connection, e.g. a reset or a timeout.
+    """
+
+    def __init__(self, message: str, request_sent: bool = True) -> None:
+        """
+        :param message: The description of the failure
+        :param request_sent: Whether the request may have reached the server. False if it failed while connecting.
+        """
+        super().__init__(message)
+        self.request_sent = request_sent
+
+
 class ContextConditionException(Exception):
     pass
+
+
+class JobTimeoutException(ClientException):
+    """
+    Raised if jobs did not finish before the deadline. The ids of the objects with unfinished jobs are included.
+    """
+
+    def __init__(self, pending: Iterable[str]) -> None:
+        self.pending = sorted(pending)
+        super().__init__(f'Jobs of {len(self.pending)} objects did not finish in time: {", ".join(self.pending[:10])}')
+
+
+class JobFailedException(ClientException):
+    """
+    Raised if the latest job of an object that was waited for failed or was canceled.
+    """
+
+    def __init__(self, object_id: str, status: Any) -> None:
+        """
+        :param object_id: The id of the object
+        :param status: The terminal status of the job, a JobStatus
+        """
+        self.object_id = object_id
+        self.status = status
+        super().__init__(f'The job of "{object_id}" finished with status {getattr(status, "value", status)}.')
@@ -0,0 +1,101 @@
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, Iterator, NamedTuple, Optional
+
+from hostingde.model.filter import FilterElement
+
+
+class AccountItem(NamedTuple):
+    """
+    A result of a query that ran in the context of an account.
+    """
+
+    account_id: str
+    item: Any
+
+
+class _Failure(NamedTuple):
+    account_id: str
+    error: Exception
+
+
+# Marks that a worker finished the query of an account
+_DONE = object()
+
+
+def for_each_account(
+    client: Any,
+    query: Callable[[Any], Iterable[Any]],
+    filter: Optional[FilterElement] = None,
+    accounts: Optional[Iterable[str]] = None,
+    workers: int = 8,
+    return_exceptions: bool = False,
+    buffer: int = 1000,
+) -> Iterator[AccountItem]:
+    """
+    Run a query in the context of every subaccount concurrently. The results are yielded as soon as they arrive,
+    tagged with the id of the account.
+
+    :param client: The client to run the queries with, e.g. a HostingDeClient
+    :param query: Called with the client within the account context. Returns the items of the account, e.g.
+                  lambda client: client.dns.list_zones()
+    :param filter: Filters the subaccounts, which are listed with AccountClient.list_subaccounts_names()
+    :param accounts: The account ids to query, instead of listing the subaccounts
+    :param workers: The maximum number of accounts queried at the same time
+    :param return_exceptions: Yield an exception raised by the query of an account as its item, instead of raising it
+    :param buffer: The maximum number of items, which are fetched ahead of the consumer
+    :return: The items of all accounts
+    """
+    if accounts is None:
+        accounts = (id for id, in client.account.list_subaccounts_names(limit=100, filter=filter, fields=['id']))
+
+    items: queue.Queue = queue.Queue(maxsize=max(buffer, 1))
+    stopped = threading.Event()
+
+    def put(value: Any) -> bool:
+        # Wait for the consumer, unless it stopped consuming
+        while not stopped.is_set():
+            try:
+                items.put(value, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def work(account_id: str) -> None:
+        try:
+            if stopped.is_set():
+                return
+
+            with client.switch_account_context(account_id):
+                for item in query(client):
+                    if not put(AccountItem(account_id, item)):
+                        return
+        except Exception as e:
+            put(_Failure(account_id, e))
+        finally:
+            put(_DONE)
+
+    pool = ThreadPoolExecutor(max_workers=max(workers, 1), thread_name_prefix='hostingde-fanout')
+
+    try:
+        submitted = 0
+        for account_id in accounts:
+            pool.submit(work, account_id)
+            submitted += 1
+
+        while submitted > 0:
+            value = items.get()
+
+            if value is _DONE:
+                submitted -= 1
+            elif isinstance(value, _Failure):
+                if not return_exceptions:
+                    raise value.error
+                yield AccountItem(value.account_id, value.error)
+            else:
+                yield value
+    finally:
+        stopped.set()
+        pool.shutdown(wait=False)
@@ -1,15 +1,21 @@
-import json.decoder
+import time
 from contextlib import contextmanager
-from typing import Generator, Optional, Type, TypeVar
+from typing import Any, Generator, List, Optional, Type, TypeVar, Union
 
-from requests import Response
+from requests import RequestException
 
 import hostingde
+from hostingde.cache import ResponseCache
+from hostingde.codec import JsonCodec
 from hostingde.exceptions import ApiException, ClientException
 from hostingde.model import Model
 from hostingde.model.filter import FilterElement
 from hostingde.model.sort import SortConfiguration
-from hostingde.session import HostingDeSession
+from hostingde.rate_limit import RateLimiter
+from hostingde.response import ApiResponse
+from hostingde.retry import Backoff, RetryPolicy, RetrySchedule
+from hostingde.session import HostingDeAuth, HostingDeSession, InjectedAuth
+from hostingde.single_flight import SingleFlight
 
 T = TypeVar('T', bound='Model')
 
@@ -34,30 +40,151 @@ class HostingDeCore:
         """
         return self.session.post(*args, **kwargs)
 
-    def _request(self, url: str, model: Optional[Model] = None, **kwargs: dict) -> Response:
+    def _request(self, url: str, model: Optional[Model] = None, **kwargs: dict) -> ApiResponse:
         """
         Execute a new request, given an URL and a model. To generate a URL, you can use the _build_url() utility
-        method.
+        method. Responses are served from the ResponseCache of the session and identical concurrent reads are shared,
+        if the session has a SingleFlight.
 
         :param url: The URL resource to request
         :param model: The model to pass to the endpoint
         :param kwargs: additional keyword arguments to pass to requests.post()
-        :return:
+        :return: The parsed response
         """
-        if model is None:
-            response = self._post(url, **kwargs)
+        payload = model.to_json() if model is not None else None
+        auth = self.session.auth
+
+        if isinstance(auth, HostingDeAuth) and 'auth' not in kwargs:
+            # Inject the authorization before serializing, so the body is only encoded once
+            body = self.session.codec.dumps(auth.inject(payload if payload is not None else {}))
+
+            if model is not None:
+                kwargs['headers'] = {'Content-Type': 'application/json', **kwargs.get('headers', {})}
+
+            kwargs.update(data=body, auth=InjectedAuth())
+        elif payload is not None:
+            kwargs['json'] = payload
+
+        cache, flight = self._response_cache(url), self._single_flight(url)
+
+        if cache is None and flight is None:
+            return self._send(url, **kwargs)
+
+        account_id = self._account_id()
+        body = kwargs.get('data') or self.session.codec.dumps(kwargs.get('json'))
+
+        if cache is not None:
+            cached = cache.lookup(url, account_id, body)
+            if cached is not None:
+                return self._parse(cached)
+
+        if flight is not None:
+            result = flight.do((url, account_id, body), lambda: self._send(url, **kwargs))
         else:
-            response = self._post(url, json=model.to_json(), **kwargs)
+            result = self._send(url, **kwargs)
 
-        # Check if error occurred
+        if cache is not None:
+            cache.save(url, account_id, body, result)
+
+        return result
+
+    def _send(self, url: str, **kwargs: Any) -> ApiResponse:
+        """
+        Send a prepared request. Requests are paced by the rate limiter of the session and transient failures are
+        retried according to its retry policy.
+
+        :param url: The URL resource to request
+        :param kwargs: The keyword arguments to pass to requests.post(), including the body
+        :return: The parsed response
+        """
+        schedule = self._retry_schedule(url)
+
+        while True:
+            delay = self._rate_limit_delay(url)
+            if delay > 0:
+                time.sleep(delay)
+
+            response = None
+            try:
+                response = self._post(url, **kwargs)
+                return self._parse(response)
+            except (RequestException, ClientException, ApiException) as e:
+                delay = schedule.next_delay(e, response) if schedule is not None else None
+                if delay is None:
+                    raise
+
+            time.sleep(delay)
+
+    def _retry_schedule(self, url: str) -> Optional[RetrySchedule]:
+        """
+        Start tracking the attempts of a request, if the session retries failed requests.
+
+        :param url: The URL of the request
+        :return: The schedule of the request, or None if failed requests are not retried
+        """
+        policy = getattr(self.session, 'retry_policy', None)
+        return policy.schedule(url) if isinstance(policy, RetryPolicy) else None
+
+    def _rate_limit_delay(self, url: str) -> float:
+        """
+        Take a token for a request from the rate limiter of the session.
+
+        :param url: The URL of the request
+        :return: The time in seconds to wait before sending the request
+        """
+        limiter = getattr(self.session, 'rate_limiter', None)
+
+        if not isinstance(limiter, RateLimiter):
+            return 0.0
+
+        return limiter.reserve(url, self._account_id())
+
+    def _single_flight(self, url: str) -> Optional[SingleFlight]:
+        """
+        Get the SingleFlight of the session, if requests to the URL may be shared.
+
+        :param url: The URL of the request
+        :return: The SingleFlight, or None if the request is sent on its own
+        """
+        flight = getattr(self.session, 'single_flight', None)
+        return flight if isinstance(flight, SingleFlight) and flight.applies(url) else None
+
+    def _response_cache(self, url: str) -> Optional[ResponseCache]:
+        """
+        Get the ResponseCache of the session, if responses of the URL are cached.
+
+        :param url: The URL of the request
+        :return: The cache, or None if the response is not cached
+        """
+        cache = getattr(self.session, 'response_cache', None)
+        return cache if isinstance(cache, ResponseCache) and cache.applies(url) else None
+
+    def _account_id(self) -> Optional[str]:
+        """
+        Get the account context requests are sent in.
+
+        :return: The account id, or None for the account of the token
+        """
+        auth = self.session.auth
+        return auth.current_account_id() if isinstance(auth, HostingDeAuth) else None
+
+    def _parse(self, response: Any) -> ApiResponse:
+        """
+        Decode the body of a HTTP response and check it for errors.
+
+        :param response: The HTTP response, providing the body as content
+        :return: The parsed response
+        """
         try:
-            error_check = response.json()
-            if error_check.get('status', 'error') == 'error':
-                raise ApiException(error_check)
-        except json.decoder.JSONDecodeError:
+            result = ApiResponse(self.session.codec.loads(response.content), response)
+        except ValueError:
             raise ClientException('Error while reading response from server. Is your endpoint configured correctly?')
 
-        return response
+        # Check if error occurred
+        if result.status == 'error':
+            raise ApiException(result.data)
+
+        return result
 
     def _instance(self, instance_type: Type[T], data: dict) -> T:
         """
@@ -67,9 +194,9 @@ class HostingDeCore:
         :param data: The data used to reconstruct the model
         :return: The parsed model
         """
-        return instance_type.from_json(data, self)  # type: ignore
+        return instance_type.from_json(data, self, fast=getattr(self.session, 'fast_decode', False))  # type: ignore
 
-    def _bool(self, response: Response) -> bool:
+    def _bool(self, response: ApiResponse) -> bool:
         """
         Converts a response to a boolean. True, if the request succeeded, otherwise False. Note that a status of
         'pending' also returns False. You may want to use the _async method to wait for the job to complete.
@@ -77,7 +204,7 @@ class HostingDeCore:
         :param response: The response from the backend.
         :return:
         """
-        return response.json().get('status') == 'success'
+        return response.status == 'success'
 
     def _build_uri(self, service: str, method: str) -> str:
         """
@@ -97,6 +224,10 @@ class HostingDeCore:
         limit: Optional[int] = None,
         sort: Optional[SortConfiguration] = None,
         page: Optional[int] = None,
+        raw: bool = False,
+        fields: Optional[List[str]] = None,
+        lazy: bool = False,
+        prefetch: int = 0,
     ) -> 'hostingde.HostingDePaginator[T]':
         """
         Use the generic filtering and sorting API to paginate over results.
@@ -106,10 +237,27 @@ class HostingDeCore:
         :param filter: The filter to be applied to the query
         :param limit: The maximum number of items retrieved per call
         :param sort: The sorting of the resulting list
+        :param page: Which page to query
+        :param raw: Yield the raw response dicts instead of models
+        :param fields: Yield tuples of the given response fields instead of models
+        :param lazy: Yield proxies that only decode the fields which are accessed
+        :param prefetch: The number of pages to fetch ahead in the background
         :return: The iterator for the resultset
         """
 
-        return hostingde.HostingDePaginator(self, instance_class, url, filter=filter, limit=limit, sort=sort, page=page)
+        return hostingde.HostingDePaginator(
+            self,
+            instance_class,
+            url,
+            filter=filter,
+            limit=limit,
+            sort=sort,
+            page=page,
+            raw=raw,
+            fields=fields,
+            lazy=lazy,
+            prefetch=prefetch,
+        )
 
     def login(self, url: str, token: str) -> None:
         """
@@ -130,22 +278,89 @@ class HostingDeCore:
         """
         self.session.set_account_context(account_id)
 
+    def set_fast_decode(self, enabled: bool = True) -> None:
+        """
+        Decode API responses using compiled decoders instead of the marshmallow schemas. Applies to every client that
+        shares this session.
+
+        :param enabled: Whether fast decoding is used
+        :return:
+        """
+        self.session.fast_decode = enabled
+
+    def set_retry_policy(self, policy: Optional[RetryPolicy]) -> None:
+        """
+        Sets how failed requests of every client that shares this session are retried.
+
+        :param policy: The retry policy, or None to raise every failure right away
+        :return:
+        """
+        self.session.retry_policy = policy
+
+    def set_job_backoff(self, backoff: Optional[Backoff]) -> None:
+        """
+        Sets how synchronous operations of every client that shares this session poll their jobs, e.g. the deadline
+        after which update_zone() gives up with a JobTimeoutException.
+
+        :param backoff: The polling intervals and deadline, or None to poll with Backoff(), which waits forever
+        :return:
+        """
+        self.session.job_backoff = backoff
+
+    def set_rate_limiter(self, limiter: Optional[RateLimiter]) -> None:
+        """
+        Sets the rate limiter, which paces the requests of every client that shares this session.
+
+        :param limiter: The rate limiter, or None to send requests right away
+        :return:
+        """
+        self.session.rate_limiter = limiter
+
+    def set_single_flight(self, single_flight: Optional[SingleFlight]) -> None:
+        """
+        Sets the SingleFlight, which shares identical concurrent reads of every client that shares this session.
+
+        :param single_flight: The SingleFlight, or None to send every request on its own
+        :return:
+        """
+        self.session.single_flight = single_flight
+
+    def set_response_cache(self, cache: Optional[ResponseCache]) -> None:
+        """
+        Sets the cache of rarely changing responses of every client that shares this session.
+
+        :param cache: The cache, or None to request every response
+        :return:
+        """
+        self.session.response_cache = cache
+
+    def set_json_codec(self, codec: Optional[Union[str, JsonCodec]]) -> None:
+        """
+        Sets the JSON codec used for requests of every client that shares this session.
+
+        :param codec: The name of the codec ('orjson', 'ujson' or 'json') or a codec instance. If None, the fastest
+                      installed codec is used.
+        :return:
+        """
+        self.session.set_codec(codec)
+
     @contextmanager
-    def switch_account_context(self, account_id: str) -> Generator[None, None, None]:
+    def switch_account_context(self, account_id: Optional[str]) -> Generator[None, None, None]:
         """
         Temporarily switch the account context for this client. After the context guard closes, the context is reset to
         the account that was used prior to the guard.
 
+        The account is only switched for the current thread or asyncio task, requests of other threads and tasks keep
+        their account. Threads started within the guard do not inherit the account, unless they copy the context.
+
         :param account_id: The account id to switch to
         :return:
         """
-        old_id: Optional[str] = self.session.get_account_context()
-
-        self.session.set_account_context(account_id)
-
-        yield
+        if not isinstance(self.session.auth, HostingDeAuth):
+            raise ClientException('Subaccount could not be attached to request')
 
-        self.session.set_account_context(old_id)
+        with self.session.auth.account_context(account_id):
+            yield
 
     @staticmethod
     def new_session() -> HostingDeSession:
@@ -1,11 +1,22 @@
+import contextvars
+import threading
 import time
 from abc import ABC, abstractmethod
-from typing import Optional
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
-from hostingde.model.filter import FilterCondition, FilterElement
-from hostingde.model.job import Job
-from hostingde.model.sort import SortConfiguration
+from hostingde.exceptions import JobFailedException, JobTimeoutException
+from hostingde.model.filter import (
+    FilterChain,
+    FilterChainConnective,
+    FilterCondition,
+    FilterElement,
+)
+from hostingde.model.job import Job, JobStatus
+from hostingde.model.sort import SortConfiguration, SortOrder
 from hostingde.paginator import HostingDePaginator
+from hostingde.retry import Backoff, Failure, RetryPolicy
+from hostingde.session import HostingDeAuth
 
 
 class AsynchronousClient(ABC):
@@ -15,6 +26,10 @@ class AsynchronousClient(ABC):
         limit: Optional[int] = None,
         filter: Optional[FilterElement] = None,
         sort: Optional[SortConfiguration] = None,
+        raw: bool = False,
+        fields: Optional[List[str]] = None,
+        lazy: bool = False,
+        prefetch: int = 0,
         *args: list,
         **kwargs: dict
     ) -> HostingDePaginator[Job]:
@@ -24,33 +39,471 @@ class AsynchronousClient(ABC):
         :param limit: The limit of objects to retrieve per call. If not set, defaults to 25.
         :param filter: A filter that is applied to the query
         :param sort: Configuration how results are sorted.
+        :param raw: Yield the raw response dicts instead of models.
+        :param fields: Yield tuples of the given response fields instead of models, e.g. ['name', 'content'].
+        :param lazy: Yield proxies that only decode the fields which are accessed.
+        :param prefetch: The number of pages to fetch ahead in the background.
         :return: An iterator that yields ZoneConfig objects.
         """
         pass
 
 
 class JobWaiter:
-    def __init__(self, service: AsynchronousClient, id: str, action_name: Optional[str] = None):
+    def __init__(
+        self,
+        service: AsynchronousClient,
+        id: str,
+        action_name: Optional[str] = None,
+        backoff: Optional[Backoff] = None,
+    ):
+        """
+        Wait for the jobs of a single object.
+
+        :param service: The client to query the jobs with
+        :param id: The id of the object
+        :param action_name: Only wait for jobs of this type, e.g. 'domainCreate'
+        :param backoff: The polling intervals and deadline. Defaults to the job backoff of the session of the client,
+                        see set_job_backoff(), or Backoff().
+        """
         self.service = service
         self.id = id
         self.action_name = action_name
+        self.backoff = backoff if backoff is not None else job_backoff(service)
+
+    def wait(self) -> Optional[JobStatus]:
+        """
+        Poll until the object has no unfinished jobs.
+
+        :return: The terminal status of the latest job, e.g. JobStatus.failed. None if no job was found.
+        :raise JobTimeoutException: If the deadline passed before the jobs finished
+        """
+        job = MultiJobWaiter(self.service, [self.id], self.action_name).wait(self.backoff)[self.id]
+        return job.status if job is not None else None
+
+    def wait_successful(self) -> None:
+        """
+        Poll until the object has no unfinished jobs, and make sure the latest one did not fail.
+
+        :raise JobFailedException: If the latest job failed or was canceled
+        :raise JobTimeoutException: If the deadline passed before the jobs finished
+        """
+        raise_for_status(self.id, self.wait())
+
+
+def job_backoff(service: Any) -> Optional[Backoff]:
+    """
+    Get the job backoff of the session of a client.
+
+    :param service: The client
+    :return: The backoff, or None if the session has none
+    """
+    backoff = getattr(getattr(service, 'session', None), 'job_backoff', None)
+    return backoff if isinstance(backoff, Backoff) else None
+
+
+def raise_for_status(object_id: str, status: Optional[JobStatus]) -> None:
+    """
+    Raise if the latest job of an object failed or was canceled.
+
+    :param object_id: The id of the object
+    :param status: The terminal status of the latest job, or None if no job was found
+    :raise JobFailedException: If the job failed or was canceled
+    """
+    if status in (JobStatus.failed, JobStatus.canceled):
+        raise JobFailedException(object_id, status)
+
+
+TERMINAL_STATUSES = (JobStatus.successful, JobStatus.failed, JobStatus.canceled)
+
+
+# Sorts the jobs of an object so the most recently added one comes first
+LATEST_FIRST = SortConfiguration('jobAddDate', SortOrder.DESC)
+
+
+class MultiJobWaiter:
+    """
+    Waits for the jobs of many objects at once. The objects are polled together, using one jobsFind request per chunk
+    of object ids, instead of one request per object.
+    """
+
+    def __init__(
+        self,
+        service: AsynchronousClient,
+        ids: Iterable[str],
+        action_name: Optional[str] = None,
+        chunk_size: int = 50,
+    ):
+        """
+        Track the jobs of a set of objects.
+
+        :param service: The client to query the jobs with
+        :param ids: The ids of the objects, e.g. zone config ids
+        :param action_name: Only wait for jobs of this type, e.g. 'domainCreate'
+        :param chunk_size: The maximum number of object ids per request
+        """
+        self.service = service
+        self.action_name = action_name
+        self.chunk_size = max(chunk_size, 1)
+        self.pending: Set[str] = set(ids)
+        self.results: Dict[str, Optional[Job]] = {}
+
+    def _filter(self, ids: List[str], unfinished: bool) -> FilterElement:
+        """
+        Build the filter for the jobs of a chunk of objects.
+
+        :param ids: The object ids
+        :param unfinished: Only match jobs, which are not in a terminal status
+        :return: The filter
+        """
+        objects = FilterChain(FilterChainConnective.OR)
+        for id in ids:
+            objects.add_filter(FilterCondition('jobObjectId').eq(id))
+
+        f = FilterChain(FilterChainConnective.AND).add_filter(objects)
 
-    def wait(self) -> None:
-        f = FilterCondition('jobObjectId').eq(self.id) \
-            & FilterCondition('jobStatus').ne('successful') \
-            & FilterCondition('jobStatus').ne('failed') \
-            & FilterCondition('jobStatus').ne('canceled')
+        if unfinished:
+            for status in TERMINAL_STATUSES:
+                f.add_filter(FilterCondition('jobStatus').ne(status.value))
 
         # Append an additional action name filter, if provided
         if self.action_name:
-            f = f & FilterCondition('jobType').eq(self.action_name)
+            f.add_filter(FilterCondition('jobType').eq(self.action_name))
+
+        return f
+
+    def _chunks(self, ids: Iterable[str]) -> Iterable[List[str]]:
+        """
+        Split object ids into chunks of at most chunk_size ids.
+
+        :param ids: The object ids
+        :return: The chunks
+        """
+        ordered = sorted(ids)
+        for start in range(0, len(ordered), self.chunk_size):
+            yield ordered[start : start + self.chunk_size]
+
+    def _latest(self, ids: List[str]) -> HostingDePaginator[Job]:
+        """
+        Build the query for the jobs of a chunk of objects, most recently added first.
+
+        :param ids: The object ids
+        :return: The paginator of the jobs, see _keep_latest()
+        """
+        return self.service.jobs_find(filter=self._filter(ids, False), limit=self.chunk_size, sort=LATEST_FIRST)
+
+    @staticmethod
+    def _keep_latest(ids: List[str], latest: Dict[str, Optional[Job]], job: Job) -> bool:
+        """
+        Keep a job of the _latest() query, if it is the first one of its object.
+
+        :param ids: The object ids, whose latest job was not seen yet. Updated in place.
+        :param latest: The latest job of each object. Updated in place.
+        :param job: The job
+        :return: True once the latest job of every object was seen, so no further jobs are needed
+        """
+        if job.object_id in ids:
+            ids.remove(job.object_id)
+            latest[job.object_id] = job
+
+        return not ids
+
+    def _unfinished(self, chunk: List[str]) -> HostingDePaginator[Job]:
+        """
+        Build the query for the unfinished jobs of a chunk of objects.
+
+        :param chunk: The object ids
+        :return: The paginator of the jobs
+        """
+        return self.service.jobs_find(filter=self._filter(chunk, True), limit=self.chunk_size)
+
+    def _finish(self, finished: Dict[str, Optional[Job]]) -> Dict[str, Optional[Job]]:
+        """
+        Remove objects from the pending set and keep their latest jobs.
+
+        :param finished: The objects that finished, mapped to their latest job
+        :return: The finished objects
+        """
+        for id, job in finished.items():
+            self.pending.discard(id)
+            self.results[id] = job
+
+        return finished
+
+    @staticmethod
+    def _deadline(backoff: Backoff) -> Optional[float]:
+        """
+        Get the time at which waiting gives up.
+
+        :param backoff: The polling intervals and deadline
+        :return: The monotonic time of the deadline, or None to wait forever
+        """
+        return time.monotonic() + backoff.deadline if backoff.deadline is not None else None
+
+    def _next_delay(self, delays: Iterator[float], deadline: Optional[float]) -> float:
+        """
+        Get the interval until the next poll, which ends at the deadline at the latest.
+
+        :param delays: The intervals of the backoff
+        :param deadline: The monotonic time of the deadline, or None
+        :return: The interval in seconds
+        :raise JobTimeoutException: If the deadline passed
+        """
+        delay = next(delays)
+
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise JobTimeoutException(self.pending)
+            delay = min(delay, remaining)
+
+        return delay
+
+    def poll(self) -> Dict[str, Optional[Job]]:
+        """
+        Query the jobs of all pending objects once. Objects without unfinished jobs are removed from the pending set.
+
+        :return: The objects that finished in this round, mapped to their latest job. The job is None, if no job was
+                 found for the object.
+        """
+        finished: Dict[str, Optional[Job]] = {}
+
+        for chunk in self._chunks(self.pending):
+            busy = {job.object_id for job in self._unfinished(chunk)}
+            done = [id for id in chunk if id not in busy]
+
+            # Look up the final state of the objects which just finished, with a single query for all of them
+            if done:
+                finished.update(dict.fromkeys(done))
+                for job in self._latest(done):
+                    if self._keep_latest(done, finished, job):
+                        break
+
+        return self._finish(finished)
+
+    def wait(self, backoff: Optional[Backoff] = None) -> Dict[str, Optional[Job]]:
+        """
+        Poll until no object has unfinished jobs.
+
+        :param backoff: The polling intervals and deadline. Defaults to Backoff().
+        :return: The latest job of each object, by object id
+        :raise JobTimeoutException: If the deadline passed before the jobs finished
+        """
+        backoff = backoff or Backoff()
+        delays, deadline = backoff.delays(), self._deadline(backoff)
+
+        while True:
+            self.poll()
+
+            if not self.pending:
+                return self.results
+
+            time.sleep(self._next_delay(delays, deadline))
+
+
+class JobFuture(Future):
+    """
+    The pending result of an asynchronous operation. It resolves to the latest job of the affected object, once the
+    object has no unfinished jobs left. The object returned by the operation itself is available right away.
+    """
+
+    def __init__(self, object_id: Optional[str], response: Any = None):
+        """
+        Create a future for the jobs of an object.
+
+        :param object_id: The id of the object affected by the operation
+        :param response: The object returned by the operation, e.g. the updated zone
+        """
+        super().__init__()
+        self.object_id = object_id
+        self.response = response
+
+    def status(self, timeout: Optional[float] = None) -> Optional[JobStatus]:
+        """
+        Wait for the jobs and get the terminal status of the latest job.
+
+        :param timeout: The maximum time to wait in seconds
+        :return: The terminal status, or None if no job was found
+        """
+        job = self.result(timeout)
+        return job.status if job is not None else None
+
+
+def _classify(service: AsynchronousClient, error: Exception) -> Failure:
+    """
+    Classify a failed poll with the retry policy of the client, or the default policy if it has none.
+
+    :param service: The client the jobs were polled with
+    :param error: The exception raised by the poll
+    :return: The classification
+    """
+    policy = getattr(getattr(service, 'session', None), 'retry_policy', None)
+    return (policy if isinstance(policy, RetryPolicy) else RetryPolicy()).classify(error)
+
+
+# The client, the job type and the account context of tracked futures
+TrackerKey = Tuple[AsynchronousClient, Optional[str], Any]
+
+
+class JobTracker:
+    """
+    Resolves job futures in the background. All outstanding futures are polled from a single thread, batched per
+    client, job type and account context, so waiting for many operations does not need a thread per operation. The
+    jobs are polled in the context (e.g. the account context) of the caller that submitted the operation.
+    """
+
+    def __init__(self, backoff: Optional[Backoff] = None, chunk_size: int = 50):
+        """
+        Configure the tracker.
+
+        :param backoff: The polling intervals. A deadline applies to each future on its own.
+        :param chunk_size: The maximum number of object ids per jobsFind request
+        """
+        self.backoff = backoff or Backoff()
+        self.chunk_size = chunk_size
+        self._condition = threading.Condition()
+        self._futures: Dict[TrackerKey, Dict[str, List[Tuple[JobFuture, float]]]] = {}
+        self._contexts: Dict[TrackerKey, contextvars.Context] = {}
+        self._thread: Optional[threading.Thread] = None
+        self._added = False
+
+    def track(
+        self,
+        service: AsynchronousClient,
+        object_id: Optional[str],
+        action_name: Optional[str] = None,
+        response: Any = None,
+    ) -> JobFuture:
+        """
+        Track the jobs of an object.
+
+        :param service: The client to query the jobs with
+        :param object_id: The id of the object. If None, the future is resolved right away.
+        :param action_name: Only wait for jobs of this type, e.g. 'domainCreate'
+        :param response: The object returned by the operation
+        :return: The future of the jobs
+        """
+        future = JobFuture(object_id, response)
+
+        if object_id is None:
+            future.set_result(None)
+            return future
+
+        deadline = time.monotonic() + self.backoff.deadline if self.backoff.deadline is not None else float('inf')
+
+        auth = getattr(getattr(service, 'session', None), 'auth', None)
+        key = (service, action_name, auth.current_account_id() if isinstance(auth, HostingDeAuth) else None)
+
+        with self._condition:
+            self._futures.setdefault(key, {}).setdefault(object_id, []).append((future, deadline))
+            self._contexts.setdefault(key, contextvars.copy_context())
+            self._added = True
+
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='hostingde-jobs', daemon=True)
+                self._thread.start()
+
+            self._condition.notify()
+
+        return future
+
+    def pending(self) -> int:
+        """
+        Get the number of unresolved futures.
+
+        :return: The number of futures
+        """
+        with self._condition:
+            return sum(len(futures) for objects in self._futures.values() for futures in objects.values())
+
+    def _resolve(self, key: TrackerKey, object_id: str, callback: Callable):
+        """
+        Remove the futures of an object and resolve them.
+
+        :param key: The client, job type and account context of the futures
+        :param object_id: The object id
+        :param callback: Called with each future, which is still pending
+        """
+        with self._condition:
+            objects = self._futures.get(key, {})
+            futures = objects.pop(object_id, [])
+
+            if not objects:
+                self._futures.pop(key, None)
+                self._contexts.pop(key, None)
+
+        for future, _ in futures:
+            if future.set_running_or_notify_cancel():
+                callback(future)
+
+    def _poll(self) -> None:
+        """
+        Poll the jobs of all tracked objects once.
+        """
+        with self._condition:
+            groups = [(key, list(objects), self._contexts[key]) for key, objects in self._futures.items()]
+
+        for key, ids, context in groups:
+            service, action_name, _ = key
+            waiter = MultiJobWaiter(service, ids, action_name, self.chunk_size)
+
+            try:
+                finished = context.run(waiter.poll)
+            except Exception as error:
+                # Transient failures are retried on the next interval, the deadline of each future still applies
+                if _classify(service, error) is Failure.PERMANENT:
+                    for id in ids:
+                        self._resolve(key, id, lambda future, error=error: future.set_exception(error))
+                continue
+
+            for id, job in finished.items():
+                self._resolve(key, id, lambda future: future.set_result(job))
+
+        self._expire()
+
+    def _expire(self) -> None:
+        """
+        Fail the futures, whose deadline passed.
+        """
+        now = time.monotonic()
+        expired = []
+
+        with self._condition:
+            for objects in self._futures.values():
+                for id, futures in objects.items():
+                    expired.extend((future, id) for future, deadline in futures if deadline <= now)
+                    futures[:] = [(future, deadline) for future, deadline in futures if deadline > now]
+
+            for key in list(self._futures):
+                objects = self._futures[key]
+                for id in [id for id, futures in objects.items() if not futures]:
+                    del objects[id]
+                if not objects:
+                    del self._futures[key]
+                    del self._contexts[key]
+
+        for future, id in expired:
+            if future.set_running_or_notify_cancel():
+                future.set_exception(JobTimeoutException([id]))
+
+    def _run(self) -> None:
+        delays = self.backoff.delays()
 
         while True:
-            jobs = self.service.jobs_find(
-                filter=f
-            ).fetchall()
+            with self._condition:
+                if not self._futures:
+                    self._thread = None
+                    return
+
+                if self._added:
+                    # New operations were submitted, start polling at the initial interval again
+                    delays = self.backoff.delays()
+                    self._added = False
+
+            self._poll()
+
+            with self._condition:
+                if self._futures and not self._added:
+                    self._condition.wait(next(delays))
 
-            if len(jobs) == 0:
-                break
 
-            time.sleep(1)
+job_tracker = JobTracker()
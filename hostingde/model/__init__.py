@@ -1,4 +1,6 @@
-from typing import Any, Optional, Type, TypeVar
+import threading
+import weakref
+from typing import Any, Dict, Optional, Type, TypeVar
 
 import marshmallow_dataclass
 from marshmallow import post_dump, post_load, Schema
@@ -28,7 +30,13 @@ class CamelCaseSchema(Schema):
 
     @post_load
     def post_load(self, data: Any, **kwargs: Any) -> Any:
-        data["context"] = self.context.get('client', None)
+        client = self.context.get('client', None)
+
+        # Cached schemas only hold a weak reference to their client
+        if isinstance(client, weakref.ref):
+            client = client()
+
+        data["context"] = client
         return data
 
     @post_dump
@@ -46,6 +54,81 @@ class CamelCaseSchema(Schema):
         }
 
 
+class SchemaRegistry:
+    """
+    Caches the schemas generated for model classes, so that each schema is only built once.
+
+    Building and instantiating a schema is by far the most expensive part of (de-)serializing a model. Dump schemas
+    are shared by all callers. Load schemas carry the client in their context, so they are cached per client. Clients
+    are only referenced weakly and the cache does not keep them alive.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._dump_schemas: Dict[type, Schema] = {}
+        self._load_schemas: Dict[type, Schema] = {}
+        self._client_load_schemas: 'weakref.WeakKeyDictionary[Any, Dict[type, Schema]]' = weakref.WeakKeyDictionary()
+
+    @staticmethod
+    def _build(cls: type, client: Any = None) -> Schema:
+        return marshmallow_dataclass.class_schema(cls, base_schema=CamelCaseSchema)(context={'client': client})
+
+    def dump_schema(self, cls: type) -> Schema:
+        """
+        Get the schema used to serialize instances of the given class.
+
+        :param cls: The model class
+        :return: The cached schema instance
+        """
+        schema = self._dump_schemas.get(cls)
+        if schema is None:
+            with self._lock:
+                schema = self._dump_schemas.get(cls)
+                if schema is None:
+                    schema = self._dump_schemas[cls] = self._build(cls)
+        return schema
+
+    def load_schema(self, cls: type, client: Any = None) -> Schema:
+        """
+        Get the schema used to deserialize instances of the given class within the context of a client.
+
+        :param cls: The model class
+        :param client: The client that is injected into loaded models
+        :return: The cached schema instance
+        """
+        if client is None:
+            schemas = self._load_schemas
+        else:
+            try:
+                schemas = self._client_load_schemas.get(client)
+            except TypeError:
+                # The client can not be referenced weakly, do not cache its schemas
+                return self._build(cls, client)
+
+            if schemas is None:
+                with self._lock:
+                    schemas = self._client_load_schemas.setdefault(client, {})
+
+        schema = schemas.get(cls)
+        if schema is None:
+            with self._lock:
+                schema = schemas.get(cls)
+                if schema is None:
+                    schema = schemas[cls] = self._build(cls, weakref.ref(client) if client is not None else None)
+        return schema
+
+    def clear(self) -> None:
+        """
+        Drop all cached schemas.
+        """
+        with self._lock:
+            self._dump_schemas.clear()
+            self._load_schemas.clear()
+            self._client_load_schemas.clear()
+
+
+schema_registry = SchemaRegistry()
+
 T = TypeVar('T', bound='Model')
 
 
@@ -57,7 +140,7 @@ class Model:
         return cls
 
     def to_json(self) -> dict:
-        return marshmallow_dataclass.class_schema(self.get_class_instance(), base_schema=CamelCaseSchema)().dump(self)
+        return schema_registry.dump_schema(self.get_class_instance()).dump(self)
 
     def __init__(self, **kwargs: Any):
         """
@@ -75,13 +158,17 @@ class Model:
             self.client = kwargs["context"]
 
     @classmethod
-    def from_json(cls: Type[T], data: dict, client: 'hostingde.HostingDeClient' = None) -> T:
+    def from_json(cls: Type[T], data: dict, client: 'hostingde.HostingDeClient' = None, fast: bool = False) -> T:
         """
         Create a new object from a given JSON.
         :param data: The json data
         :param client: The client to use for this object
+        :param fast: Use the compiled decoder of this class instead of the schema. The resulting object is equal.
         :return: New instance of the class
         """
-        return marshmallow_dataclass.class_schema(cls, base_schema=CamelCaseSchema)(context={'client': client}).load(
-            data
-        )
+        if fast:
+            from hostingde.model.decoder import decoder_registry
+
+            return decoder_registry.decode(cls, data, client)
+
+        return schema_registry.load_schema(cls, client).load(data)
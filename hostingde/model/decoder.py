@@ -0,0 +1,309 @@
+import threading
+import typing
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional, Type, TypeVar
+
+import marshmallow
+from marshmallow import fields
+from marshmallow_enum import EnumField, LoadDumpOptions
+
+from hostingde.model import Model, schema_registry
+
+T = TypeVar('T', bound='Model')
+
+Converter = Callable[[Any, Any], Any]
+
+_NONE_TYPE = type(None)
+
+
+class DecodeFallback(Exception):
+    """
+    Raised by compiled decoders whenever the input can not be handled by the fast path. The caller falls back to the
+    schema based decoder, which produces the exact result (or error) of the regular path.
+    """
+
+    pass
+
+
+def _unwrap_type(typ: Any) -> Any:
+    """
+    Strip Optional[...] and List[...] from a type annotation.
+
+    :param typ: The annotated type
+    :return: The innermost type
+    """
+    while getattr(typ, '__origin__', None) in (typing.Union, list, List):
+        args = [arg for arg in typ.__args__ if arg is not _NONE_TYPE]
+        if len(args) != 1:
+            return None
+        typ = args[0]
+    return typ
+
+
+def _scalar_type(field: fields.Field) -> Optional[type]:
+    """
+    Get the python type of fields, whose values are passed through unchanged by marshmallow.
+
+    :param field: The schema field
+    :return: The type of the value, or None if the field converts its value
+    """
+    if field.validators:
+        return None
+    if type(field) is fields.String:
+        return str
+    if type(field) is fields.Integer and not field.strict:
+        return int
+    if type(field) is fields.Boolean:
+        return bool
+    return None
+
+
+def _enum_table(field: EnumField) -> Dict[Any, Enum]:
+    """
+    Build the lookup table for an enum field, matching the lookup mode of the field.
+
+    :param field: The enum field
+    :return: A mapping from the external representation to the enum member
+    """
+    if field.load_by == LoadDumpOptions.value:
+        return {member.value: member for member in field.enum}
+    return {member.name: member for member in field.enum}
+
+
+class DecoderRegistry:
+    """
+    Compiles and caches specialized decoders for model classes.
+
+    A decoder is generated from the load schema of a model, i.e. from its dataclass fields and their camelCase keys.
+    It skips the marshmallow machinery for well-formed data and falls back to the schema for everything else, so
+    both paths produce equal objects.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._decoders: Dict[type, Optional[Converter]] = {}
+
+    def decoder(self, cls: type) -> Optional[Converter]:
+        """
+        Get the compiled decoder for a class.
+
+        :param cls: The model class
+        :return: The decoder, or None if the class is not supported by the fast path
+        """
+        try:
+            return self._decoders[cls]
+        except KeyError:
+            pass
+
+        with self._lock:
+            if cls not in self._decoders:
+                self._decoders[cls] = self._compile(cls)
+            return self._decoders[cls]
+
+    def decode(self, cls: Type[T], data: Any, client: Any = None) -> T:
+        """
+        Decode a model, using the compiled decoder if possible.
+
+        :param cls: The model class
+        :param data: The json data
+        :param client: The client to use for this object
+        :return: New instance of the class
+        """
+        decoder = self.decoder(cls)
+
+        if decoder is not None:
+            try:
+                return decoder(data, client)
+            except (DecodeFallback, marshmallow.ValidationError):
+                # The schema reports invalid data with the same errors as the regular path
+                pass
+
+        return schema_registry.load_schema(cls, client).load(data)
+
+    def clear(self) -> None:
+        """
+        Drop all compiled decoders.
+        """
+        with self._lock:
+            self._decoders.clear()
+
+    def _nested(self, cls: type) -> Converter:
+        """
+        Lazily resolve the decoder of a nested class, so that the classes can reference each other.
+
+        :param cls: The nested model class
+        :return: A converter that decodes the nested data
+        """
+
+        resolved: List[Converter] = []
+
+        def convert(value: Any, client: Any) -> Any:
+            if not resolved:
+                decoder = self.decoder(cls)
+                if decoder is None:
+                    raise DecodeFallback
+                resolved.append(decoder)
+            return resolved[0](value, client)
+
+        return convert
+
+    def _converter(self, field: fields.Field, typ: Any) -> Optional[Converter]:
+        """
+        Build the converter for a (non-None) value of a field.
+
+        :param field: The schema field
+        :param typ: The type annotation of the dataclass field
+        :return: The converter, or None if the field must be deserialized by the schema field itself
+        :raise DecodeFallback: If the field can not be decoded by the fast path at all
+        """
+        if isinstance(field, (fields.Nested, fields.List)) and field.validators:
+            raise DecodeFallback
+
+        if field.validators:
+            return None
+
+        scalar = _scalar_type(field)
+        if scalar is not None:
+
+            def convert_scalar(value: Any, client: Any) -> Any:
+                if value.__class__ is not scalar:
+                    raise DecodeFallback
+                return value
+
+            return convert_scalar
+
+        if isinstance(field, EnumField):
+            table = _enum_table(field)
+
+            def convert_enum(value: Any, client: Any) -> Any:
+                try:
+                    return table[value]
+                except (KeyError, TypeError):
+                    raise DecodeFallback
+
+            return convert_enum
+
+        if type(field) is fields.Nested:
+            nested = _unwrap_type(typ)
+            if field.many or field.only or field.exclude:
+                raise DecodeFallback
+            if not isinstance(nested, type) or not issubclass(nested, Model):
+                raise DecodeFallback
+            return self._nested(nested)
+
+        if type(field) is fields.List:
+            inner_field = field.inner
+            inner = self._converter(inner_field, _unwrap_type(typ))
+            allow_none = inner_field.allow_none
+
+            if inner is None:
+                raise DecodeFallback
+
+            def convert_list(value: Any, client: Any) -> Any:
+                if value.__class__ is not list:
+                    raise DecodeFallback
+                result = []
+                for item in value:
+                    if item is not None:
+                        result.append(inner(item, client))
+                    elif allow_none:
+                        result.append(None)
+                    else:
+                        raise DecodeFallback
+                return result
+
+            return convert_list
+
+        if isinstance(field, (fields.Nested, fields.List)):
+            raise DecodeFallback
+
+        return None
+
+    def _compile(self, cls: type) -> Optional[Converter]:
+        """
+        Generate the decoder function for a class.
+
+        :param cls: The model class
+        :return: The decoder, or None if the class is not supported by the fast path
+        """
+        try:
+            schema = schema_registry.load_schema(cls)
+            hints = typing.get_type_hints(cls)
+        except Exception:
+            return None
+
+        namespace: Dict[str, Any] = {
+            'cls': cls,
+            'DecodeFallback': DecodeFallback,
+            'MISSING': marshmallow.missing,
+        }
+        lines = [
+            'def decode(data, client):',
+            '    if data.__class__ is not dict:',
+            '        raise DecodeFallback',
+            '    get = data.get',
+            '    kwargs = {}',
+        ]
+
+        for index, (name, field) in enumerate(schema.load_fields.items()):
+            key = field.data_key or name
+            attribute = field.attribute or name
+
+            try:
+                converter = self._converter(field, hints.get(name))
+            except DecodeFallback:
+                return None
+
+            namespace[f'field_{index}'] = field
+            lines.append(f'    value = get({key!r}, MISSING)')
+
+            if converter is None:
+                # Let the field handle missing values, None and validation on its own
+                lines.extend(
+                    [
+                        f'    value = field_{index}.deserialize(value, {key!r}, data)',
+                        '    if value is not MISSING:',
+                        f'        kwargs[{attribute!r}] = value',
+                    ]
+                )
+                continue
+
+            namespace[f'convert_{index}'] = converter
+            namespace[f'missing_{index}'] = field.missing
+
+            scalar = _scalar_type(field)
+            if scalar is not None:
+                # Plain values are checked inline first, as they are the common case
+                namespace[f'type_{index}'] = scalar
+                lines.extend([f'    if value.__class__ is type_{index}:', f'        kwargs[{attribute!r}] = value'])
+                lines.append('    elif value is MISSING:')
+            else:
+                lines.append('    if value is MISSING:')
+
+            if field.required:
+                lines.append('        raise DecodeFallback')
+            elif field.missing is marshmallow.missing:
+                lines.append('        pass')
+            elif callable(field.missing):
+                lines.append(f'        kwargs[{attribute!r}] = missing_{index}()')
+            else:
+                lines.append(f'        kwargs[{attribute!r}] = missing_{index}')
+
+            lines.append('    elif value is None:')
+            if field.allow_none:
+                lines.append(f'        kwargs[{attribute!r}] = None')
+            else:
+                lines.append('        raise DecodeFallback')
+
+            if scalar is not None:
+                lines.extend(['    else:', '        raise DecodeFallback'])
+            else:
+                lines.extend(['    else:', f'        kwargs[{attribute!r}] = convert_{index}(value, client)'])
+
+        lines.extend(["    kwargs['context'] = client", '    return cls(**kwargs)'])
+
+        exec(compile('\n'.join(lines), f'<decoder {cls.__qualname__}>', 'exec'), namespace)
+        return namespace['decode']
+
+
+decoder_registry = DecoderRegistry()
@@ -0,0 +1,123 @@
+from typing import Any, Generic, Optional, Type, TypeVar, Union
+
+import marshmallow
+
+from hostingde.model import Model, schema_registry
+
+T = TypeVar('T', bound=Model)
+
+
+class LazyModel(Generic[T]):
+    """
+    A lightweight proxy over the raw JSON data of a model. Fields are decoded when they are first accessed, everything
+    else (methods, assignments, serialization) works on the fully decoded model.
+
+    The proxy pretends to be an instance of the model class, so isinstance checks and comparisons behave as usual.
+    """
+
+    __slots__ = ('_cls', '_data', '_client', '_values', '_model')
+
+    def __init__(self, cls: Type[T], data: dict, client: Any = None):
+        """
+        Wrap the raw data of a model.
+
+        :param cls: The model class the data belongs to
+        :param data: The raw json data
+        :param client: The client to use for the decoded objects
+        """
+        object.__setattr__(self, '_cls', cls)
+        object.__setattr__(self, '_data', data)
+        object.__setattr__(self, '_client', client)
+        object.__setattr__(self, '_values', {})
+        object.__setattr__(self, '_model', None)
+
+    @property  # type: ignore
+    def __class__(self) -> Type[T]:  # type: ignore
+        return self._cls
+
+    def hydrate(self) -> T:
+        """
+        Fully decode the model. The decoded model is cached, so this is only done once. Fields that were already
+        decoded keep their values, so changes made to them (e.g. appending to a list) are not lost.
+
+        :return: The decoded model
+        """
+        model = self._model
+
+        if model is None:
+            instance = getattr(self._client, '_instance', None)
+            model = instance(self._cls, self._data) if instance else self._cls.from_json(self._data, self._client)
+            for name, value in self._values.items():
+                setattr(model, name, value)
+            object.__setattr__(self, '_model', model)
+
+        return model
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called if the attribute was not found on the proxy itself
+        if name in LazyModel.__slots__:
+            raise AttributeError(name)
+
+        if self._model is not None:
+            return getattr(self._model, name)
+
+        values = self._values
+        if name in values:
+            return values[name]
+
+        field = schema_registry.load_schema(self._cls, self._client).load_fields.get(name)
+
+        if field is None or field.attribute not in (None, name):
+            return getattr(self.hydrate(), name)
+
+        key = field.data_key or name
+        value = self._data.get(key, marshmallow.missing)
+
+        if value is marshmallow.missing:
+            # Missing values are filled in by the constructor of the model
+            return getattr(self.hydrate(), name)
+
+        values[name] = value = field.deserialize(value, key, self._data)
+        return value
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self.hydrate(), name, value)
+
+    def __delattr__(self, name: str) -> None:
+        delattr(self.hydrate(), name)
+
+    def __eq__(self, other: Any) -> bool:
+        return self.hydrate() == hydrate(other)
+
+    def __hash__(self) -> int:
+        return hash(self.hydrate())
+
+    def __str__(self) -> str:
+        return str(self.hydrate())
+
+    def __repr__(self) -> str:
+        return f'<LazyModel of {self._cls.__name__}>' if self._model is None else repr(self._model)
+
+
+def hydrate(value: Union[T, LazyModel[T], None]) -> Optional[T]:
+    """
+    Replace a lazy proxy by its fully decoded model. Any other value is returned as is.
+
+    :param value: A model or a lazy proxy of a model
+    :return: The model
+    """
+    if type(value) is LazyModel:
+        return value.hydrate()  # type: ignore
+    return value  # type: ignore
+
+
+def hydrate_all(values: Optional[Any]) -> Any:
+    """
+    Replace all lazy proxies in a list by their fully decoded models.
+
+    :param values: A list of models and lazy proxies, or None
+    :return: The list of models
+    """
+    if values is None:
+        return None
+    return [hydrate(value) for value in values]
@@ -1,11 +1,22 @@
+import contextvars
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Generic, List, Optional, Type, TypeVar
+from typing import Any, Deque, Generic, Iterable, List, Optional, Tuple, Type, TypeVar
 
 from hostingde.exceptions import ClientException
 from hostingde.hostingde import HostingDeCore
 from hostingde.model import Model
-from hostingde.model.filter import FilterElement
-from hostingde.model.sort import SortConfiguration
+from hostingde.model.filter import (
+    FilterChain,
+    FilterChainConnective,
+    FilterCondition,
+    FilterElement,
+)
+from hostingde.model.lazy import LazyModel
+from hostingde.model.sort import SortConfiguration, SortOrder
+from hostingde.response import ApiResponse
 
 R = TypeVar('R', bound="Model")
 
@@ -22,7 +33,230 @@ class PaginatedRequest(Model):
     sort: Optional[SortConfiguration] = field(default=None)
 
 
-class HostingDePaginator(HostingDeCore, Generic[R]):
+class PaginatorBase(Generic[R]):
+    """
+    The state and the request building shared by HostingDePaginator and its asyncio counterpart, which only differ in
+    how the requests are sent.
+    """
+
+    def _setup(
+        self,
+        instance_class: Type[R],
+        url: str,
+        count: Optional[int],
+        limit: Optional[int],
+        filter: Optional[FilterElement],
+        sort: Optional[SortConfiguration],
+        page: Optional[int],
+        raw: bool,
+        fields: Optional[List[str]],
+        lazy: bool,
+        prefetch: int,
+    ) -> None:
+        """
+        Initialize the state of the paginator, see the constructors for the parameters.
+        """
+        self.current_page = 1
+        self.total_pages = -1
+        self.results: Deque[dict] = deque()
+        self.limit = limit if limit is not None and limit > 0 else 25
+        self.count = -1 if count is None or count <= 0 else count
+        self.filter = filter
+        self.sort = sort
+        self.url = url
+        self.instance_class = instance_class
+        self._total_entries = -1
+        self.raw = raw
+        self.fields = tuple(fields) if fields is not None else None
+        self.lazy = lazy
+        self.prefetch = max(prefetch or 0, 0)
+
+        if page:
+            self.current_page = page
+            self.count = self.limit
+
+    def _query(
+        self,
+        page: int,
+        limit: int,
+        filter: Optional[FilterElement] = None,
+        sort: Optional[SortConfiguration] = None,
+    ) -> PaginatedRequest:
+        """
+        Build the request of a single page.
+
+        :param page: The page number
+        :param limit: The page size
+        :param filter: The filter element, defaults to the filter of this paginator
+        :param sort: The sorting, defaults to the sorting of this paginator
+        :return: The request model
+        """
+        filter = filter if filter is not None else self.filter
+
+        return PaginatedRequest(
+            filter=filter.to_filter_object() if filter is not None else None,
+            limit=limit,
+            page=page,
+            sort=sort if sort is not None else self.sort,
+        )
+
+    def _combine(self, filter: Optional[FilterElement]) -> Optional[FilterElement]:
+        """
+        Combine an additional filter with the filter of this paginator.
+
+        :param filter: The additional filter
+        :return: The filter matching both
+        """
+        if filter is None or self.filter is None:
+            return filter if filter is not None else self.filter
+
+        # Build a new chain, combining filters with & modifies existing chains
+        return FilterChain(FilterChainConnective.AND).add_filter(self.filter).add_filter(filter)
+
+    def _remember_total(self, data: dict) -> None:
+        """
+        Keep the total number of entries of a page response, if it is not known yet.
+
+        :param data: The response object of a page of the unchanged query
+        """
+        if self._total_entries == -1:
+            self._total_entries = data.get('totalEntries', -1)
+
+    @staticmethod
+    def _read_total(data: dict) -> int:
+        """
+        Read the total number of entries from the response of a page of size one.
+
+        :param data: The response object of the page
+        :return: The number of entries
+        """
+        total = data.get('totalEntries', -1)
+
+        if total < 0:
+            # A page size of one turns the page count into the entry count
+            total = data.get('totalPages', len(data.get('data', [])))
+
+        return max(total, 0)
+
+    def _convert(self, row: dict) -> Any:
+        """
+        Convert a raw row of a page into the item yielded by this paginator.
+
+        :param row: The raw row of the response
+        :return: The converted item
+        """
+        if self.fields is not None:
+            return tuple(row.get(field) for field in self.fields)
+
+        if self.raw:
+            return row
+
+        if self.lazy:
+            return LazyModel(self.instance_class, row, self)
+
+        return self._instance(self.instance_class, row)  # type: ignore
+
+
+class AdaptivePageSize:
+    """
+    Picks the page size of a paginator from the time it took to load the previous page. Slow pages shrink the next
+    page, fast pages grow it, always within the configured bounds. The size of the previous response bounds the next
+    page as well, so pages of large rows do not exceed max_bytes.
+    """
+
+    def __init__(
+        self,
+        target: float = 1.0,
+        min_limit: int = 25,
+        max_limit: int = 1000,
+        seed: Optional[int] = None,
+        max_factor: float = 2.0,
+        tolerance: float = 0.2,
+        max_bytes: Optional[int] = 4 * 1024 * 1024,
+    ):
+        """
+        Configure the adaptive page size.
+
+        :param target: The desired duration of a single page request in seconds
+        :param min_limit: The smallest page size to use
+        :param max_limit: The largest page size to use
+        :param seed: The page size of the first request. Defaults to the limit of the paginator.
+        :param max_factor: The maximum factor by which the page size changes between two pages
+        :param tolerance: Relative deviation from the target, which does not change the page size
+        :param max_bytes: The desired maximum size of a response body. None does not bound the size.
+        """
+        if target <= 0:
+            raise ClientException('The target page time must be positive.')
+
+        if min_limit < 1 or max_limit < min_limit:
+            raise ClientException('The page size bounds must satisfy 1 <= min_limit <= max_limit.')
+
+        self.target = target
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.seed = seed
+        self.max_factor = max(max_factor, 1.0)
+        self.tolerance = max(tolerance, 0.0)
+        self.max_bytes = max_bytes
+
+    def clamp(self, limit: int) -> int:
+        """
+        Restrict a page size to the configured bounds.
+
+        :param limit: The page size
+        :return: The page size within the bounds
+        """
+        return min(max(limit, self.min_limit), self.max_limit)
+
+    def next_limit(self, limit: int, rows: int, elapsed: float, size: int) -> int:
+        """
+        Calculate the page size of the next request.
+
+        :param limit: The page size of the last request
+        :param rows: The number of rows returned by the last request
+        :param elapsed: The duration of the last request in seconds
+        :param size: The size of the last response body in bytes
+        :return: The page size for the next request
+        """
+        new_limit = limit
+
+        # A partial page does not tell anything about the cost of a full page
+        if rows >= limit:
+            factor = self.max_factor if elapsed <= 0 else self.target / elapsed
+            factor = min(max(factor, 1 / self.max_factor), self.max_factor)
+
+            if abs(factor - 1) > self.tolerance:
+                new_limit = int(limit * factor)
+
+        # Estimate the body of the next page from the average size of a row
+        if self.max_bytes is not None and rows > 0 and size > 0:
+            new_limit = min(new_limit, self.max_bytes * rows // size)
+
+        return self.clamp(new_limit)
+
+
+def _aligned_limit(offset: int, limit: int, new_limit: int) -> int:
+    """
+    Pick the largest page size between the current and the new one that the offset is a multiple of, so the next page
+    does not overlap with the rows already loaded.
+
+    :param offset: The number of rows loaded so far
+    :param limit: The current page size
+    :param new_limit: The page size to grow to
+    :return: The page size of the next request, or the current one if no larger size is aligned
+    """
+    if offset == 0:
+        return new_limit
+
+    # The candidates are offset / pages, the fewest pages give the largest size
+    for pages in range(-(-offset // new_limit), offset // (limit + 1) + 1):
+        if offset % pages == 0:
+            return offset // pages
+
+    return limit
+
+
+class HostingDePaginator(HostingDeCore, PaginatorBase[R]):
     def __init__(
         self,
         parent: HostingDeCore,
@@ -32,7 +266,11 @@ class HostingDePaginator(HostingDeCore, Generic[R]):
         limit: Optional[int] = 25,
         filter: Optional[FilterElement] = None,
         sort: Optional[SortConfiguration] = None,
-        page: Optional[int] = None
+        page: Optional[int] = None,
+        raw: bool = False,
+        fields: Optional[List[str]] = None,
+        lazy: bool = False,
+        prefetch: int = 0,
     ):
         """
         Construct a new paginator.
@@ -45,24 +283,27 @@ class HostingDePaginator(HostingDeCore, Generic[R]):
         :param filter: Filter the results based on a filter expression
         :param sort: Sort the results by a given field
         :param page: Which page to query. Requires limit to be set, which defaults to 25.
+        :param raw: Yield the raw response dicts instead of instances of instance_class
+        :param fields: Yield tuples of the given response fields instead of instances of instance_class. Fields missing
+                       in a response are None.
+        :param lazy: Yield proxies of instance_class, which only decode a field once it is accessed. Pass them into
+                     update methods as is, they are fully decoded on demand.
+        :param prefetch: The number of pages to fetch ahead on a background thread, while the current page is
+                         consumed. Disabled by default.
         """
         super().__init__(parent)
 
-        self.current_page = 1
-        self.total_pages = -1
-        self.results: List[R] = []
-        self.limit = limit if limit is not None and limit > 0 else 25
-        self.count = -1 if count is None or count <= 0 else count
-        self.filter = filter
-        self.sort = sort
-        self.url = url
-        self.count = count or -1
-        self.instance_class = instance_class
-        self._total_entries = -1
-
-        if page:
-            self.current_page = page
-            self.count = self.limit
+        self._setup(instance_class, url, count, limit, filter, sort, page, raw, fields, lazy, prefetch)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._workers = 1
+        self._pending: Deque[Future] = deque()
+        self._adaptive: Optional[AdaptivePageSize] = None
+        self._offset = 0
+        self._held_back = False
+        self.page_stats: List[Tuple[int, int, float, int]] = []
+        self._keyset: Optional[Tuple[str, Tuple[str, ...], SortOrder, bool]] = None
+        self._watermark: Any = None
+        self._ties: List[dict] = []
 
     def __iter__(self):
         """
@@ -72,19 +313,179 @@ class HostingDePaginator(HostingDeCore, Generic[R]):
         """
         return self
 
-    def _load_next(self) -> None:
-        # No more results cached, and more available, load new results
-        response = self._request(
+    def _request_page(self, page: int, limit: int) -> ApiResponse:
+        """
+        Request a single page of the given size from the API.
+
+        :param page: The page number
+        :param limit: The page size
+        :return: The response of the API
+        """
+        return self._request(
             self.url,
             model=PaginatedRequest(
-                filter=self.filter.to_filter_object() if self.filter is not None else None,
-                limit=self.limit,
-                page=self.current_page,
+                filter=self._page_filter(),
+                limit=limit,
+                page=page,
                 sort=self.sort,
             ),
         )
 
-        data = response.json().get('response', {})
+    def _page_filter(self) -> Optional[dict]:
+        """
+        Build the filter object of a page request. In keyset mode, the filter of the user is combined with the
+        watermark of the last page.
+
+        :return: The filter object, or None if the results are not filtered
+        """
+        if self._keyset is None or self._watermark is None:
+            return self.filter.to_filter_object() if self.filter is not None else None
+
+        key, _, order, unique = self._keyset
+        condition = FilterCondition(key)
+
+        if order == SortOrder.ASC:
+            watermark = condition.gt(self._watermark) if unique else condition.ge(self._watermark)
+        else:
+            watermark = condition.lt(self._watermark) if unique else condition.le(self._watermark)
+
+        if self.filter is None:
+            return watermark.to_filter_object()
+
+        # Build a new chain, combining filters with & modifies existing chains
+        return FilterChain(FilterChainConnective.AND).add_filter(self.filter).add_filter(watermark).to_filter_object()
+
+    def _key_of(self, row: dict) -> Any:
+        """
+        Get the keyset value of a row.
+
+        :param row: The raw row of the response
+        :return: The value of the key
+        :raise ClientException: If the row does not contain the key
+        """
+        value: Any = row
+        for part in self._keyset[1]:  # type: ignore
+            value = value.get(part) if isinstance(value, dict) else None
+
+        if value is None:
+            raise ClientException(f'The response does not contain the keyset attribute "{".".join(self._keyset[1])}".')
+
+        return value
+
+    def _load_keyset(self, key: str, unique: bool) -> None:
+        """
+        Load the rows following the watermark. Every request asks for the first page, the watermark moves the page
+        forward. Rows sharing the watermark value with rows that were already returned are dropped.
+        """
+        limit = self.limit
+
+        started = time.perf_counter()
+        response = self._request_page(1, limit)
+        elapsed = time.perf_counter() - started
+
+        data = response.response
+        received = data.get('data', [])
+        content = getattr(response.http_response, 'content', None) or b''
+        self.page_stats.append((limit, len(received), elapsed, len(content)))
+
+        if self._total_entries == -1:
+            self._total_entries = data.get('totalEntries', -1)
+
+        rows = received
+        if not unique and self._ties:
+            rows = [row for row in received if self._key_of(row) != self._watermark or row not in self._ties]
+
+        if len(rows) > 0:
+            last = self._key_of(rows[-1])
+            if unique or last != self._watermark:
+                self._ties = []
+            self._watermark = last
+            if not unique:
+                self._ties.extend(row for row in rows if self._key_of(row) == last)
+            self.results.extend(rows)
+        elif len(received) >= limit:
+            raise ClientException(
+                f'More than {limit} entries share the value {self._watermark!r} of the keyset "{key}", '
+                'increase the limit.'
+            )
+
+        if self._adaptive is not None:
+            self.limit = self._adaptive.next_limit(limit, len(received), elapsed, len(content))
+
+        # The page number stays the same, a full page indicates that there are more results
+        self.current_page = 1
+        self.total_pages = 1 if len(received) >= limit else 0
+
+    def _fetch_page(self, page: int) -> dict:
+        """
+        Request a single page from the API.
+
+        :param page: The page number
+        :return: The response object of the page
+        """
+        return self._request_page(page, self.limit).response
+
+    def _load_adaptive(self, adaptive: AdaptivePageSize) -> None:
+        """
+        Load the rows following the current offset, and pick the page size of the next request.
+
+        The API only knows page numbers, so the page containing the offset is requested with the current page size.
+        Rows of that page before the offset were already yielded and are skipped.
+        """
+        limit = self.limit
+        page = self._offset // limit + 1
+        skip = self._offset - (page - 1) * limit
+
+        started = time.perf_counter()
+        response = self._request_page(page, limit)
+        elapsed = time.perf_counter() - started
+
+        data = response.response
+        received = data.get('data', [])
+        rows = received[skip:]
+        content = getattr(response.http_response, 'content', None) or b''
+        self.page_stats.append((limit, len(received), elapsed, len(content)))
+
+        if self._total_entries == -1:
+            self._total_entries = data.get('totalEntries', -1)
+
+        self._offset += len(rows)
+        if len(rows) > 0:
+            self.results.extend(rows)
+
+        # Prefer a page size the offset is a multiple of, so the next page does not overlap with this one. If no larger
+        # size was aligned twice in a row, grow anyway and skip the overlap, so the page size can not get stuck.
+        wanted = adaptive.next_limit(limit, len(received), elapsed, len(content))
+        self.limit = wanted
+        if wanted > limit:
+            aligned = _aligned_limit(self._offset, limit, wanted)
+            if aligned > limit or not self._held_back:
+                self.limit = aligned
+        self._held_back = self.limit == limit < wanted
+
+        self.current_page = self._offset // self.limit + 1
+
+        if self._total_entries >= 0:
+            more = self._offset < self._total_entries
+        else:
+            more = len(received) >= limit and len(rows) > 0
+
+        self.total_pages = self.current_page if more else self.current_page - 1
+
+    def _load_next(self) -> None:
+        # No more results cached, and more available, load new results
+        if self._keyset is not None:
+            self._load_keyset(self._keyset[0], self._keyset[3])
+            return
+
+        if self._adaptive is not None:
+            self._load_adaptive(self._adaptive)
+            return
+
+        if self.prefetch > 0:
+            data = self._prefetched_page()
+        else:
+            data = self._fetch_page(self.current_page)
 
         # if this was the first call, retrieve the amount of total pages
         if self.total_pages == -1:
@@ -93,9 +494,76 @@ class HostingDePaginator(HostingDeCore, Generic[R]):
 
         self.current_page += 1
 
-        # Extract and convert the results
-        if len(data.get('data', [])) > 0:
-            self.results.extend(map(lambda x: self._instance(self.instance_class, x), data.get('data', [])))
+        # Buffer the raw rows, they are converted once they are consumed
+        rows = data.get('data', [])
+        if len(rows) > 0:
+            self.results.extend(rows)
+
+        if self.prefetch > 0:
+            self._schedule_prefetch()
+
+    def _prefetched_page(self) -> dict:
+        """
+        Wait for the prefetched current page. If it was not prefetched yet, it is requested right away.
+
+        :return: The response object of the current page
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self._workers, thread_name_prefix='hostingde-prefetch')
+
+        if not self._pending:
+            self._pending.append(self._submit_page(self.current_page))
+
+        return self._pending.popleft().result()
+
+    def _submit_page(self, page: int) -> Future:
+        """
+        Request a page on the background thread. The request is sent in the context of the caller, so it uses the same
+        account context.
+
+        :param page: The page number
+        :return: The future of the response object
+        """
+        return self._executor.submit(contextvars.copy_context().run, self._fetch_page, page)  # type: ignore
+
+    def _schedule_prefetch(self) -> None:
+        """
+        Queue requests for the pages following the current page, up to the prefetch depth. Pages are only requested
+        if they exist and are needed to satisfy the count.
+        """
+        while len(self._pending) < self.prefetch and self._executor is not None:
+            page = self.current_page + len(self._pending)
+
+            if self.total_pages == -1 or page > self.total_pages:
+                break
+
+            if self.count != -1 and self.count <= len(self.results) + len(self._pending) * self.limit:
+                break
+
+            self._pending.append(self._submit_page(page))
+
+    def close(self) -> None:
+        """
+        Cancel outstanding prefetch requests and stop the background thread. The paginator stays usable, it is
+        restarted if more pages are requested.
+        """
+        while self._pending:
+            self._pending.popleft().cancel()
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def __enter__(self) -> 'HostingDePaginator[R]':
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        # The iterator was abandoned, release the background thread
+        if getattr(self, '_pending', None) is not None:
+            self.close()
 
     def __next__(self):
         """
@@ -105,15 +573,17 @@ class HostingDePaginator(HostingDeCore, Generic[R]):
         """
         # Still requested more?
         if self.count == 0:
+            self.close()
             raise StopIteration
 
         # If data is still available
         if len(self.results) > 0:
             self.count -= 1
-            return self.results.pop(0)
+            return self._convert(self.results.popleft())
 
         # Are there more pages to be retrieved?
         if self.total_pages < self.current_page and self.total_pages != -1:
+            self.close()
             raise StopIteration
 
         self._load_next()
@@ -121,16 +591,103 @@ class HostingDePaginator(HostingDeCore, Generic[R]):
         # Extract and convert the results
         if len(self.results) > 0:
             self.count -= 1
-            return self.results.pop(0)
+            return self._convert(self.results.popleft())
 
+        self.close()
         raise StopIteration
 
-    def fetchall(self) -> List[R]:
+    def parallel(self, workers: int) -> 'HostingDePaginator[R]':
+        """
+        Fetch the remaining pages concurrently. Once the first page revealed the total amount of pages, up to workers
+        pages are requested at the same time. The results are still yielded in page order.
+
+        :param workers: The maximum number of concurrent requests
+        :return: This paginator
+        """
+        if self._adaptive is not None or self._keyset is not None:
+            raise ClientException('Adaptive page sizes and keysets can not be combined with concurrent requests.')
+
+        self.close()
+        self._workers = max(workers, 1)
+        self.prefetch = max(self.prefetch, self._workers)
+        return self
+
+    def adaptive(self, adaptive: Optional[AdaptivePageSize] = None, **kwargs: Any) -> 'HostingDePaginator[R]':
+        """
+        Adapt the page size to the response times of the API. Starting from the seed size, every page is sized to
+        take about the target time to load. Prefetching is disabled, since the size of a page depends on the previous
+        one.
+
+        :param adaptive: The page size configuration. If not provided, one is created from the keyword arguments.
+        :param kwargs: The arguments for AdaptivePageSize
+        :return: This paginator
+        """
+        self.close()
+
+        if adaptive is None:
+            adaptive = AdaptivePageSize(**kwargs)
+
+        if self.total_pages == -1 and self.current_page == 1:
+            self._offset = 0
+        else:
+            self._offset = (self.current_page - 1) * self.limit
+
+        self._adaptive = adaptive
+        self.prefetch = 0
+        self._workers = 1
+        self.limit = adaptive.clamp(adaptive.seed or self.limit)
+        self.current_page = self._offset // self.limit + 1
+        return self
+
+    def keyset(
+        self,
+        key: str,
+        attribute: Optional[str] = None,
+        order: SortOrder = SortOrder.ASC,
+        unique: bool = True,
+    ) -> 'HostingDePaginator[R]':
+        """
+        Paginate by a watermark on a sorted key instead of page numbers. The results are sorted by the key and each
+        request filters for the entries following the last returned key. The cost of a request does not depend on
+        how far the scan is, and entries changing during the scan are neither skipped nor returned twice.
+
+        Must be set up before iterating, since it replaces the sort order of the paginator.
+
+        :param key: The API field to sort and filter on, e.g. 'RecordId' or 'ZoneLastChangeDate'
+        :param attribute: The path of the key in the response entries, separated by dots, e.g. 'id' or
+                          'zoneConfig.lastChangeDate'. Defaults to the key without the name of the model class.
+        :param order: The sort order of the key
+        :param unique: Whether the key is unique. Entries sharing a non-unique key are deduplicated, but a single key
+                       value must not be shared by more than limit entries.
+        :return: This paginator
+        """
+        if self.total_pages != -1:
+            raise ClientException('Keyset pagination must be set up before iterating.')
+
+        if attribute is None:
+            prefix = self.instance_class.__name__
+            attribute = key[len(prefix) :] if key.startswith(prefix) and len(key) > len(prefix) else key
+            attribute = attribute[0].lower() + attribute[1:]
+
+        self.close()
+        self.prefetch = 0
+        self._workers = 1
+        self._keyset = (key, tuple(attribute.split('.')), order, unique)
+        self._watermark = None
+        self._ties = []
+        self.sort = SortConfiguration(key, order)
+        return self
+
+    def fetchall(self, parallel: int = 1) -> List[R]:
         """
         Do not cache results, load all into memory.
 
+        :param parallel: The maximum number of pages that are requested concurrently
         :return: The list of objects that this paginator generates
         """
+        if parallel > 1:
+            self.parallel(parallel)
+
         return list(self)
 
     def fetchone(self) -> Optional[R]:
@@ -144,14 +701,79 @@ class HostingDePaginator(HostingDeCore, Generic[R]):
         except StopIteration:
             return None
 
+    def first(self, n: int = 1, sort: Optional[SortConfiguration] = None) -> List[Any]:
+        """
+        Get the first entries with a single request, which asks for exactly n entries. The iteration of this
+        paginator is not affected.
+
+        :param n: The number of entries
+        :param sort: Sort the results by a given field, instead of the sorting of this paginator
+        :return: Up to n entries
+        """
+        if n <= 0:
+            return []
+
+        data = self._request(self.url, model=self._query(1, n, sort=sort)).response
+        self._remember_total(data)
+
+        return [self._convert(row) for row in data.get('data', [])[:n]]
+
+    def exists(self, filter: Optional[FilterElement] = None) -> bool:
+        """
+        Check whether any entry matches, with a single request for one entry which is not decoded.
+
+        :param filter: An additional filter, combined with the filter of this paginator
+        :return: Whether a matching entry exists
+        """
+        data = self._request(self.url, model=self._query(1, 1, self._combine(filter))).response
+
+        if filter is None:
+            self._remember_total(data)
+
+        return len(data.get('data', [])) > 0
+
+    def count_total(self, refresh: bool = False) -> int:
+        """
+        Get the total number of entries matching the filter. Only a single entry is requested and it is not decoded.
+        The total is cached, also when it was retrieved while iterating.
+
+        :param refresh: Request the total again, even if it is cached
+        :return: The number of entries
+        """
+        if self._total_entries == -1 or refresh:
+            self._total_entries = self._read_total(self._request(self.url, model=self._query(1, 1)).response)
+
+        return self._total_entries
+
     def __len__(self):
         """
-        Length of items available
+        Length of items available. list() asks for the length before iterating, so the first page is loaded to be
+        used by the iteration right after. Use count_total() if only the number of entries is needed.
+
         :return: Number of entities
         """
 
         # If not yet loaded, prefetch data
-        if self._total_entries == -1:
+        if self._total_entries == -1 and self.total_pages == -1:
             self._load_next()
 
         return self._total_entries if self._total_entries >= 0 else 0
+
+
+def count_all(paginators: Iterable[HostingDePaginator], workers: int = 8) -> List[int]:
+    """
+    Count the entries of several paginators concurrently, e.g. the records of many zones.
+
+    :param paginators: The paginators to count
+    :param workers: The maximum number of concurrent requests
+    :return: The counts, in the order of the paginators
+    """
+    paginators = list(paginators)
+
+    if workers <= 1 or len(paginators) <= 1:
+        return [paginator.count_total() for paginator in paginators]
+
+    with ThreadPoolExecutor(max_workers=min(workers, len(paginators)), thread_name_prefix='hostingde-count') as pool:
+        # Count in the context of the caller, so the account context applies
+        futures = [pool.submit(contextvars.copy_context().run, paginator.count_total) for paginator in paginators]
+        return [future.result() for future in futures]
@@ -0,0 +1,124 @@
+import threading
+import time
+from typing import Dict, Mapping, Optional, Tuple
+
+from hostingde.retry import method_of
+
+BucketKey = Tuple[Optional[str], Optional[str]]
+
+
+class TokenBucket:
+    """
+    A token bucket, refilled at a constant rate up to its burst size. Each request takes a token.
+
+    Tokens are reserved instead of waited for: a request which finds the bucket empty takes a token of the future and
+    is told how long to wait for it. Threads can sleep and asyncio tasks can await the delay, so one bucket paces both.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        """
+        Create a full bucket.
+
+        :param rate: The number of tokens added per second
+        :param burst: The maximum number of tokens, i.e. the number of requests that may be sent at once
+        """
+        if rate <= 0:
+            raise ValueError('The rate must be positive.')
+
+        self.rate = rate
+        self.burst = max(burst, 1)
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Take a token.
+
+        :return: The time in seconds to wait before the token may be used
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+
+class RateLimiter:
+    """
+    Paces the requests of all clients sharing a session, so they stay below the limits of the API instead of being
+    throttled by it.
+
+    By default all requests share one bucket. Buckets can be kept per account and per endpoint instead, and single
+    endpoints can get their own rate and burst.
+    """
+
+    def __init__(
+        self,
+        rate: float = 10.0,
+        burst: int = 10,
+        per_account: bool = False,
+        per_endpoint: bool = False,
+        endpoints: Optional[Mapping[str, Tuple[float, int]]] = None,
+    ):
+        """
+        Configure the limits.
+
+        :param rate: The number of requests per second of a bucket
+        :param burst: The number of requests of a bucket that may be sent at once
+        :param per_account: Keep a bucket for each account context
+        :param per_endpoint: Keep a bucket for each API method, e.g. 'zonesFind'
+        :param endpoints: The rate and burst of single API methods, e.g. {'zoneCreate': (1, 2)}. These methods always
+                          get their own bucket.
+        """
+        self.rate = rate
+        self.burst = burst
+        self.per_account = per_account
+        self.per_endpoint = per_endpoint
+        self.endpoints: Dict[str, Tuple[float, int]] = dict(endpoints or {})
+        self.buckets: Dict[BucketKey, TokenBucket] = {}
+        self.delayed = 0
+        self.waited = 0.0
+        self._lock = threading.Lock()
+
+    def bucket(self, url: str, account_id: Optional[str] = None) -> TokenBucket:
+        """
+        Get the bucket a request takes its token from.
+
+        :param url: The URL of the request
+        :param account_id: The account context of the request
+        :return: The bucket
+        """
+        method = method_of(url)
+        key = (
+            account_id if self.per_account else None,
+            method if self.per_endpoint or method in self.endpoints else None,
+        )
+
+        with self._lock:
+            bucket = self.buckets.get(key)
+
+            if bucket is None:
+                rate, burst = self.endpoints.get(method, (self.rate, self.burst))
+                bucket = self.buckets[key] = TokenBucket(rate, burst)
+
+            return bucket
+
+    def reserve(self, url: str, account_id: Optional[str] = None) -> float:
+        """
+        Take a token for a request.
+
+        :param url: The URL of the request
+        :param account_id: The account context of the request
+        :return: The time in seconds to wait before sending the request
+        """
+        delay = self.bucket(url, account_id).reserve()
+
+        if delay > 0:
+            with self._lock:
+                self.delayed += 1
+                self.waited += delay
+
+        return delay
@@ -0,0 +1,70 @@
+from typing import Any, List
+
+from requests import Response
+
+
+class ApiResponse:
+    """
+    The parsed envelope of a response from the hosting.de API. The body is only decoded once, all consumers share the
+    parsed data.
+    """
+
+    def __init__(self, data: dict, http_response: Response):
+        """
+        Wrap a parsed response body.
+
+        :param data: The decoded JSON body
+        :param http_response: The original HTTP response, e.g. to inspect headers
+        """
+        self.data = data
+        self.http_response = http_response
+
+    @property
+    def status(self) -> str:
+        """
+        The status of the request, e.g. 'success', 'pending' or 'error'.
+        """
+        return self.data.get('status', 'error')
+
+    @property
+    def response(self) -> Any:
+        """
+        The response object of the request. Empty if the endpoint does not return a single object.
+        """
+        return self.data.get('response', {})
+
+    @property
+    def responses(self) -> List[Any]:
+        """
+        The list of response objects, for endpoints that return multiple objects.
+        """
+        return self.data.get('responses', [])
+
+    @property
+    def errors(self) -> List[dict]:
+        """
+        The errors that occurred while processing the request.
+        """
+        return self.data.get('errors', [])
+
+    @property
+    def warnings(self) -> List[dict]:
+        """
+        The warnings that occurred while processing the request.
+        """
+        return self.data.get('warnings', [])
+
+    @property
+    def headers(self) -> Any:
+        """
+        The headers of the HTTP response.
+        """
+        return self.http_response.headers
+
+    def json(self) -> dict:
+        """
+        The decoded body. Provided for compatibility with requests.Response, the body is not parsed again.
+
+        :return: The decoded JSON body
+        """
+        return self.data
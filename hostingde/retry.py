@@ -0,0 +1,249 @@
+import random
+import time
+from enum import Enum
+from typing import Any, Iterable, Iterator, Optional, Set
+
+from requests import exceptions as requests_exceptions
+from urllib3.exceptions import ConnectTimeoutError
+
+from hostingde.exceptions import ApiException, TransportException
+
+# Methods that only read data, apart from the *Find methods and the dry runs (*Check)
+READ_METHODS = frozenset({'nameserverSetGetDefault', 'getOwnAccount', 'priceListDomains', 'domainStatus'})
+
+
+class Backoff:
+    """
+    Polling intervals growing exponentially up to a cap, with random jitter and an optional overall deadline.
+    """
+
+    def __init__(
+        self,
+        initial: float = 0.2,
+        multiplier: float = 1.5,
+        cap: float = 10.0,
+        jitter: float = 0.1,
+        deadline: Optional[float] = None,
+    ):
+        """
+        Configure the polling intervals.
+
+        :param initial: The first interval in seconds
+        :param multiplier: The factor applied to the interval after each poll
+        :param cap: The maximum interval in seconds
+        :param jitter: The relative amount of randomness of each interval, e.g. 0.1 for +/- 10 percent
+        :param deadline: The maximum total time to wait in seconds. Waits forever if not set.
+        """
+        self.initial = max(initial, 0.0)
+        self.multiplier = max(multiplier, 1.0)
+        self.cap = max(cap, self.initial)
+        self.jitter = min(max(jitter, 0.0), 1.0)
+        self.deadline = deadline
+
+    def delays(self) -> Iterator[float]:
+        """
+        Generate the intervals between two polls.
+
+        :return: An endless iterator of intervals in seconds
+        """
+        delay = self.initial
+
+        while True:
+            yield delay * random.uniform(1 - self.jitter, 1 + self.jitter)
+            delay = min(delay * self.multiplier, self.cap)
+
+
+class Failure(Enum):
+    """
+    The classification of a failed request.
+    """
+
+    # Retrying will fail again, e.g. invalid input or missing permissions
+    PERMANENT = 'permanent'
+    # The failure is transient, but the request may have been processed, e.g. a connection reset or a 502
+    UNCERTAIN = 'uncertain'
+    # The failure is transient and the request was not processed, e.g. it could not be sent or it was rate limited
+    NOT_PROCESSED = 'not_processed'
+
+
+def method_of(url: str) -> str:
+    """
+    Get the name of the API method of a URL, e.g. 'zonesFind'.
+
+    :param url: The URL of the request
+    :return: The method name
+    """
+    return url.split('?', 1)[0].rstrip('/').rsplit('/', 1)[-1]
+
+
+def is_read(url: str, read_methods: Iterable[str] = READ_METHODS) -> bool:
+    """
+    Check whether a request only reads data, so it can be repeated or shared safely.
+
+    :param url: The URL of the request
+    :param read_methods: Methods that only read data, apart from the *Find and *Check methods
+    :return: True for read-only methods
+    """
+    method = method_of(url)
+    return method.endswith(('Find', 'Check')) or method in read_methods
+
+
+class RetryPolicy:
+    """
+    Decides which failed requests are retried, and when.
+
+    Read-only requests are retried on every transient failure. Mutating requests are only retried if the failure proves
+    that the request was not processed: it could not be sent, or the API rejected it because of rate limiting.
+    """
+
+    def __init__(
+        self,
+        attempts: int = 4,
+        backoff: Optional[Backoff] = None,
+        error_codes: Iterable[int] = (),
+        retry_mutations: bool = True,
+        max_retry_after: float = 60.0,
+        read_methods: Iterable[str] = READ_METHODS,
+    ):
+        """
+        Configure the retries.
+
+        :param attempts: The maximum number of attempts of a request, including the first one
+        :param backoff: The intervals between two attempts and the deadline of all attempts. Defaults to
+                        Backoff(initial=0.5, multiplier=2, cap=30, jitter=0.2).
+        :param error_codes: The API error codes which mean that a request was rejected temporarily, e.g. because of
+                            rate limiting. Requests failing with these codes are retried like HTTP 429 responses.
+        :param retry_mutations: Retry mutating requests, if they were provably not processed
+        :param max_retry_after: Give up if the server asks to retry later than this, in seconds
+        :param read_methods: Methods that only read data, apart from the *Find and *Check methods
+        """
+        self.attempts = max(attempts, 1)
+        self.backoff = backoff or Backoff(initial=0.5, multiplier=2.0, cap=30.0, jitter=0.2)
+        self.error_codes: Set[int] = set(error_codes)
+        self.retry_mutations = retry_mutations
+        self.max_retry_after = max_retry_after
+        self.read_methods = frozenset(read_methods)
+
+    def is_read(self, url: str) -> bool:
+        """
+        Check whether a request only reads data, so it can be repeated safely.
+
+        :param url: The URL of the request
+        :return: True for read-only methods
+        """
+        return is_read(url, self.read_methods)
+
+    def classify(self, error: Exception, http_response: Any = None) -> Failure:
+        """
+        Classify a failed request.
+
+        :param error: The exception raised by the request
+        :param http_response: The HTTP response, if one was received
+        :return: The classification
+        """
+        status = getattr(http_response, 'status_code', None)
+
+        if status == 429:
+            return Failure.NOT_PROCESSED
+
+        if isinstance(error, ApiException):
+            codes = {e.get('code') for e in error.details.get('errors', []) if isinstance(e, dict)}
+            if codes & self.error_codes:
+                return Failure.NOT_PROCESSED
+
+        if status is not None and status >= 500:
+            return Failure.UNCERTAIN
+
+        if isinstance(error, TransportException):
+            return Failure.UNCERTAIN if error.request_sent else Failure.NOT_PROCESSED
+
+        if isinstance(error, requests_exceptions.ConnectTimeout):
+            return Failure.NOT_PROCESSED
+
+        if isinstance(error, requests_exceptions.ConnectionError):
+            # Failures to connect are wrapped in a MaxRetryError, whose reason tells what failed
+            reason = getattr(error.args[0], 'reason', None) if error.args else None
+            if isinstance(reason, ConnectTimeoutError):
+                return Failure.NOT_PROCESSED
+            return Failure.UNCERTAIN
+
+        if isinstance(error, (requests_exceptions.Timeout, requests_exceptions.ChunkedEncodingError)):
+            return Failure.UNCERTAIN
+
+        return Failure.PERMANENT
+
+    def retry_after(self, http_response: Any) -> Optional[float]:
+        """
+        Get the delay requested by the Retry-After header of a response.
+
+        :param http_response: The HTTP response
+        :return: The delay in seconds, or None if the header is missing or not a number of seconds
+        """
+        headers = getattr(http_response, 'headers', None) or {}
+
+        try:
+            return max(float(headers.get('Retry-After')), 0.0)
+        except (TypeError, ValueError):
+            return None
+
+    def schedule(self, url: str) -> 'RetrySchedule':
+        """
+        Start tracking the attempts of a request.
+
+        :param url: The URL of the request
+        :return: The schedule of the request
+        """
+        return RetrySchedule(self, url)
+
+
+class RetrySchedule:
+    """
+    The attempts of a single request.
+    """
+
+    def __init__(self, policy: RetryPolicy, url: str):
+        """
+        Track the attempts of a request.
+
+        :param policy: The retry policy
+        :param url: The URL of the request
+        """
+        self.policy = policy
+        self.read = policy.is_read(url)
+        self.attempt = 1
+        self._delays = policy.backoff.delays()
+        self._started = time.monotonic()
+
+    def next_delay(self, error: Exception, http_response: Any = None) -> Optional[float]:
+        """
+        Decide whether a failed attempt is retried.
+
+        :param error: The exception raised by the attempt
+        :param http_response: The HTTP response, if one was received
+        :return: The time to wait before the next attempt in seconds, or None if the error should be raised
+        """
+        if self.attempt >= self.policy.attempts:
+            return None
+
+        failure = self.policy.classify(error, http_response)
+
+        if failure is Failure.PERMANENT:
+            return None
+
+        if not self.read and (failure is Failure.UNCERTAIN or not self.policy.retry_mutations):
+            return None
+
+        delay = next(self._delays)
+        retry_after = self.policy.retry_after(http_response)
+
+        if retry_after is not None:
+            if retry_after > self.policy.max_retry_after:
+                return None
+            delay = max(delay, retry_after)
+
+        deadline = self.policy.backoff.deadline
+        if deadline is not None and time.monotonic() - self._started + delay > deadline:
+            return None
+
+        self.attempt += 1
+        return delay
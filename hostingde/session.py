@@ -1,10 +1,26 @@
-import json
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from types import MappingProxyType
+from typing import Any, Generator, List, Mapping, NamedTuple, Optional, Tuple, Union
 
 import requests as requests
 from requests import auth, models
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import EmptyPoolError
 
+from hostingde.cache import ResponseCache
+from hostingde.codec import get_codec, JsonCodec
 from hostingde.exceptions import ClientException
+from hostingde.rate_limit import RateLimiter
+from hostingde.retry import Backoff, RetryPolicy
+from hostingde.single_flight import SingleFlight
+
+# The account contexts switched to in the current thread or task, by HostingDeAuth instance. The mapping is replaced,
+# never modified, so each context keeps the accounts it switched to.
+_account_contexts: 'ContextVar[Mapping[HostingDeAuth, Optional[str]]]' = ContextVar(
+    'hostingde_account_contexts', default=MappingProxyType({})
+)
 
 
 class HostingDeAuth(auth.AuthBase):
@@ -12,11 +28,14 @@ class HostingDeAuth(auth.AuthBase):
     A Auth injector for the hosting.de API. Injects the token and (optionally) the account into the request body.
     """
 
-    def __init__(self, token: str, token_field: str = 'authToken', account_id: str = None):
+    def __init__(
+        self, token: str, token_field: str = 'authToken', account_id: str = None, codec: Optional[JsonCodec] = None
+    ):
         super().__init__()
         self.token = token
         self.token_field = token_field
         self.account_id = account_id
+        self.codec = codec or get_codec()
 
     def __call__(self, r: models.PreparedRequest) -> models.PreparedRequest:
         """
@@ -30,25 +49,272 @@ class HostingDeAuth(auth.AuthBase):
         if r.body is None:
             request = {}
         else:
-            request = json.loads(r.body)
+            request = self.codec.loads(r.body)
+
+        r.body = self.codec.dumps(self.inject(request))
+        return r
 
+    def inject(self, request: dict) -> dict:
+        """
+        Add the token and the account context to a request payload, before it is serialized.
+
+        :param request: The request payload. It is modified in place.
+        :return: The payload that contains the authorization
+        """
         request[self.token_field] = self.token
+        account_id = self.current_account_id()
 
-        if self.account_id is not None:
-            request['ownerAccountId'] = self.account_id
+        if account_id is not None:
+            request['ownerAccountId'] = account_id
+
+        return request
+
+    def current_account_id(self) -> Optional[str]:
+        """
+        Get the account of the caller. An account context of the current thread or task takes precedence over the
+        account set on this object.
+
+        :return: The account id
+        """
+        contexts = _account_contexts.get()
+        return contexts[self] if self in contexts else self.account_id
+
+    @contextmanager
+    def account_context(self, account_id: Optional[str]) -> Generator[None, None, None]:
+        """
+        Send the requests of the current thread or asyncio task in the context of an account. Other threads and tasks
+        are not affected, so a single client can serve many accounts concurrently. Neither are clients authorized by
+        other instances.
+
+        :param account_id: The account id, or None for the account of the token
+        """
+        token = _account_contexts.set(MappingProxyType({**_account_contexts.get(), self: account_id}))
+
+        try:
+            yield
+        finally:
+            _account_contexts.reset(token)
+
+
+class InjectedAuth(auth.AuthBase):
+    """
+    Used for requests whose payload already contains the authorization, see HostingDeAuth.inject(). Leaves the request
+    untouched, so the body is not decoded and encoded a second time.
+    """
 
-        r.body = json.dumps(request).encode('utf-8')
+    def __call__(self, r: models.PreparedRequest) -> models.PreparedRequest:
         return r
 
 
+class PoolStats(NamedTuple):
+    """
+    Statistics of the connection pool of a host.
+    """
+
+    # The scheme, host and port of the pool, e.g. 'https://secure.hosting.de:443'
+    host: str
+    # The number of connections opened so far. Compare with the requests to see how often connections were reused.
+    connections: int
+    # The number of requests sent
+    requests: int
+    # The number of open connections waiting in the pool
+    idle: int
+    # The maximum number of connections kept in the pool
+    maxsize: int
+
+
 class HostingDeSession(requests.Session):
     """
     Custom session implementation contains the Hosting.de authorization implementation
     """
 
-    def __init__(self: 'HostingDeSession'):
+    def __init__(self: 'HostingDeSession', codec: Optional[Union[str, JsonCodec]] = None, **pool_options: Any):
+        """
+        Create a new session.
+
+        :param codec: The JSON codec used for request and response bodies. Defaults to the fastest installed codec.
+        :param pool_options: Options of the connection pool, see configure_pool()
+        """
         super().__init__()
         self.base_uri: Optional[str] = None
+        self.fast_decode: bool = False
+        self.codec: JsonCodec = get_codec(codec)
+        self.timeout: Optional[Tuple[Optional[float], Optional[float]]] = None
+        self.retry_policy: Optional[RetryPolicy] = None
+        self.job_backoff: Optional[Backoff] = None
+        self.rate_limiter: Optional[RateLimiter] = None
+        self.single_flight: Optional[SingleFlight] = None
+        self.response_cache: Optional[ResponseCache] = None
+        self.configure_pool(**pool_options)
+
+    def configure_pool(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+    ) -> None:
+        """
+        Configure the pooling of connections. Replaces the connection pools, open connections are closed.
+
+        Each worker of a parallel paginator or a fan-out holds a connection while it waits for a response, so the
+        pool_maxsize should be at least the number of workers. Otherwise connections are opened and thrown away.
+
+        :param pool_connections: The number of hosts to keep connection pools for
+        :param pool_maxsize: The maximum number of connections kept open per host
+        :param pool_block: Wait for a free connection if pool_maxsize connections are in use, instead of opening an
+                           additional connection that is closed after the request
+        :param keep_alive: Keep connections open for further requests. If disabled, every request opens a connection.
+        :param connect_timeout: The maximum time in seconds to establish a connection. None waits forever.
+        :param read_timeout: The maximum time in seconds to wait for data from the server. None waits forever.
+        :return:
+        """
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block)
+
+        for prefix in ('https://', 'http://'):
+            previous = self.adapters.get(prefix)
+            self.mount(prefix, adapter)
+            if previous is not None and previous is not adapter:
+                previous.close()
+
+        if keep_alive:
+            self.headers.pop('Connection', None)
+        else:
+            self.headers['Connection'] = 'close'
+
+        if connect_timeout is None and read_timeout is None:
+            self.timeout = None
+        else:
+            self.timeout = (connect_timeout, read_timeout)
+
+    def request(self, method: str, url: str, *args: Any, **kwargs: Any) -> requests.Response:
+        """
+        Send a request. Applies the timeouts of the session, unless a timeout is passed.
+        """
+        # The timeout is the seventh positional argument after the url
+        if kwargs.get('timeout') is None and self.timeout is not None and len(args) < 7:
+            kwargs['timeout'] = self.timeout
+
+        return super().request(method, url, *args, **kwargs)
+
+    def warm_up(self, connections: Optional[int] = None, url: Optional[str] = None) -> int:
+        """
+        Open connections to the endpoint ahead of the first requests, so parallel workers don't pay for the TCP and
+        TLS handshakes. The connections are opened concurrently and put into the pool. Connections that could not be
+        opened are skipped, the requests will report the error.
+
+        The connections are taken from the urllib3 pool and opened directly, which relies on the private _get_conn()
+        and _put_conn() methods of urllib3 1.26. If they are not available, HEAD requests open the connections instead.
+
+        :param connections: The number of connections to open. Defaults to the pool_maxsize.
+        :param url: The URL of the host to connect to. Defaults to the endpoint of this session.
+        :return: The number of connections that were opened
+        """
+        url = url or self.base_uri
+
+        if url is None:
+            raise ClientException('No endpoint URL set.')
+
+        adapter = self.get_adapter(url)
+        if not isinstance(adapter, HTTPAdapter):
+            raise ClientException('Connections can only be warmed up for a HTTPAdapter')
+
+        maxsize = adapter.poolmanager.connection_pool_kw.get('maxsize', 1)
+        count = maxsize if connections is None else min(connections, maxsize)
+
+        # requests 2.32.2 replaced get_connection() by get_connection_with_tls_context()
+        if hasattr(adapter, 'get_connection_with_tls_context'):
+            request = requests.Request('POST', url).prepare()
+            pool = adapter.get_connection_with_tls_context(request, self.verify, self.proxies, self.cert)
+        else:
+            pool = adapter.get_connection(url, self.proxies)
+            adapter.cert_verify(pool, url, self.verify, self.cert)
+
+        if not hasattr(pool, '_get_conn') or not hasattr(pool, '_put_conn'):
+            return self._open_with_requests(url, count)
+
+        # Take the connections out of the pool, so each of them is opened once
+        taken: List[Any] = []
+        for _ in range(count):
+            try:
+                taken.append(pool._get_conn(timeout=0.1))
+            except EmptyPoolError:
+                break
+
+        def connect(conn: Any) -> bool:
+            try:
+                if conn.sock is None:
+                    conn.connect()
+                return True
+            except Exception:
+                conn.close()
+                return False
+
+        try:
+            with ThreadPoolExecutor(max_workers=max(len(taken), 1), thread_name_prefix='hostingde-warm-up') as workers:
+                opened = sum(workers.map(connect, taken))
+        finally:
+            for conn in taken:
+                pool._put_conn(conn)
+
+        return opened
+
+    def _open_with_requests(self, url: str, count: int) -> int:
+        """
+        Open connections by sending concurrent HEAD requests, which only use public APIs of requests.
+
+        :param url: The URL to send the requests to
+        :param count: The number of connections to open
+        :return: The number of connections that were opened
+        """
+
+        def head(_: int) -> Optional[requests.Response]:
+            try:
+                # A streamed response keeps its connection until the body is read, so each request opens its own
+                return self.head(url, stream=True, allow_redirects=False, auth=InjectedAuth())
+            except requests.RequestException:
+                return None
+
+        with ThreadPoolExecutor(max_workers=max(count, 1), thread_name_prefix='hostingde-warm-up') as workers:
+            responses = [response for response in workers.map(head, range(count)) if response is not None]
+
+        for response in responses:
+            # Reading the empty body puts the connection back into the pool
+            response.content
+
+        return len(responses)
+
+    def pool_stats(self) -> List[PoolStats]:
+        """
+        Get statistics of the connection pools of this session.
+
+        :return: The statistics of each host that was connected to
+        """
+        stats = []
+
+        for adapter in {id(adapter): adapter for adapter in self.adapters.values()}.values():
+            pools = getattr(getattr(adapter, 'poolmanager', None), 'pools', None)
+            if pools is None:
+                continue
+
+            for key in pools.keys():
+                pool = pools.get(key)
+                if pool is None or pool.pool is None:
+                    continue
+
+                stats.append(
+                    PoolStats(
+                        host=f'{key.key_scheme}://{key.key_host}:{key.key_port or pool.port}',
+                        connections=pool.num_connections,
+                        requests=pool.num_requests,
+                        idle=sum(1 for conn in list(pool.pool.queue) if conn is not None and conn.sock is not None),
+                        maxsize=pool.pool.maxsize,
+                    )
+                )
+
+        return stats
 
     def build_path(self, *args, **kwargs):
         """
@@ -82,11 +348,25 @@ class HostingDeSession(requests.Session):
         :param token: The token to use for authentication
         :return:
         """
-        self.auth = HostingDeAuth(token)
+        self.auth = HostingDeAuth(token, codec=self.codec)
+
+    def set_codec(self, codec: Optional[Union[str, JsonCodec]]) -> None:
+        """
+        Switch the JSON codec used for request and response bodies.
+
+        :param codec: The name of the codec ('orjson', 'ujson' or 'json') or a codec instance. If None, the fastest
+                      installed codec is used.
+        :return:
+        """
+        self.codec = get_codec(codec)
+
+        if isinstance(self.auth, HostingDeAuth):
+            self.auth.codec = self.codec
 
     def set_account_context(self, account_id: Optional[str]) -> None:
         """
-        Switch context to subaccount
+        Switch context to subaccount. This changes the account of all threads, use account_context() to switch the
+        account of the current thread or task only.
 
         :param account_id: The account id of the subaccount.
         :return:
@@ -103,6 +383,6 @@ class HostingDeSession(requests.Session):
         :return: The account id
         """
         if isinstance(self.auth, HostingDeAuth):
-            return self.auth.account_id
+            return self.auth.current_account_id()
         else:
             raise ClientException('Subaccount could not be attached to request')
@@ -0,0 +1,107 @@
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, Tuple, TypeVar
+
+from hostingde.retry import is_read, READ_METHODS
+
+R = TypeVar('R')
+
+
+class SingleFlight:
+    """
+    Shares in-flight read requests between callers. While a request is running, identical requests of other threads or
+    asyncio tasks don't send a request of their own, but wait for the running one and get its parsed response.
+
+    Requests are identical if they go to the same endpoint in the same account context with the same payload. The
+    callers share the response object, so they must not modify it.
+    """
+
+    def __init__(self, read_methods: Iterable[str] = READ_METHODS):
+        """
+        Configure the shared requests. Only read-only methods are shared.
+
+        :param read_methods: Methods that only read data, apart from the *Find and *Check methods
+        """
+        self.read_methods = frozenset(read_methods)
+        # The number of requests sent, and the number of callers which got the response of another caller
+        self.requests = 0
+        self.shared = 0
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, Future] = {}
+        self._tasks: Dict[Tuple[asyncio.AbstractEventLoop, Hashable], asyncio.Future] = {}
+
+    def applies(self, url: str) -> bool:
+        """
+        Check whether requests to a URL may be shared.
+
+        :param url: The URL of the request
+        :return: True for read-only methods
+        """
+        return is_read(url, self.read_methods)
+
+    def _count(self, shared: bool) -> None:
+        with self._lock:
+            if shared:
+                self.shared += 1
+            else:
+                self.requests += 1
+
+    def do(self, key: Hashable, request: Callable[[], R]) -> R:
+        """
+        Send a request, unless an identical request is in flight. Then wait for its response instead.
+
+        :param key: Identifies the request, e.g. the URL, the account and the payload
+        :param request: Sends the request and returns the response
+        :return: The response
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = Future()
+
+        self._count(shared=not leader)
+
+        if not leader:
+            return call.result()  # type: ignore
+
+        try:
+            result = request()
+        except BaseException as e:
+            call.set_exception(e)  # type: ignore
+            raise
+        else:
+            call.set_result(result)  # type: ignore
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+    async def do_async(self, key: Hashable, request: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        The asyncio counterpart of do(). Requests are shared between the tasks of an event loop. The request keeps
+        running for the other callers, if the caller that started it is cancelled.
+
+        :param key: Identifies the request, e.g. the URL, the account and the payload
+        :param request: Returns a coroutine sending the request
+        :return: The response
+        """
+        task_key = (asyncio.get_running_loop(), key)
+        task = self._tasks.get(task_key)
+
+        self._count(shared=task is not None)
+
+        if task is None:
+            task = self._tasks[task_key] = asyncio.ensure_future(request())
+
+            def done(finished: asyncio.Future) -> None:
+                if self._tasks.get(task_key) is finished:
+                    del self._tasks[task_key]
+                # Mark the exception as retrieved, even if every caller was cancelled
+                if not finished.cancelled():
+                    finished.exception()
+
+            task.add_done_callback(done)
+
+        return await asyncio.shield(task)
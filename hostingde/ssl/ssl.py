@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import List, Optional
 
 from hostingde.paginator import HostingDePaginator
 from hostingde.hostingde import HostingDeCore
@@ -31,6 +31,10 @@ class SslClient(HostingDeCore):
         filter: Optional[FilterElement] = None,
         sort: Optional[SortConfiguration] = None,
         page: Optional[int] = None,
+        raw: bool = False,
+        fields: Optional[List[str]] = None,
+        lazy: bool = False,
+        prefetch: int = 0,
         *args: list,
         **kwargs: dict
     ) -> HostingDePaginator[Certificate]:
@@ -41,9 +45,15 @@ class SslClient(HostingDeCore):
         :param filter: A filter that is applied to the query
         :param sort: Configuration how results are sorted.
         :param page: The page to retrieve. If limit is unset, 25 items will be retrieved.
+        :param raw: Yield the raw response dicts instead of models.
+        :param fields: Yield tuples of the given response fields instead of models, e.g. ['name', 'content'].
+        :param lazy: Yield proxies that only decode the fields which are accessed.
+        :param prefetch: The number of pages to fetch ahead in the background.
         :return: An iterator that yields Zone objects.
         """
 
         uri = self._build_uri('ssl', 'certificatesFind')
 
-        return self._iter(uri, Certificate, filter, limit, sort, page)
+        return self._iter(
+            uri, Certificate, filter, limit, sort, page, raw=raw, fields=fields, lazy=lazy, prefetch=prefetch
+        )
@@ -33,7 +33,12 @@ setup(
         "marshmallow-enum==1.5.1",
         "urllib3~=1.26.3",
     ],
-    python_requires=">=3.6.0",
+    extras_require={
+        "aio": ["httpx>=0.20"],
+        "orjson": ["orjson"],
+        "ujson": ["ujson"],
+    },
+    python_requires=">=3.7.0",
     classifiers=[
         "Intended Audience :: Developers",
         "License :: OSI Approved :: MIT License",
@@ -42,7 +47,6 @@ setup(
         "Operating System :: Microsoft :: Windows",
         "Programming Language :: Python",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.6",
         "Programming Language :: Python :: 3.7",
         "Programming Language :: Python :: 3.8",
         "Programming Language :: Python :: 3.9",
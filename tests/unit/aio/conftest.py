@@ -0,0 +1,100 @@
+import asyncio
+import json
+
+import pytest
+
+
+class StandInServer:
+    """
+    A local HTTP/1.1 server standing in for the API. Requests are answered by the handler, which gets the path and the
+    decoded body and returns the response envelope, or a tuple of the HTTP status and the envelope.
+    """
+
+    def __init__(self, handler, chunked=False):
+        self.handler = handler
+        self.chunked = chunked
+        self.requests = []
+        self.connections = 0
+        self.server = None
+
+    @property
+    def url(self):
+        return f'http://127.0.0.1:{self.server.sockets[0].getsockname()[1]}/api'
+
+    async def start(self):
+        self.server = await asyncio.start_server(self.serve, '127.0.0.1', 0)
+        return self
+
+    async def stop(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def serve(self, reader, writer):
+        self.connections += 1
+
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b''):
+                        break
+                    name, _, value = line.decode().partition(':')
+                    headers[name.strip().lower()] = value.strip()
+
+                body = await reader.readexactly(int(headers.get('content-length', 0)))
+                path = request_line.decode().split(' ')[1]
+                data = json.loads(body) if body else {}
+                self.requests.append((path, data, headers))
+
+                result = self.handler(path, data)
+                if asyncio.iscoroutine(result):
+                    result = await result
+                status = 200
+                if isinstance(result, tuple):
+                    status, result = result
+                content = json.dumps(result).encode()
+
+                if self.chunked:
+                    middle = len(content) // 2
+                    chunks = b''.join(
+                        b'%x\r\n%s\r\n' % (len(part), part) for part in (content[:middle], content[middle:]) if part
+                    )
+                    writer.write(
+                        b'HTTP/1.1 %d OK\r\nContent-Type: application/json\r\nTransfer-Encoding: chunked\r\n\r\n' % status
+                        + chunks
+                        + b'0\r\n\r\n'
+                    )
+                else:
+                    writer.write(
+                        b'HTTP/1.1 %d OK\r\nContent-Type: application/json\r\nContent-Length: %d\r\n\r\n%s'
+                        % (status, len(content), content)
+                    )
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+
+@pytest.fixture
+def stand_in():
+    """
+    Run a coroutine against a stand-in server for the given handler.
+    """
+
+    def run(handler, test, chunked=False):
+        async def main():
+            server = await StandInServer(handler, chunked).start()
+            try:
+                return await test(server)
+            finally:
+                await server.stop()
+
+        return asyncio.run(main())
+
+    return run
@@ -0,0 +1,380 @@
+import asyncio
+import gc
+
+import pytest
+
+from hostingde.aio import AsyncHostingDeClient, AsyncHostingDePaginator, login
+from hostingde.cache import ResponseCache
+from hostingde.exceptions import (
+    ApiException,
+    ClientException,
+    JobFailedException,
+    TransportException,
+)
+from hostingde.model.filter import FilterCondition
+from hostingde.model.job import JobStatus
+from hostingde.model.record import Record, RecordType
+from hostingde.model.zone_config import ZoneConfig, ZoneConfigType
+from hostingde.rate_limit import RateLimiter
+from hostingde.retry import Backoff, RetryPolicy
+from hostingde.single_flight import SingleFlight
+
+RECORDS = [Record.create_new_record('cloud.de', RecordType.A, f'127.0.0.{i}').to_json() for i in range(95)]
+
+
+def zone(id):
+    return dict(
+        zoneConfig=dict(
+            type="NATIVE",
+            id=id,
+            accountId='account',
+            status='success',
+            name="cloud.de",
+            emailAddress="test@example.org",
+        ),
+        records=list(),
+    )
+
+
+def paged(body, rows):
+    limit, page = body['limit'], body['page']
+    return {
+        'status': 'success',
+        'response': {
+            'data': rows[(page - 1) * limit : page * limit],
+            'totalPages': -(-len(rows) // limit),
+            'totalEntries': len(rows),
+        },
+    }
+
+
+def test_login():
+    client = login('https://example.de/api', 'token')
+
+    assert isinstance(client, AsyncHostingDeClient)
+    assert client.dns.session is client.session
+    assert client.dns.transport is client.transport
+    assert client.ssl.transport is client.transport
+
+    with pytest.raises(ClientException):
+        login('', 'token')
+
+
+def test_request(stand_in):
+    def handler(path, body):
+        return {'status': 'success', 'response': {'nameservers': ['ns1.example.de', 'ns2.example.de']}}
+
+    async def test(server):
+        async with login(server.url, 'token') as client:
+            client.set_account_context('sub')
+            assert await client.dns.get_default_nameserver() == ['ns1.example.de', 'ns2.example.de']
+            assert await client.dns.get_default_nameserver() == ['ns1.example.de', 'ns2.example.de']
+
+        return server
+
+    server = stand_in(handler, test)
+
+    path, body, headers = server.requests[0]
+    assert path == '/api/dns/v1/json/nameserverSetGetDefault'
+    assert body == {'authToken': 'token', 'ownerAccountId': 'sub'}
+    assert headers['content-type'] == 'application/json'
+
+    # The connection is kept alive
+    assert server.connections == 1
+
+
+def test_error(stand_in):
+    def handler(path, body):
+        return {'status': 'error', 'errors': [{'text': 'Invalid token'}]}
+
+    async def test(server):
+        client = login(server.url, 'token')
+        with pytest.raises(ApiException):
+            await client.account.get_own_account()
+        await client.close()
+
+    stand_in(handler, test, chunked=True)
+
+
+def test_paginator(stand_in):
+    def handler(path, body):
+        return paged(body, RECORDS)
+
+    async def test(server):
+        async with login(server.url, 'token') as client:
+            paginator = client.dns.list_records(limit=10, filter=FilterCondition('RecordType').eq('A'))
+            assert isinstance(paginator, AsyncHostingDePaginator)
+
+            contents = [record.content async for record in paginator]
+            assert contents == [f'127.0.0.{i}' for i in range(95)]
+
+            assert len(await client.dns.list_records(limit=10).fetchall(parallel=4)) == 95
+            assert (await client.dns.list_records(limit=10, raw=True).fetchone())['content'] == '127.0.0.0'
+            assert await client.dns.list_records().count_total() == 95
+            assert [r.content for r in await client.dns.list_records().first(2)] == ['127.0.0.0', '127.0.0.1']
+            assert await client.dns.list_records().exists()
+
+    stand_in(handler, test, chunked=True)
+
+
+def test_paginator_aclose(stand_in):
+    async def handler(path, body):
+        if body['page'] == 1:
+            return paged(body, RECORDS)
+
+        await asyncio.sleep(0.1)
+        return {'status': 'error', 'errors': [{'text': 'Service unavailable'}]}
+
+    async def test(server):
+        errors = []
+        asyncio.get_running_loop().set_exception_handler(lambda loop, context: errors.append(context))
+
+        async with login(server.url, 'token') as client:
+            async with client.dns.list_records(limit=10, prefetch=3) as paginator:
+                assert (await paginator.__anext__()).content == '127.0.0.0'
+                pending = list(paginator._pending)
+                assert len(pending) == 3
+
+            # The prefetched pages were cancelled and have stopped
+            assert not paginator._pending
+            assert all(task.cancelled() for task in pending)
+
+            # The failed pages of an abandoned paginator are not reported
+            abandoned = client.dns.list_records(limit=10, prefetch=2)
+            await abandoned.__anext__()
+            await asyncio.sleep(0.3)
+            del abandoned, pending, paginator
+            gc.collect()
+
+        return errors
+
+    assert stand_in(handler, test) == []
+
+
+def test_concurrent_requests(stand_in):
+    arrived = []
+    events = {}
+
+    async def handler(path, body):
+        # The requests are only answered once all of them arrived, requests that wait for each other time out
+        everyone = events.setdefault('everyone', asyncio.Event())
+        arrived.append(body)
+        if len(arrived) == 10:
+            everyone.set()
+
+        await asyncio.wait_for(everyone.wait(), 5)
+        return paged(body, RECORDS)
+
+    async def test(server):
+        async with login(server.url, 'token') as client:
+            counts = await asyncio.gather(*(client.dns.list_records().count_total() for _ in range(10)))
+
+        assert counts == [95] * 10
+
+    stand_in(handler, test)
+
+
+def test_update_zone_waits_for_jobs(stand_in):
+    polls = []
+
+    def handler(path, body):
+        if path.endswith('zoneUpdate'):
+            return {'status': 'pending', 'response': zone('zone')}
+
+        polls.append(body)
+        status = 'inProgress' if len(polls) < 4 else 'successful'
+        job = {'id': 'job', 'objectId': 'zone', 'status': status, 'addDate': '2021-01-01T00:00:00Z'}
+        finished = status == 'successful'
+
+        # Unfinished jobs are queried with status filters, the final state without
+        if 'jobStatus' in str(body['filter']) and finished:
+            return paged(body, [])
+        return paged(body, [job])
+
+    async def test(server):
+        async with login(server.url, 'token') as client:
+            config = ZoneConfig(name='cloud.de', type=ZoneConfigType.NATIVE)
+
+            zone = await client.dns.update_zone(config, asynchronous=True)
+            assert zone.zone_config.id == 'zone'
+            assert polls == []
+
+            ticks = []
+
+            async def tick():
+                while True:
+                    ticks.append(1)
+                    await asyncio.sleep(0.01)
+
+            ticker = asyncio.ensure_future(tick())
+            zone = await client.dns.update_zone(config)
+            ticker.cancel()
+
+            assert zone.zone_config.id == 'zone'
+            # The event loop kept running while waiting for the job
+            assert len(ticks) > 5
+
+    stand_in(handler, test)
+    assert len(polls) >= 4
+
+
+def test_job_waiter_status(stand_in):
+    from hostingde.aio.job_waiter import AsyncJobWaiter
+
+    def handler(path, body):
+        job = {'id': 'job', 'objectId': 'domain', 'status': 'failed', 'addDate': '2021-01-01T00:00:00Z'}
+        return paged(body, [] if 'jobStatus' in str(body['filter']) else [job])
+
+    async def test(server):
+        async with login(server.url, 'token') as client:
+            return await AsyncJobWaiter(client.domain, 'domain').wait()
+
+    assert stand_in(handler, test) == JobStatus.failed
+
+
+def test_update_zone_raises_for_failed_jobs(stand_in):
+    def handler(path, body):
+        if path.endswith('zoneUpdate'):
+            return {'status': 'pending', 'response': zone('zone')}
+
+        job = {'id': 'job', 'objectId': 'zone', 'status': 'canceled', 'addDate': '2021-01-01T00:00:00Z'}
+        return paged(body, [] if 'jobStatus' in str(body['filter']) else [job])
+
+    async def test(server):
+        async with login(server.url, 'token') as client:
+            with pytest.raises(JobFailedException) as error:
+                await client.dns.update_zone(ZoneConfig(name='cloud.de', type=ZoneConfigType.NATIVE))
+
+            return error.value.status
+
+    assert stand_in(handler, test) == JobStatus.canceled
+
+
+def test_connection_refused():
+    async def test():
+        client = login('http://127.0.0.1:9/api', 'token')
+        client.set_retry_policy(RetryPolicy(backoff=Backoff(initial=0.01)))
+        with pytest.raises(TransportException):
+            await client.dns.get_default_nameserver()
+
+    asyncio.run(test())
+
+
+def test_sent_requests_are_not_resent(stand_in):
+    requests = []
+
+    def handler(path, body):
+        requests.append(path)
+        if len(requests) > 1:
+            # The kept alive connection is closed after the request was received
+            raise ConnectionResetError()
+        return {'status': 'success', 'response': {'nameservers': []}}
+
+    async def test(server):
+        async with login(server.url, 'token') as client:
+            client.set_retry_policy(None)
+            await client.dns.get_default_nameserver()
+            with pytest.raises(TransportException) as error:
+                await client.dns.get_default_nameserver()
+
+        assert error.value.request_sent
+
+    stand_in(handler, test)
+    assert len(requests) == 2
+
+
+def test_retries(stand_in):
+    requests = []
+
+    def handler(path, body):
+        requests.append(path)
+        if len(requests) % 3 != 0:
+            return 503, {'status': 'error', 'errors': [{'text': 'Service unavailable'}]}
+        return paged(body, RECORDS)
+
+    async def test(server):
+        async with login(server.url, 'token') as client:
+            client.set_retry_policy(RetryPolicy(backoff=Backoff(initial=0.01, jitter=0)))
+
+            assert await client.dns.list_records().count_total() == 95
+            assert len(requests) == 3
+
+            # The zone may have been created by the failed request, so it is not retried
+            with pytest.raises(ApiException):
+                await client.dns.create_zone(ZoneConfig(name='cloud.de', type=ZoneConfigType.NATIVE), asynchronous=True)
+            assert len(requests) == 4
+
+    stand_in(handler, test)
+
+
+def test_asyncio_tasks_share_the_limit(stand_in):
+    def handler(path, body):
+        return {'status': 'success', 'response': {'nameservers': []}}
+
+    async def test(server):
+        async with login(server.url, 'token') as client:
+            client.set_rate_limiter(RateLimiter(rate=50, burst=2))
+            ticks = []
+
+            async def tick():
+                while True:
+                    ticks.append(1)
+                    await asyncio.sleep(0.01)
+
+            ticker = asyncio.ensure_future(tick())
+            started = asyncio.get_running_loop().time()
+            await asyncio.gather(*(client.dns.get_default_nameserver() for _ in range(10)))
+            elapsed = asyncio.get_running_loop().time() - started
+            ticker.cancel()
+
+        assert elapsed >= (10 - 2) / 50 - 0.01
+        # Waiting for tokens did not block the event loop
+        assert len(ticks) > 5
+
+    stand_in(handler, test)
+
+
+def test_single_flight(stand_in):
+    async def handler(path, body):
+        await asyncio.sleep(0.05)
+        return paged(body, RECORDS)
+
+    async def test(server):
+        async with login(server.url, 'token') as client:
+            flight = SingleFlight()
+            client.set_single_flight(flight)
+
+            counts = await asyncio.gather(*(client.dns.list_records().count_total() for _ in range(10)))
+
+            # A cancelled caller does not cancel the request of the others
+            first = asyncio.ensure_future(client.dns.list_records().count_total())
+            second = asyncio.ensure_future(client.dns.list_records().count_total())
+            await asyncio.sleep(0.01)
+            first.cancel()
+
+            assert await second == 95
+            assert first.cancelled()
+
+        assert counts == [95] * 10
+        assert len(server.requests) == 2
+        assert (flight.requests, flight.shared) == (2, 10)
+
+    stand_in(handler, test)
+
+
+def test_response_cache(stand_in):
+    def handler(path, body):
+        return {'status': 'success', 'response': {'id': 'account', 'name': 'Account'}}
+
+    async def test(server):
+        async with login(server.url, 'token') as client:
+            cache = ResponseCache()
+            client.set_response_cache(cache)
+
+            accounts = [await client.account.get_own_account() for _ in range(3)]
+
+        assert [account.id for account in accounts] == ['account'] * 3
+        assert len(server.requests) == 1
+        assert cache.hits['getOwnAccount'] == 2
+
+    stand_in(handler, test)
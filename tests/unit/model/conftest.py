@@ -0,0 +1,19 @@
+import pytest
+
+from hostingde.model import Model
+
+
+@pytest.fixture(autouse=True, params=['schema', 'fast'])
+def decode_mode(request, monkeypatch):
+    """
+    Run every model test against both the schema decoder and the compiled fast path decoder.
+    """
+    if request.param == 'fast':
+        from_json = Model.from_json.__func__
+
+        def fast_from_json(cls, data, client=None, fast=True):
+            return from_json(cls, data, client, fast)
+
+        monkeypatch.setattr(Model, 'from_json', classmethod(fast_from_json))
+
+    return request.param
@@ -0,0 +1,125 @@
+import pytest
+from marshmallow import ValidationError
+
+from hostingde import HostingDeClient
+from hostingde.model import Model
+from hostingde.model.decoder import decoder_registry
+from hostingde.model.domain import Domain, DomainStatus
+from hostingde.model.job import Job, JobStatus
+from hostingde.model.record import Record, RecordType
+from hostingde.model.zone import Zone
+from hostingde.model.zone_config import ZoneConfig, ZoneConfigType
+
+RECORD = dict(
+    id='234987fds',
+    zoneConfigId="wegsefgio345235",
+    recordTemplateId="templateid",
+    name="recordname",
+    type="A",
+    lastChangeDate="some_timestamp",
+    content="127.0.0.1",
+    priority=0,
+    ttl=0,
+)
+
+ZONE = dict(
+    zoneConfig=dict(
+        type="NATIVE",
+        id='asdawf',
+        accountId='asfaegeg',
+        status='success',
+        name="cloud.de",
+        emailAddress="test@example.org",
+        zoneTransferWhitelist=['127.0.0.1'],
+        soaValues=dict(refresh=3600, retry=600),
+    ),
+    records=[RECORD, dict(RECORD, type='AAAA', content='::1')],
+)
+
+JOB = dict(
+    accountId='account',
+    action='create',
+    displayName="cloudfux.de",
+    id="38426570vds125970v",
+    objectId="32957vwge715br",
+    objectType="Zone",
+    parentJobId=None,
+    status='successful',
+)
+
+DOMAIN = dict(
+    name='cloud.de',
+    transferLockEnabled=True,
+    status='active',
+    contacts=[dict(contact='contact', type='owner')],
+    nameservers=[dict(name='ns1.cloud.de', ips=['127.0.0.1'])],
+)
+
+
+def assert_same(fast, slow):
+    if isinstance(slow, list):
+        assert len(fast) == len(slow)
+        for a, b in zip(fast, slow):
+            assert_same(a, b)
+    elif isinstance(slow, Model):
+        assert type(fast) is type(slow)
+        assert vars(fast).keys() == vars(slow).keys()
+        for key, value in vars(slow).items():
+            assert_same(vars(fast)[key], value)
+    else:
+        assert fast == slow
+
+
+@pytest.mark.parametrize(
+    'cls, data',
+    [(Record, RECORD), (Record, {}), (Zone, ZONE), (ZoneConfig, ZONE['zoneConfig']), (Job, JOB), (Domain, DOMAIN)],
+)
+def test_fast_decode_equals_schema_decode(cls, data):
+    client = HostingDeClient()
+
+    assert decoder_registry.decoder(cls) is not None
+    assert_same(cls.from_json(data, client, fast=True), cls.from_json(data, client, fast=False))
+    assert_same(cls.from_json(data, fast=True), cls.from_json(data, fast=False))
+
+
+def test_fast_decode_enum_tables():
+    assert Record.from_json(RECORD, fast=True).type == RecordType.A
+    assert Job.from_json(JOB, fast=True).status == JobStatus.successful
+    assert Domain.from_json(DOMAIN, fast=True).status == DomainStatus.active
+
+    zone = Zone.from_json(ZONE, fast=True)
+    assert zone.zone_config.type == ZoneConfigType.NATIVE
+    assert zone.records[1].type == RecordType.AAAA
+
+
+def test_fast_decode_falls_back_to_schema():
+    # Integer coercion is only implemented by the schema
+    assert Record.from_json(dict(RECORD, ttl='60'), fast=True).ttl == 60
+
+    with pytest.raises(ValidationError):
+        Record.from_json(dict(RECORD, type='INVALID'), fast=True)
+
+    with pytest.raises(ValidationError):
+        Zone.from_json(dict(records=[]), fast=True)
+
+
+def test_fast_decode_does_not_hide_errors(monkeypatch):
+    # Unhashable enum values are invalid data, which the schema reports
+    with pytest.raises(ValidationError):
+        Record.from_json(dict(RECORD, type=['A']), fast=True)
+
+    def broken(data, client):
+        raise RuntimeError('bug in the decoder')
+
+    monkeypatch.setitem(decoder_registry._decoders, Record, broken)
+
+    with pytest.raises(RuntimeError):
+        Record.from_json(RECORD, fast=True)
+
+
+def test_fast_decode_via_client():
+    client = HostingDeClient()
+    client.set_fast_decode()
+
+    assert client.dns.session.fast_decode is True
+    assert_same(client.dns._instance(Record, RECORD), Record.from_json(RECORD, client.dns, fast=False))
@@ -0,0 +1,95 @@
+from hostingde import HostingDeClient
+from hostingde.model.domain import (
+    Domain,
+    DomainContactRef,
+    DomainContactRefType,
+    DomainStatus,
+)
+from hostingde.model.lazy import hydrate, hydrate_all, LazyModel
+from hostingde.model.record import Record, RecordType
+
+RECORD = dict(
+    id='234987fds',
+    zoneConfigId="wegsefgio345235",
+    name="recordname",
+    type="A",
+    content="127.0.0.1",
+    ttl=60,
+)
+
+DOMAIN = dict(
+    name='cloud.de',
+    transferLockEnabled=True,
+    status='active',
+    contacts=[dict(contact='contact', type='owner')],
+)
+
+
+def test_lazy_decodes_accessed_fields_only():
+    record = LazyModel(Record, RECORD)
+
+    assert record.name == 'recordname'
+    assert record.type == RecordType.A
+    assert record.ttl == 60
+
+    assert set(record._values.keys()) == {'name', 'type', 'ttl'}
+    assert record._model is None
+
+
+def test_lazy_behaves_like_model():
+    record = LazyModel(Record, RECORD)
+
+    assert isinstance(record, Record)
+    assert record == Record.from_json(RECORD)
+    assert str(record) == 'recordname A 127.0.0.1'
+    assert hash(record) == hash(Record.from_json(RECORD))
+
+
+def test_lazy_missing_fields_use_model_defaults():
+    domain = LazyModel(Domain, dict(name='cloud.de', transferLockEnabled=False))
+
+    assert domain.nameservers == []
+    assert domain.name_unicode is None
+    assert domain._model is not None
+
+
+def test_lazy_nested_fields():
+    client = HostingDeClient()
+    domain = LazyModel(Domain, DOMAIN, client)
+
+    assert domain.status == DomainStatus.active
+    assert isinstance(domain.contacts[0], DomainContactRef)
+    assert domain.contacts[0].client == client
+
+
+def test_lazy_assignment_hydrates():
+    record = LazyModel(Record, RECORD)
+    record.content = '127.0.0.2'
+
+    model = hydrate(record)
+
+    assert type(model) is Record
+    assert model.content == '127.0.0.2'
+    assert record.content == '127.0.0.2'
+    assert model.to_json()['content'] == '127.0.0.2'
+
+
+def test_hydrate_all():
+    record = Record.from_json(RECORD)
+
+    assert hydrate(record) is record
+    assert hydrate_all(None) is None
+    assert [type(r) for r in hydrate_all([record, LazyModel(Record, RECORD)])] == [Record, Record]
+
+
+def test_hydrate_keeps_changes_to_decoded_fields():
+    domain = LazyModel(Domain, DOMAIN)
+    contact = domain.contacts[0]
+    contact.contact = 'changed'
+    domain.contacts.append(DomainContactRef(contact='admin', type=DomainContactRefType.admin))
+
+    model = hydrate(domain)
+
+    assert model.contacts[0] is contact
+    assert [c.contact for c in model.contacts] == ['changed', 'admin']
+    assert [c['contact'] for c in model.to_json()['contacts']] == ['changed', 'admin']
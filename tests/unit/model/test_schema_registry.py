@@ -0,0 +1,59 @@
+import gc
+
+from hostingde import HostingDeClient
+from hostingde.model import schema_registry, SchemaRegistry
+from hostingde.model.record import Record, RecordType
+from hostingde.model.zone import Zone
+
+
+def test_dump_schema_is_cached():
+    registry = SchemaRegistry()
+
+    assert registry.dump_schema(Record) is registry.dump_schema(Record)
+    assert registry.dump_schema(Record) is not registry.dump_schema(Zone)
+
+
+def test_load_schema_is_cached_per_client():
+    registry = SchemaRegistry()
+    client = HostingDeClient()
+    other = HostingDeClient()
+
+    assert registry.load_schema(Record) is registry.load_schema(Record)
+    assert registry.load_schema(Record, client) is registry.load_schema(Record, client)
+    assert registry.load_schema(Record, client) is not registry.load_schema(Record, other)
+    assert registry.load_schema(Record, client) is not registry.load_schema(Record)
+
+
+def test_load_schema_does_not_keep_client_alive():
+    registry = SchemaRegistry()
+    client = HostingDeClient()
+
+    registry.load_schema(Record, client)
+    assert len(registry._client_load_schemas) == 1
+
+    del client
+    gc.collect()
+
+    assert len(registry._client_load_schemas) == 0
+
+
+def test_cached_schemas_keep_client_context():
+    data = dict(zoneConfig=dict(type="NATIVE", name="cloud.de"), records=list())
+
+    client = HostingDeClient()
+    other = HostingDeClient()
+
+    assert Zone.from_json(data, client).zone_config.client == client
+    assert Zone.from_json(data, other).zone_config.client == other
+    assert Zone.from_json(data).zone_config.client is None
+
+
+def test_model_roundtrip_uses_registry():
+    schema_registry.clear()
+
+    record = Record.create_new_record('cloud.de', RecordType.A, '127.0.0.1')
+    data = record.to_json()
+
+    assert Record.from_json(data, fast=False) == record
+    assert Record in schema_registry._dump_schemas
+    assert Record in schema_registry._load_schemas
@@ -0,0 +1,165 @@
+import json
+import time
+
+import pytest
+import responses
+
+from hostingde.api import login
+from hostingde.cache import DiskStore, MemoryStore, ResponseCache
+from hostingde.exceptions import ApiException
+
+NAMESERVERS = 'https://example.com/dns/v1/json/nameserverSetGetDefault'
+PRICE_LIST = 'https://example.com/billing/v1/json/priceListDomains'
+SUBACCOUNTS = 'https://example.com/account/v1/json/subaccountsFind'
+
+
+def add_counting_callback(url, result):
+    requests = []
+
+    def callback(r):
+        requests.append(json.loads(r.body))
+        return 200, {}, json.dumps(result)
+
+    responses.add_callback('POST', url, callback)
+    return requests
+
+
+def cached_client(**kwargs):
+    client = login('https://example.com', 'demotoken')
+    cache = ResponseCache(**kwargs)
+    client.set_response_cache(cache)
+    return client, cache
+
+
+def test_memory_store():
+    store = MemoryStore(max_bytes=10)
+    expires = time.time() + 60
+
+    store.set('a-1', b'1234', expires)
+    store.set('a-2', b'5678', expires)
+    assert store.get('a-1') == b'1234'
+
+    # The least recently used body is evicted
+    store.set('b-1', b'90', expires + 1)
+    store.set('b-2', b'ab', expires)
+    assert store.get('a-2') is None
+    assert store.get('a-1') == b'1234'
+    assert store.size == 8
+
+    # Bodies larger than the store are not stored
+    store.set('c-1', b'x' * 11, expires)
+    assert store.get('c-1') is None
+
+    store.clear('b-')
+    assert (store.get('b-1'), store.get('a-1')) == (None, b'1234')
+
+    store.set('d-1', b'old', time.time() - 1)
+    assert store.get('d-1') is None
+
+
+def test_disk_store(tmp_path):
+    store = DiskStore(tmp_path / 'cache')
+    expires = time.time() + 60
+
+    store.set('a-1', b'{"status": "success"}\n', expires)
+    store.set('b-1', b'2', expires)
+    store.set('c-1', b'3', time.time() - 1)
+
+    # Other processes see the same bodies
+    other = DiskStore(tmp_path / 'cache')
+    assert other.get('a-1') == b'{"status": "success"}\n'
+    assert other.get('c-1') is None
+    assert other.get('missing') is None
+
+    other.clear('a-')
+    assert store.get('a-1') is None
+    assert store.get('b-1') == b'2'
+
+    store.clear()
+    assert sorted(p.name for p in (tmp_path / 'cache').iterdir()) == []
+
+
+def test_key():
+    key = ResponseCache.key(NAMESERVERS, 'account', b'{"authToken": "secret"}')
+
+    assert key.startswith('nameserverSetGetDefault-')
+    assert 'secret' not in key
+    assert key != ResponseCache.key(NAMESERVERS, None, b'{"authToken": "secret"}')
+    assert key != ResponseCache.key(NAMESERVERS, 'account', b'{"authToken": "other"}')
+
+
+@responses.activate
+def test_responses_are_cached():
+    client, cache = cached_client()
+    requests = add_counting_callback(NAMESERVERS, {'status': 'success', 'response': {'nameservers': ['ns1']}})
+
+    assert [client.dns.get_default_nameserver() for _ in range(3)] == [['ns1']] * 3
+    assert len(requests) == 1
+    assert (cache.hits['nameserverSetGetDefault'], cache.misses['nameserverSetGetDefault']) == (2, 1)
+
+    # Each account context is cached on its own
+    with client.switch_account_context('sub'):
+        client.dns.get_default_nameserver()
+        client.dns.get_default_nameserver()
+    assert len(requests) == 2
+
+    cache.invalidate('nameserverSetGetDefault')
+    client.dns.get_default_nameserver()
+    assert len(requests) == 3
+
+
+@responses.activate
+def test_pages_are_cached():
+    client, cache = cached_client()
+    rows = [{'id': f'account-{i}', 'name': f'Account {i}'} for i in range(5)]
+
+    def page(r):
+        body = json.loads(r.body)
+        requests.append(body['page'])
+        data = rows[(body['page'] - 1) * 2 : body['page'] * 2]
+        return 200, {}, json.dumps({'status': 'success', 'response': {'data': data, 'totalPages': 3}})
+
+    requests = []
+    responses.add_callback('POST', SUBACCOUNTS, page)
+
+    first = client.account.list_subaccounts_names(limit=2, fields=['id']).fetchall()
+    second = client.account.list_subaccounts_names(limit=2, fields=['id']).fetchall()
+
+    assert first == second == [(f'account-{i}',) for i in range(5)]
+    assert requests == [1, 2, 3]
+    assert sum(cache.hits.values()) == 3
+
+
+@responses.activate
+def test_uncached_responses():
+    client, cache = cached_client(ttls={'priceListDomains': 0.1})
+    requests = add_counting_callback(PRICE_LIST, {'status': 'success', 'responses': []})
+
+    client.billing.price_list_domains()
+    client.billing.price_list_domains()
+    assert len(requests) == 1
+
+    # Expired responses are requested again
+    time.sleep(0.15)
+    client.billing.price_list_domains()
+    assert len(requests) == 2
+
+    # Methods without a TTL are not cached
+    nameservers = add_counting_callback(NAMESERVERS, {'status': 'success', 'response': {'nameservers': []}})
+    client.dns.get_default_nameserver()
+    client.dns.get_default_nameserver()
+    assert len(nameservers) == 2
+    assert 'nameserverSetGetDefault' not in cache.misses
+
+
+@responses.activate
+def test_errors_are_not_cached(tmp_path):
+    client, cache = cached_client(store=DiskStore(tmp_path))
+    requests = add_counting_callback(NAMESERVERS, {'status': 'error', 'errors': [{'text': 'Access denied'}]})
+
+    for _ in range(2):
+        with pytest.raises(ApiException):
+            client.dns.get_default_nameserver()
+
+    assert len(requests) == 2
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,62 @@
+import json
+
+import pytest
+import responses
+
+from hostingde.api import login
+from hostingde.codec import get_codec, JsonCodec, StdlibCodec
+from hostingde.exceptions import ClientException
+
+
+def available_codecs():
+    codecs = []
+    for name in ['json', 'orjson', 'ujson']:
+        try:
+            codecs.append(get_codec(name))
+        except ClientException:
+            pass
+    return codecs
+
+
+@pytest.mark.parametrize('codec', available_codecs(), ids=lambda codec: codec.name)
+def test_codec_roundtrip(codec: JsonCodec):
+    data = {'authToken': 'token', 'filter': {'field': 'zoneName', 'value': 'exämple.com/*'}, 'limit': 25, 'x': None}
+
+    encoded = codec.dumps(data)
+
+    assert isinstance(encoded, bytes)
+    assert json.loads(encoded) == data
+    assert codec.loads(encoded) == data
+    assert codec.loads(encoded.decode('utf-8')) == data
+
+
+def test_get_codec():
+    assert isinstance(get_codec('json'), StdlibCodec)
+    assert get_codec() is not None
+
+    codec = StdlibCodec()
+    assert get_codec(codec) is codec
+
+    with pytest.raises(ClientException):
+        get_codec('unknown')
+
+
+@responses.activate
+@pytest.mark.parametrize('codec', available_codecs(), ids=lambda codec: codec.name)
+def test_request_uses_session_codec(codec: JsonCodec):
+    client = login('https://example.com', 'token')
+    client.set_json_codec(codec)
+
+    assert client.session.codec is codec
+    assert client.session.auth.codec is codec
+
+    bodies = []
+
+    def callback(request):
+        bodies.append(json.loads(request.body))
+        return 200, {}, json.dumps({'status': 'success', 'response': {'nameservers': ['ns1.example.com']}})
+
+    responses.add_callback('POST', 'https://example.com/dns/v1/json/nameserverSetGetDefault', callback)
+
+    assert client.dns.get_default_nameserver() == ['ns1.example.com']
+    assert bodies == [{'authToken': 'token'}]
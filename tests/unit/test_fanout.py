@@ -0,0 +1,152 @@
+import json
+import threading
+import time
+
+import pytest
+import responses
+from requests import PreparedRequest
+
+from hostingde.api import login
+from hostingde.exceptions import ApiException
+from hostingde.fanout import AccountItem
+
+ACCOUNTS = [f'account-{i}' for i in range(6)]
+
+
+def paged(body, rows):
+    limit, page = body['limit'], body['page']
+    return {
+        'status': 'success',
+        'response': {
+            'data': rows[(page - 1) * limit : page * limit],
+            'totalPages': -(-len(rows) // limit),
+            'totalEntries': len(rows),
+        },
+    }
+
+
+def add_account_callbacks(zones=3, failing=(), on_zones=None):
+    """
+    Answer subaccountsFind with ACCOUNTS and zonesFind with the zones of the requested account.
+    """
+
+    def subaccounts(r: PreparedRequest):
+        body = json.loads(r.body)
+        return 200, {}, json.dumps(paged(body, [{'id': id} for id in ACCOUNTS]))
+
+    def zones_find(r: PreparedRequest):
+        body = json.loads(r.body)
+        account = body.get('ownerAccountId')
+        if on_zones is not None:
+            on_zones(account)
+
+        if account in failing:
+            return 200, {}, json.dumps({'status': 'error', 'errors': [{'text': 'Access denied'}]})
+
+        rows = [{'zoneConfig': {'name': f'{account}-{i}.de'}} for i in range(zones)]
+        return 200, {}, json.dumps(paged(body, rows))
+
+    responses.add_callback('POST', 'https://example.com/account/v1/json/subaccountsFind', subaccounts)
+    responses.add_callback('POST', 'https://example.com/dns/v1/json/zonesFind', zones_find)
+
+
+def list_zones(client):
+    return client.dns.list_zones(limit=2, raw=True)
+
+
+@responses.activate
+def test_for_each_account():
+    client = login('https://example.com', 'demotoken')
+    add_account_callbacks()
+
+    items = list(client.for_each_account(list_zones))
+
+    assert all(isinstance(item, AccountItem) for item in items)
+    # Every zone is tagged with the account it was listed in
+    assert sorted((account, zone['zoneConfig']['name']) for account, zone in items) == sorted(
+        (account, f'{account}-{i}.de') for account in ACCOUNTS for i in range(3)
+    )
+
+
+@responses.activate
+def test_for_each_account_given_accounts():
+    client = login('https://example.com', 'demotoken')
+    add_account_callbacks()
+
+    items = list(client.for_each_account(list_zones, accounts=['account-1']))
+
+    assert [zone['zoneConfig']['name'] for _, zone in items] == ['account-1-0.de', 'account-1-1.de', 'account-1-2.de']
+    assert not any('subaccountsFind' in call.request.url for call in responses.calls)
+
+
+@responses.activate
+def test_for_each_account_bounds_workers():
+    client = login('https://example.com', 'demotoken')
+    lock = threading.Lock()
+    running = [0]
+    peak = [0]
+
+    def query(client):
+        with lock:
+            running[0] += 1
+            peak[0] = max(peak[0], running[0])
+        time.sleep(0.02)
+        with lock:
+            running[0] -= 1
+        return [client.session.get_account_context()]
+
+    add_account_callbacks()
+    items = list(client.for_each_account(query, workers=2))
+
+    assert sorted(items) == [(account, account) for account in ACCOUNTS]
+    assert peak[0] == 2
+    # The caller's context is unchanged
+    assert client.session.get_account_context() is None
+
+
+@responses.activate
+def test_for_each_account_keeps_other_clients():
+    client = login('https://example.com', 'demotoken')
+    other = login('https://example.com', 'othertoken')
+    add_account_callbacks()
+
+    def query(client):
+        return [(client.session.get_account_context(), other.session.get_account_context())]
+
+    items = list(client.for_each_account(query, accounts=ACCOUNTS[:3]))
+
+    # Only the client running the fan-out switches its account
+    assert sorted(items) == [(account, (account, None)) for account in ACCOUNTS[:3]]
+
+
+@responses.activate
+def test_for_each_account_exceptions():
+    client = login('https://example.com', 'demotoken')
+    add_account_callbacks(failing=['account-2'])
+
+    with pytest.raises(ApiException):
+        list(client.for_each_account(list_zones))
+
+    items = list(client.for_each_account(list_zones, return_exceptions=True))
+    errors = [(account, item) for account, item in items if isinstance(item, Exception)]
+
+    assert len(items) == 5 * 3 + 1
+    assert len(errors) == 1
+    assert errors[0][0] == 'account-2'
+    assert isinstance(errors[0][1], ApiException)
+
+
+@responses.activate
+def test_for_each_account_stops_early():
+    client = login('https://example.com', 'demotoken')
+    requested = []
+    add_account_callbacks(zones=50, on_zones=requested.append)
+
+    iterator = client.for_each_account(list_zones, workers=2, buffer=1)
+    first = next(iterator)
+    iterator.close()
+    time.sleep(0.3)
+
+    assert first.account_id in ACCOUNTS
+    # The workers stopped once the consumer was gone instead of listing every zone of every account
+    assert len(requested) < 10
@@ -0,0 +1,412 @@
+import json
+
+import pytest
+import requests
+import responses
+
+from hostingde.api import login
+from hostingde.exceptions import (
+    ApiException,
+    ClientException,
+    JobFailedException,
+    JobTimeoutException,
+)
+from hostingde.job_waiter import (
+    Backoff,
+    JobFuture,
+    JobTracker,
+    JobWaiter,
+    MultiJobWaiter,
+)
+from hostingde.model.job import JobStatus
+from hostingde.model.zone_config import ZoneConfig, ZoneConfigType
+
+FIELDS = {'jobObjectId': 'objectId', 'jobStatus': 'status', 'jobType': 'action'}
+
+
+def matches(job, filter):
+    if 'subFilter' in filter:
+        results = [matches(job, sub) for sub in filter['subFilter']]
+        return all(results) if filter['subFilterConnective'] == 'and' else any(results)
+
+    equal = job[FIELDS[filter['field']]] == filter['value']
+    return equal if filter.get('relation', 'equal') == 'equal' else not equal
+
+
+def job(object_id, status, add_date='2021-01-01T00:00:00Z', action='zoneUpdate'):
+    return {
+        'id': f'job-{object_id}-{add_date}',
+        'objectId': object_id,
+        'status': status,
+        'addDate': add_date,
+        'action': action,
+    }
+
+
+def add_jobs_callback(url, jobs, on_request=None):
+    """
+    Register a jobsFind endpoint over the given jobs. on_request is called before each request is answered.
+    """
+    requests = []
+
+    def callback(request):
+        body = json.loads(request.body)
+        requests.append(body)
+
+        if on_request is not None:
+            on_request(len(requests))
+
+        result = [item for item in jobs if matches(item, body['filter'])]
+        if 'sort' in body:
+            result.sort(key=lambda item: item['addDate'], reverse=body['sort']['order'] == 'DESC')
+        size = body['limit']
+        data = result[(body['page'] - 1) * size : body['page'] * size]
+
+        return (
+            200,
+            {},
+            json.dumps(
+                {
+                    "response": {"data": data, "totalPages": -(-len(result) // size), "totalEntries": len(result)},
+                    "status": "success",
+                }
+            ),
+        )
+
+    responses.add_callback('POST', url, callback)
+
+    return requests
+
+
+@responses.activate
+def test_multi_job_waiter(monkeypatch):
+    client = login('https://example.de/api', 'token')
+    sleeps = []
+    monkeypatch.setattr('time.sleep', sleeps.append)
+
+    ids = [f'zone-{i:03d}' for i in range(120)]
+    jobs = [job(id, 'successful', '2020-01-01T00:00:00Z') for id in ids]
+    jobs += [job(id, 'inProgress') for id in ids]
+
+    def progress(count):
+        # Every request finishes another 30 jobs, the last one fails
+        for item in jobs:
+            if item['status'] == 'inProgress' and count * 30 > int(item['objectId'][5:]):
+                item['status'] = 'failed' if item['objectId'] == 'zone-119' else 'successful'
+
+    requests = add_jobs_callback(client.dns.build_uri('jobsFind'), jobs, progress)
+
+    waiter = MultiJobWaiter(client.dns, ids, chunk_size=50)
+    results = waiter.wait()
+
+    assert waiter.pending == set()
+    assert sorted(results) == ids
+    assert results['zone-000'].status == JobStatus.successful
+    assert results['zone-000'].add_date == '2021-01-01T00:00:00Z'
+    assert results['zone-119'].status == JobStatus.failed
+
+    # Chunks of 50 zones, instead of one request per zone. The final states are looked up per chunk as well.
+    assert len([request for request in requests if 'sort' not in request]) < 20
+    lookups = [request for request in requests if 'sort' in request]
+    assert len(lookups) < 10
+    assert lookups[0]['sort'] == {'field': 'jobAddDate', 'order': 'DESC'}
+    assert max(len(request['filter']['subFilter'][0]['subFilter']) for request in requests) == 50
+    assert len(sleeps) >= 1
+
+
+@responses.activate
+def test_multi_job_waiter_latest_jobs():
+    client = login('https://example.de/api', 'token')
+
+    jobs = [job('a', 'failed', '2021-01-03T00:00:00Z'), job('a', 'successful', '2021-01-02T00:00:00Z')]
+    jobs += [job('b', 'successful', '2021-01-01T00:00:00Z'), job('b', 'failed', '2020-01-01T00:00:00Z')]
+    jobs += [job('c', 'canceled', '2019-01-01T00:00:00Z')]
+    requests = add_jobs_callback(client.dns.build_uri('jobsFind'), jobs)
+
+    finished = MultiJobWaiter(client.dns, ['a', 'b', 'c'], chunk_size=2).poll()
+
+    assert {id: job.status for id, job in finished.items()} == {
+        'a': JobStatus.failed,
+        'b': JobStatus.successful,
+        'c': JobStatus.canceled,
+    }
+
+    # One lookup per chunk, the pages of a lookup are only requested until every object was seen
+    lookups = [(len(request['filter']['subFilter'][0]['subFilter']), request['page']) for request in requests]
+    assert lookups == [(2, 1), (2, 1), (2, 2), (1, 1), (1, 1)]
+
+
+@responses.activate
+def test_multi_job_waiter_poll():
+    client = login('https://example.de/api', 'token')
+
+    jobs = [job('a', 'successful'), job('b', 'inProgress'), job('c', 'new', action='zoneCreate')]
+    requests = add_jobs_callback(client.dns.build_uri('jobsFind'), jobs)
+
+    waiter = MultiJobWaiter(client.dns, ['a', 'b', 'c', 'd'], action_name='zoneUpdate')
+
+    finished = waiter.poll()
+
+    assert set(finished) == {'a', 'c', 'd'}
+    assert finished['a'].status == JobStatus.successful
+    assert finished['c'] is None
+    assert finished['d'] is None
+    assert waiter.pending == {'b'}
+    assert len(requests) == 2
+    assert {'field': 'jobType', 'value': 'zoneUpdate', 'relation': 'equal'} in requests[0]['filter']['subFilter']
+
+    jobs[1]['status'] = 'canceled'
+
+    assert waiter.poll()['b'].status == JobStatus.canceled
+    assert waiter.pending == set()
+    assert sorted(waiter.results) == ['a', 'b', 'c', 'd']
+
+
+def test_backoff_delays():
+    delays = Backoff(initial=0.5, multiplier=2, cap=3, jitter=0).delays()
+
+    assert [next(delays) for _ in range(5)] == [0.5, 1.0, 2.0, 3.0, 3.0]
+
+    delays = Backoff(initial=1, multiplier=1, jitter=0.2).delays()
+
+    assert all(0.8 <= next(delays) <= 1.2 for _ in range(100))
+
+
+@responses.activate
+def test_job_waiter_returns_terminal_status(monkeypatch):
+    client = login('https://example.de/api', 'token')
+    sleeps = []
+    monkeypatch.setattr('time.sleep', sleeps.append)
+
+    jobs = [job('zone', 'inProgress')]
+
+    def progress(count):
+        if count == 3:
+            jobs[0]['status'] = 'failed'
+
+    add_jobs_callback(client.dns.build_uri('jobsFind'), jobs, progress)
+
+    status = JobWaiter(client.dns, 'zone', backoff=Backoff(initial=0.1, multiplier=2, jitter=0)).wait()
+
+    assert status == JobStatus.failed
+    assert sleeps == [0.1, 0.2]
+
+
+@responses.activate
+def test_job_waiter_finished_job_does_not_sleep(monkeypatch):
+    client = login('https://example.de/api', 'token')
+    sleeps = []
+    monkeypatch.setattr('time.sleep', sleeps.append)
+
+    add_jobs_callback(client.dns.build_uri('jobsFind'), [job('zone', 'successful')])
+
+    assert JobWaiter(client.dns, 'zone').wait() == JobStatus.successful
+    assert JobWaiter(client.dns, 'other').wait() is None
+    assert sleeps == []
+
+
+@responses.activate
+def test_job_waiter_deadline(monkeypatch):
+    client = login('https://example.de/api', 'token')
+    clock = [0.0]
+    sleeps = []
+
+    def sleep(delay):
+        sleeps.append(delay)
+        clock[0] += delay
+
+    monkeypatch.setattr('time.sleep', sleep)
+    monkeypatch.setattr('time.monotonic', lambda: clock[0])
+
+    add_jobs_callback(client.dns.build_uri('jobsFind'), [job('a', 'inProgress'), job('b', 'successful')])
+
+    waiter = MultiJobWaiter(client.dns, ['a', 'b'])
+
+    with pytest.raises(JobTimeoutException) as error:
+        waiter.wait(Backoff(initial=1, multiplier=2, jitter=0, deadline=5))
+
+    assert error.value.pending == ['a']
+    assert sleeps == [1, 2, 2]
+    assert waiter.results['b'].status == JobStatus.successful
+
+
+def add_zone_update(client, zone_id):
+    data = dict(
+        zoneConfig=dict(
+            type="NATIVE",
+            id=zone_id,
+            accountId='account',
+            status='success',
+            name="cloud.de",
+            emailAddress="test@example.org",
+        ),
+        records=list(),
+    )
+    responses.add('POST', client.dns.build_uri('zoneUpdate'), body=json.dumps({"response": data, "status": "success"}))
+
+
+@responses.activate
+def test_job_tracker():
+    client = login('https://example.de/api', 'token')
+
+    jobs = [job(f'zone-{i}', 'inProgress') for i in range(10)]
+
+    def progress(count):
+        for i, item in enumerate(jobs):
+            if i < count * 2:
+                item['status'] = 'canceled' if i == 3 else 'successful'
+
+    requests = add_jobs_callback(client.dns.build_uri('jobsFind'), jobs, progress)
+
+    tracker = JobTracker(Backoff(initial=0.01, multiplier=1, jitter=0))
+    done = []
+
+    futures = [tracker.track(client.dns, f'zone-{i}', response=i) for i in range(10)]
+    futures[0].add_done_callback(done.append)
+
+    assert [future.status(timeout=5) for future in futures] == [
+        JobStatus.canceled if i == 3 else JobStatus.successful for i in range(10)
+    ]
+    assert [future.response for future in futures] == list(range(10))
+    assert done == [futures[0]]
+    assert tracker.pending() == 0
+
+    # All futures are polled together, not once per future
+    assert len([request for request in requests if 'sort' not in request]) < 10
+
+
+@responses.activate
+def test_job_tracker_deadline():
+    client = login('https://example.de/api', 'token')
+
+    add_jobs_callback(client.dns.build_uri('jobsFind'), [job('zone', 'inProgress')])
+
+    tracker = JobTracker(Backoff(initial=0.01, jitter=0, deadline=0.05))
+    future = tracker.track(client.dns, 'zone')
+
+    with pytest.raises(JobTimeoutException):
+        future.result(timeout=5)
+
+    assert tracker.track(client.dns, None).result(timeout=0) is None
+
+
+@responses.activate
+def test_job_tracker_retries_transient_errors():
+    client = login('https://example.de/api', 'token')
+    client.set_retry_policy(None)
+
+    jobs = [job('zone', 'inProgress')]
+
+    def progress(count):
+        if count == 1:
+            raise requests.exceptions.ConnectionError('Connection reset')
+        if count == 3:
+            jobs[0]['status'] = 'successful'
+
+    add_jobs_callback(client.dns.build_uri('jobsFind'), jobs, progress)
+
+    tracker = JobTracker(Backoff(initial=0.01, multiplier=1, jitter=0))
+
+    assert tracker.track(client.dns, 'zone').status(timeout=5) == JobStatus.successful
+
+
+@responses.activate
+def test_job_tracker_fails_on_permanent_errors():
+    client = login('https://example.de/api', 'token')
+
+    responses.add(
+        'POST',
+        client.dns.build_uri('jobsFind'),
+        body=json.dumps({'status': 'error', 'errors': [{'code': 10100, 'text': 'Access denied'}]}),
+    )
+
+    tracker = JobTracker(Backoff(initial=0.01, multiplier=1, jitter=0))
+    futures = [tracker.track(client.dns, 'a'), tracker.track(client.dns, 'b')]
+
+    for future in futures:
+        with pytest.raises(ApiException):
+            future.result(timeout=5)
+
+
+@responses.activate
+def test_update_zone_future():
+    client = login('https://example.de/api', 'token')
+
+    add_zone_update(client, 'zone')
+    add_jobs_callback(client.dns.build_uri('jobsFind'), [job('zone', 'successful')])
+
+    future = client.dns.update_zone(ZoneConfig(name='cloud.de', type=ZoneConfigType.NATIVE), future=True)
+
+    assert isinstance(future, JobFuture)
+    assert future.response.zone_config.id == 'zone'
+    assert future.status(timeout=5) == JobStatus.successful
+    assert future.done()
+
+
+@responses.activate
+def test_update_zone_raises_for_failed_jobs():
+    client = login('https://example.de/api', 'token')
+
+    add_zone_update(client, 'zone')
+    add_jobs_callback(client.dns.build_uri('jobsFind'), [job('zone', 'failed')])
+
+    with pytest.raises(JobFailedException) as error:
+        client.dns.update_zone(ZoneConfig(name='cloud.de', type=ZoneConfigType.NATIVE))
+
+    assert (error.value.object_id, error.value.status) == ('zone', JobStatus.failed)
+
+    # Not waiting for the jobs does not check them
+    assert client.dns.update_zone(ZoneConfig(name='cloud.de', type=ZoneConfigType.NATIVE), asynchronous=True)
+
+
+@responses.activate
+def test_update_zone_job_backoff(monkeypatch):
+    client = login('https://example.de/api', 'token')
+    clock = [0.0]
+    sleeps = []
+
+    def sleep(delay):
+        sleeps.append(delay)
+        clock[0] += delay
+
+    monkeypatch.setattr('time.sleep', sleep)
+    monkeypatch.setattr('time.monotonic', lambda: clock[0])
+
+    add_zone_update(client, 'zone')
+    add_jobs_callback(client.dns.build_uri('jobsFind'), [job('zone', 'inProgress')])
+    client.set_job_backoff(Backoff(initial=1, multiplier=2, jitter=0, deadline=5))
+
+    with pytest.raises(JobTimeoutException) as error:
+        client.dns.update_zone(ZoneConfig(name='cloud.de', type=ZoneConfigType.NATIVE))
+
+    assert error.value.pending == ['zone']
+    assert sleeps == [1, 2, 2]
+
+
+def test_delete_zone_future_by_name():
+    client = login('https://example.de/api', 'token')
+
+    with pytest.raises(ClientException):
+        client.dns.delete_zone(zone_name='cloud.de', asynchronous=True, future=True)
+
+
+@responses.activate
+def test_job_tracker_account_context():
+    client = login('https://example.de/api', 'token')
+
+    requests = add_jobs_callback(client.dns.build_uri('jobsFind'), [job('a', 'successful'), job('b', 'successful')])
+
+    tracker = JobTracker(Backoff(initial=0.01, jitter=0))
+
+    with client.switch_account_context('first'):
+        first = tracker.track(client.dns, 'a')
+    with client.switch_account_context('second'):
+        second = tracker.track(client.dns, 'b')
+
+    assert first.status(timeout=5) == JobStatus.successful
+    assert second.status(timeout=5) == JobStatus.successful
+
+    accounts = {
+        request['ownerAccountId']: request['filter']['subFilter'][0]['subFilter'][0]['value'] for request in requests
+    }
+    assert accounts == {'first': 'a', 'second': 'b'}
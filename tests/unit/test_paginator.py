@@ -1,10 +1,21 @@
+import itertools
 import json
+from collections import deque
 
+import pytest
 import responses
 
 from hostingde.api import login
+from hostingde.exceptions import ClientException
+from hostingde.model.filter import FilterCondition
 from hostingde.model.record import Record, RecordType
-from hostingde.paginator import HostingDePaginator
+from hostingde.model.sort import SortConfiguration, SortOrder
+from hostingde.paginator import (
+    _aligned_limit,
+    AdaptivePageSize,
+    count_all,
+    HostingDePaginator,
+)
 
 
 @responses.activate
@@ -316,3 +327,571 @@ def test_fetchone_returns_none_after_last():
     paginator.fetchall()
 
     assert paginator.fetchone() is None
+
+
+@responses.activate
+def test_paginator_raw():
+    api = login('https://example.de/api', 'token')
+
+    url = 'https://example.de/api/demo'
+
+    paginator: HostingDePaginator = HostingDePaginator(api, instance_class=Record, url=url, raw=True)
+
+    rows = [Record.create_new_record('cloud.de', RecordType.A, f'127.0.0.{i}').to_json() for i in range(25)]
+
+    responses.add('POST', url, body=json.dumps({"response": {"data": rows, "totalPages": 1}, "status": "success"}))
+
+    assert paginator.fetchall() == rows
+
+
+@responses.activate
+def test_paginator_fields():
+    api = login('https://example.de/api', 'token')
+
+    url = 'https://example.de/api/dns/v1/json/recordsFind'
+
+    responses.add(
+        'POST',
+        url,
+        body=json.dumps(
+            {
+                "response": {
+                    "data": [
+                        Record.create_new_record('cloud.de', RecordType.A, f'127.0.0.{i}').to_json() for i in range(25)
+                    ],
+                    "totalPages": 1,
+                },
+                "status": "success",
+            }
+        ),
+    )
+
+    items = api.dns.list_records(fields=['name', 'content', 'comments']).fetchall()
+
+    assert len(items) == 25
+    assert items[3] == ('cloud.de', '127.0.0.3', None)
+
+
+@responses.activate
+def test_paginator_lazy():
+    api = login('https://example.de/api', 'token')
+
+    url = 'https://example.de/api/dns/v1/json/recordsFind'
+
+    responses.add(
+        'POST',
+        url,
+        body=json.dumps(
+            {
+                "response": {
+                    "data": [
+                        Record.create_new_record('cloud.de', RecordType.A, f'127.0.0.{i}').to_json() for i in range(25)
+                    ],
+                    "totalPages": 1,
+                },
+                "status": "success",
+            }
+        ),
+    )
+
+    items = api.dns.list_records(lazy=True).fetchall()
+
+    assert len(items) == 25
+    assert all(isinstance(item, Record) for item in items)
+    assert items[3].content == '127.0.0.3'
+    assert items[3]._model is None
+
+
+def add_paged_callback(url, total, requested_limits=None):
+    """
+    Register a callback that serves the records 0..total-1 in pages of the requested size.
+    """
+    requested_pages = []
+
+    def callback(request):
+        body = json.loads(request.body)
+        page, size = body['page'], body['limit']
+        requested_pages.append(page)
+        if requested_limits is not None:
+            requested_limits.append(size)
+
+        data = [
+            Record.create_new_record('cloud.de', RecordType.A, f'127.0.0.{i}').to_json()
+            for i in range((page - 1) * size, min(page * size, total))
+        ]
+
+        return (
+            200,
+            {},
+            json.dumps(
+                {
+                    "response": {"data": data, "totalPages": -(-total // size), "totalEntries": total},
+                    "status": "success",
+                }
+            ),
+        )
+
+    responses.add_callback('POST', url, callback)
+
+    return requested_pages
+
+
+@responses.activate
+def test_paginator_prefetch():
+    api = login('https://example.de/api', 'token')
+
+    url = 'https://example.de/api/demo'
+
+    requested_pages = add_paged_callback(url, 110)
+
+    with HostingDePaginator(api, instance_class=Record, url=url, prefetch=2) as paginator:
+        items = [item.content for item in paginator]
+
+    assert items == [f'127.0.0.{i}' for i in range(110)]
+    assert requested_pages == [1, 2, 3, 4, 5]
+    assert paginator._executor is None
+
+
+@responses.activate
+def test_paginator_prefetch_respects_count():
+    api = login('https://example.de/api', 'token')
+
+    url = 'https://example.de/api/demo'
+
+    requested_pages = add_paged_callback(url, 110)
+
+    paginator: HostingDePaginator = HostingDePaginator(api, instance_class=Record, url=url, count=30, prefetch=3)
+
+    assert [item.content for item in paginator] == [f'127.0.0.{i}' for i in range(30)]
+    assert requested_pages == [1, 2]
+
+
+@responses.activate
+def test_paginator_prefetch_close():
+    api = login('https://example.de/api', 'token')
+
+    url = 'https://example.de/api/demo'
+
+    add_paged_callback(url, 110)
+
+    paginator: HostingDePaginator = HostingDePaginator(api, instance_class=Record, url=url, prefetch=2)
+
+    assert paginator.fetchone().content == '127.0.0.0'
+    assert len(paginator._pending) == 2
+
+    paginator.close()
+
+    assert len(paginator._pending) == 0
+    assert paginator._executor is None
+
+    # The paginator keeps working after it was closed
+    assert len(paginator.fetchall()) == 109
+
+
+@responses.activate
+def test_paginator_fetchall_parallel():
+    api = login('https://example.de/api', 'token')
+
+    url = 'https://example.de/api/demo'
+
+    requested_pages = add_paged_callback(url, 1000)
+
+    paginator: HostingDePaginator = HostingDePaginator(api, instance_class=Record, url=url, limit=10)
+
+    assert [item.content for item in paginator.fetchall(parallel=8)] == [f'127.0.0.{i}' for i in range(1000)]
+    assert sorted(requested_pages) == list(range(1, 101))
+    assert requested_pages[0] == 1
+
+
+@responses.activate
+def test_paginator_parallel_respects_count():
+    api = login('https://example.de/api', 'token')
+
+    url = 'https://example.de/api/demo'
+
+    requested_pages = add_paged_callback(url, 1000)
+
+    paginator: HostingDePaginator = HostingDePaginator(api, instance_class=Record, url=url, limit=10, count=45)
+
+    assert [item.content for item in paginator.parallel(4)] == [f'127.0.0.{i}' for i in range(45)]
+    assert sorted(requested_pages) == [1, 2, 3, 4, 5]
+
+
+def test_paginator_buffer_consumed_from_the_front():
+    api = login('https://example.de/api', 'token')
+    paginator: HostingDePaginator = HostingDePaginator(api, Record, 'demo', limit=5, raw=True)
+
+    rows = [{'name': 'cloud.de', 'content': str(i)} for i in range(5)]
+    paginator._fetch_page = lambda page: {'data': list(rows), 'totalPages': 1, 'totalEntries': 5}
+
+    iterator = iter(paginator)
+    assert next(iterator) == rows[0]
+
+    # A deque removes consumed rows in constant time, a list would move every remaining row
+    assert isinstance(paginator.results, deque)
+    assert list(paginator.results) == rows[1:]
+    assert list(iterator) == rows[1:]
+    assert not paginator.results
+
+
+def test_adaptive_page_size_next_limit():
+    adaptive = AdaptivePageSize(target=1.0, min_limit=10, max_limit=100)
+
+    assert adaptive.next_limit(20, 20, 0.25, 1000) == 40
+    assert adaptive.next_limit(20, 20, 4.0, 1000) == 10
+    assert adaptive.next_limit(80, 80, 0.1, 1000) == 100
+    assert adaptive.next_limit(20, 20, 0.9, 1000) == 20
+    assert adaptive.next_limit(20, 5, 0.01, 1000) == 20
+
+    # Large rows bound the page size, even if the page was fast
+    adaptive = AdaptivePageSize(target=1.0, min_limit=10, max_limit=100, max_bytes=50_000)
+    assert adaptive.next_limit(20, 20, 0.25, 20_000) == 40
+    assert adaptive.next_limit(40, 40, 0.25, 80_000) == 25
+    assert adaptive.next_limit(40, 40, 1.0, 400_000) == 10
+    assert adaptive.next_limit(20, 5, 0.01, 50_000) == 10
+
+    with pytest.raises(ClientException):
+        AdaptivePageSize(min_limit=10, max_limit=5)
+
+
+@responses.activate
+def test_paginator_adaptive_grows():
+    api = login('https://example.de/api', 'token')
+
+    url = 'https://example.de/api/demo'
+
+    requested_limits = []
+    requested_pages = add_paged_callback(url, 1000, requested_limits)
+
+    paginator: HostingDePaginator = HostingDePaginator(api, instance_class=Record, url=url, raw=True)
+    paginator.adaptive(target=3600, min_limit=10, max_limit=160, seed=10)
+
+    assert [item['content'] for item in paginator] == [f'127.0.0.{i}' for i in range(1000)]
+    # The page size only grows once the offset is a multiple of it, so pages never overlap
+    assert requested_limits == [10, 10, 20, 40, 80] + [160] * 6
+    assert requested_pages == [1, 2, 2, 2, 2, 2, 3, 4, 5, 6, 7]
+    assert len(paginator.page_stats) == 11
+    assert all(size > 0 for _, _, _, size in paginator.page_stats)
+
+
+@responses.activate
+def test_paginator_adaptive_shrinks():
+    api = login('https://example.de/api', 'token')
+
+    url = 'https://example.de/api/demo'
+
+    requested_limits = []
+    add_paged_callback(url, 200, requested_limits)
+
+    paginator: HostingDePaginator = HostingDePaginator(api, instance_class=Record, url=url, limit=100)
+    paginator.adaptive(target=1e-9, min_limit=25, max_limit=100)
+
+    assert [item.content for item in paginator] == [f'127.0.0.{i}' for i in range(200)]
+    assert requested_limits == [100, 50, 25, 25]
+
+
+@responses.activate
+def test_paginator_adaptive_unaligned_sizes():
+    api = login('https://example.de/api', 'token')
+
+    url = 'https://example.de/api/demo'
+
+    requested_limits = []
+    add_paged_callback(url, 100, requested_limits)
+
+    class Sequence(AdaptivePageSize):
+        sizes = itertools.cycle([7, 13, 6, 30, 9, 50])
+
+        def next_limit(self, limit, rows, elapsed, size):
+            return next(self.sizes)
+
+    paginator: HostingDePaginator = HostingDePaginator(api, instance_class=Record, url=url, raw=True, limit=10)
+    paginator.adaptive(Sequence(min_limit=1))
+
+    # Shrinking to sizes the offset is no multiple of re-reads the overlap, which must be skipped
+    assert [item['content'] for item in paginator] == [f'127.0.0.{i}' for i in range(100)]
+    assert requested_limits[0] == 10
+
+
+@responses.activate
+def test_paginator_adaptive_reaches_unaligned_target():
+    api = login('https://example.de/api', 'token')
+
+    url = 'https://example.de/api/demo'
+
+    requested_limits = []
+    requested_pages = add_paged_callback(url, 6000, requested_limits)
+
+    class Fixed(AdaptivePageSize):
+        def next_limit(self, limit, rows, elapsed, size):
+            return 1370
+
+    paginator: HostingDePaginator = HostingDePaginator(api, instance_class=Record, url=url, raw=True)
+    paginator.adaptive(Fixed(max_limit=2000, seed=800))
+
+    # No size between 800 and 1370 divides 800 or 1600, the page grows anyway and the overlap is skipped
+    assert [item['content'] for item in paginator] == [f'127.0.0.{i}' for i in range(6000)]
+    assert requested_limits == [800, 800] + [1370] * 4
+    assert requested_pages == [1, 2, 2, 3, 4, 5]
+
+
+def test_aligned_limit():
+    assert _aligned_limit(0, 800, 1370) == 1370
+    assert _aligned_limit(2400, 800, 1370) == 1200
+    assert _aligned_limit(1600, 800, 1370) == 800
+    assert _aligned_limit(4000, 800, 1000) == 1000
+
+
+@responses.activate
+def test_paginator_adaptive_without_parallel():
+    api = login('https://example.de/api', 'token')
+
+    paginator: HostingDePaginator = HostingDePaginator(api, instance_class=Record, url='demo')
+
+    with pytest.raises(ClientException):
+        paginator.adaptive().parallel(4)
+
+
+def add_keyset_callback(url, rows, requests=None):
+    """
+    Register a callback that sorts and filters the given raw records, like the API does.
+    """
+    keys = {'RecordId': 'id', 'RecordType': 'type', 'RecordLastChangeDate': 'lastChangeDate'}
+    relations = {
+        'equal': lambda a, b: a == b,
+        'greater': lambda a, b: a > b,
+        'greaterEqual': lambda a, b: a >= b,
+        'less': lambda a, b: a < b,
+        'lessEqual': lambda a, b: a <= b,
+    }
+
+    def matches(row, filter):
+        if filter is None:
+            return True
+        if 'subFilter' in filter:
+            results = [matches(row, sub) for sub in filter['subFilter']]
+            return all(results) if filter['subFilterConnective'] == 'and' else any(results)
+        return relations[filter.get('relation', 'equal')](row[keys[filter['field']]], filter['value'])
+
+    def callback(request):
+        body = json.loads(request.body)
+        if requests is not None:
+            requests.append(body)
+
+        result = [row for row in rows if matches(row, body.get('filter'))]
+        if 'sort' in body:
+            result.sort(key=lambda row: row[keys[body['sort']['field']]], reverse=body['sort']['order'] == 'DESC')
+
+        size = body['limit']
+        data = result[(body['page'] - 1) * size : body['page'] * size]
+
+        return (
+            200,
+            {},
+            json.dumps(
+                {
+                    "response": {"data": data, "totalPages": -(-len(result) // size), "totalEntries": len(result)},
+                    "status": "success",
+                }
+            ),
+        )
+
+    responses.add_callback('POST', url, callback)
+
+
+def keyset_record(i, type='A', date='2020-01-01'):
+    return {'id': f'{i:05d}', 'name': 'cloud.de', 'type': type, 'content': f'127.0.0.{i}', 'lastChangeDate': date}
+
+
+@responses.activate
+def test_paginator_keyset():
+    api = login('https://example.de/api', 'token')
+
+    url = 'https://example.de/api/demo'
+
+    rows = [keyset_record(i, 'A' if i % 3 else 'MX') for i in reversed(range(95))]
+    requests = []
+    add_keyset_callback(url, rows, requests)
+
+    paginator: HostingDePaginator = HostingDePaginator(
+        api, instance_class=Record, url=url, limit=10, filter=FilterCondition('RecordType').eq('A')
+    )
+
+    ids = [record.id for record in paginator.keyset('RecordId')]
+
+    assert ids == [f'{i:05d}' for i in range(95) if i % 3]
+    assert [request['page'] for request in requests] == [1] * 7
+    assert requests[0]['filter'] == {'field': 'RecordType', 'value': 'A', 'relation': 'equal'}
+    assert requests[1]['filter'] == {
+        'subFilterConnective': 'and',
+        'subFilter': [
+            {'field': 'RecordType', 'value': 'A', 'relation': 'equal'},
+            {'field': 'RecordId', 'value': '00014', 'relation': 'greater'},
+        ],
+    }
+    assert requests[1]['sort'] == {'field': 'RecordId', 'order': 'ASC'}
+
+
+@responses.activate
+def test_paginator_keyset_consistent_under_changes():
+    api = login('https://example.de/api', 'token')
+
+    url = 'https://example.de/api/demo'
+
+    rows = [keyset_record(i) for i in range(0, 100, 2)]
+    add_keyset_callback(url, rows)
+
+    paginator: HostingDePaginator = HostingDePaginator(api, instance_class=Record, url=url, limit=10, raw=True)
+    paginator.keyset('RecordId')
+
+    seen = [next(paginator)['id'] for _ in range(10)]
+
+    # Entries before the watermark change, which shifts page offsets but not the watermark
+    del rows[:3]
+    rows.append(keyset_record(1))
+
+    seen.extend(row['id'] for row in paginator)
+
+    assert seen == [f'{i:05d}' for i in range(0, 100, 2)]
+
+
+@responses.activate
+def test_paginator_keyset_non_unique_descending():
+    api = login('https://example.de/api', 'token')
+
+    url = 'https://example.de/api/demo'
+
+    rows = [keyset_record(i, date=f'2020-01-{i // 7 + 1:02d}') for i in range(50)]
+    add_keyset_callback(url, rows)
+
+    paginator: HostingDePaginator = HostingDePaginator(api, instance_class=Record, url=url, limit=10, raw=True)
+    paginator.keyset('RecordLastChangeDate', order=SortOrder.DESC, unique=False)
+
+    result = [row['id'] for row in paginator]
+
+    assert sorted(result) == [f'{i:05d}' for i in range(50)]
+    assert [rows[int(i)]['lastChangeDate'] for i in result] == sorted(
+        (row['lastChangeDate'] for row in rows), reverse=True
+    )
+
+
+@responses.activate
+def test_paginator_keyset_too_many_ties():
+    api = login('https://example.de/api', 'token')
+
+    url = 'https://example.de/api/demo'
+
+    add_keyset_callback(url, [keyset_record(i) for i in range(30)])
+
+    paginator: HostingDePaginator = HostingDePaginator(api, instance_class=Record, url=url, limit=10, raw=True)
+    paginator.keyset('RecordLastChangeDate', unique=False)
+
+    with pytest.raises(ClientException):
+        list(paginator)
+
+
+@responses.activate
+def test_paginator_count():
+    api = login('https://example.de/api', 'token')
+
+    url = 'https://example.de/api/demo'
+
+    requested_limits = []
+    add_paged_callback(url, 1000, requested_limits)
+
+    paginator: HostingDePaginator = HostingDePaginator(api, instance_class=Record, url=url, limit=100)
+
+    assert paginator.count_total() == 1000
+    assert len(paginator) == 1000
+    assert requested_limits == [1]
+    assert len(paginator.results) == 0
+
+    assert paginator.count_total(refresh=True) == 1000
+    assert requested_limits == [1, 1]
+
+
+@responses.activate
+def test_paginator_count_without_total_entries():
+    api = login('https://example.de/api', 'token')
+
+    url = 'https://example.de/api/demo'
+
+    responses.add(
+        'POST',
+        url,
+        body=json.dumps({"response": {"data": [{"id": "1"}], "totalPages": 42}, "status": "success"}),
+    )
+
+    assert HostingDePaginator(api, instance_class=Record, url=url).count_total() == 42
+
+
+@responses.activate
+def test_paginator_count_cached_while_iterating():
+    api = login('https://example.de/api', 'token')
+
+    url = 'https://example.de/api/demo'
+
+    requested_limits = []
+    add_paged_callback(url, 30, requested_limits)
+
+    paginator: HostingDePaginator = HostingDePaginator(api, instance_class=Record, url=url, limit=10)
+    next(paginator)
+
+    assert paginator.count_total() == 30
+    assert requested_limits == [10]
+
+
+@responses.activate
+def test_count_all():
+    api = login('https://example.de/api', 'token')
+
+    urls = [f'https://example.de/api/zone{i}' for i in range(20)]
+    for i, url in enumerate(urls):
+        add_paged_callback(url, i * 7)
+
+    paginators = [HostingDePaginator(api, instance_class=Record, url=url) for url in urls]
+
+    assert count_all(paginators, workers=4) == [i * 7 for i in range(20)]
+    assert count_all(paginators[:3], workers=1) == [0, 7, 14]
+
+
+@responses.activate
+def test_paginator_first():
+    api = login('https://example.de/api', 'token')
+
+    url = 'https://example.de/api/demo'
+
+    requests = []
+    add_keyset_callback(url, [keyset_record(i) for i in range(50)], requests)
+
+    paginator: HostingDePaginator = HostingDePaginator(api, instance_class=Record, url=url)
+
+    latest = paginator.first(3, sort=SortConfiguration('RecordId', SortOrder.DESC))
+
+    assert [record.id for record in latest] == ['00049', '00048', '00047']
+    assert len(requests) == 1
+    assert requests[0]['limit'] == 3
+    assert paginator.first(0) == []
+    assert len(requests) == 1
+
+    # Iterating is not affected
+    assert next(paginator).id == '00000'
+
+
+@responses.activate
+def test_paginator_exists():
+    api = login('https://example.de/api', 'token')
+
+    url = 'https://example.de/api/demo'
+
+    requests = []
+    add_keyset_callback(url, [keyset_record(i, 'A' if i % 2 else 'MX') for i in range(10)], requests)
+
+    record_filter = FilterCondition('RecordType').eq('A')
+    paginator: HostingDePaginator = HostingDePaginator(api, instance_class=Record, url=url, filter=record_filter)
+
+    assert paginator.exists()
+    assert paginator.exists(FilterCondition('RecordId').eq('00003'))
+    assert not paginator.exists(FilterCondition('RecordId').eq('00004'))
+    assert [request['limit'] for request in requests] == [1, 1, 1]
+    assert record_filter.to_filter_object() == {'field': 'RecordType', 'value': 'A', 'relation': 'equal'}
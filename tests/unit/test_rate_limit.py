@@ -0,0 +1,104 @@
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import responses
+
+from hostingde.api import login
+from hostingde.rate_limit import RateLimiter, TokenBucket
+
+URL = 'https://example.com/dns/v1/json/nameserverSetGetDefault'
+
+
+def test_token_bucket():
+    bucket = TokenBucket(rate=10, burst=3)
+
+    # The burst is available right away, further tokens are handed out every 1 / rate seconds
+    delays = [bucket.reserve() for _ in range(6)]
+
+    assert delays[:3] == [0, 0, 0]
+    assert delays[3:] == pytest.approx([0.1, 0.2, 0.3], abs=0.01)
+
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0, burst=1)
+
+
+def test_buckets():
+    limiter = RateLimiter(rate=5, burst=1, endpoints={'zoneCreate': (1, 2)})
+
+    assert limiter.bucket(URL, 'a') is limiter.bucket(URL, 'b')
+    assert limiter.bucket(URL) is limiter.bucket('https://example.com/dns/v1/json/zonesFind')
+    assert limiter.bucket('https://example.com/dns/v1/json/zoneCreate') is not limiter.bucket(URL)
+    assert limiter.bucket('https://example.com/dns/v1/json/zoneCreate').burst == 2
+
+    limiter = RateLimiter(rate=5, burst=1, per_account=True, per_endpoint=True)
+
+    assert limiter.bucket(URL, 'a') is not limiter.bucket(URL, 'b')
+    assert limiter.bucket(URL, 'a') is not limiter.bucket('https://example.com/dns/v1/json/zonesFind', 'a')
+    assert limiter.bucket(URL, 'a') is limiter.bucket(URL, 'a')
+
+
+def test_reserve_counts_delays():
+    limiter = RateLimiter(rate=10, burst=1)
+
+    assert limiter.reserve(URL) == 0
+    assert limiter.reserve(URL) > 0
+    assert limiter.delayed == 1
+    assert limiter.waited == pytest.approx(0.1, abs=0.01)
+
+
+@responses.activate
+def test_threads_share_the_limit():
+    sent = []
+
+    def callback(r):
+        sent.append((time.monotonic(), json.loads(r.body).get('ownerAccountId')))
+        return 200, {}, json.dumps({'status': 'success', 'response': {'nameservers': []}})
+
+    responses.add_callback('POST', URL, callback)
+
+    client = login('https://example.com', 'demotoken')
+    client.set_rate_limiter(RateLimiter(rate=50, burst=5))
+
+    def work(i):
+        # Requests of all subclients and accounts take their tokens from the same bucket
+        with client.switch_account_context(f'account-{i}'):
+            for _ in range(5):
+                client.dns.get_default_nameserver()
+
+    started = time.monotonic()
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(work, range(4)))
+
+    assert len(sent) == 20
+    assert time.monotonic() - started >= (20 - 5) / 50 - 0.01
+
+    # With a bucket per account, the accounts don't wait for each other
+    sent.clear()
+    limiter = RateLimiter(rate=50, burst=5, per_account=True)
+    client.set_rate_limiter(limiter)
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(work, range(4)))
+
+    assert len(sent) == 20
+    assert (limiter.delayed, limiter.waited) == (0, 0)
+
+
+@responses.activate
+def test_account_buckets_per_client():
+    responses.add('POST', URL, body=json.dumps({'status': 'success', 'response': {'nameservers': []}}))
+
+    limiter = RateLimiter(rate=50, burst=5, per_account=True)
+    first = login('https://example.com', 'first-token')
+    second = login('https://example.com', 'second-token')
+    first.set_rate_limiter(limiter)
+    second.set_rate_limiter(limiter)
+
+    with first.switch_account_context('sub'):
+        first.dns.get_default_nameserver()
+        second.dns.get_default_nameserver()
+
+    # The account context of one client does not move the requests of another into its bucket
+    assert set(limiter.buckets) == {('sub', None), (None, None)}
@@ -0,0 +1,50 @@
+import json
+
+import mock
+import pytest
+import responses
+
+from hostingde.api import login
+from hostingde.exceptions import ApiException
+from hostingde.response import ApiResponse
+
+
+@responses.activate
+def test_request_returns_envelope():
+    client = login('https://example.com', 'token')
+
+    responses.add(
+        'POST',
+        'https://example.com/demo',
+        body=json.dumps({'status': 'success', 'response': {'id': 'abc'}, 'warnings': [{'text': 'careful'}]}),
+        headers={'X-Demo': 'header'},
+    )
+
+    with mock.patch.object(client.session.codec, 'loads', wraps=client.session.codec.loads) as parse:
+        result = client._request('https://example.com/demo')
+
+        assert result.response == {'id': 'abc'}
+        assert result.json() == result.data
+
+    assert parse.call_count == 1
+    assert isinstance(result, ApiResponse)
+    assert result.status == 'success'
+    assert result.responses == []
+    assert result.errors == []
+    assert result.warnings == [{'text': 'careful'}]
+    assert result.headers['X-Demo'] == 'header'
+    assert client._bool(result)
+
+
+@responses.activate
+def test_request_raises_on_error():
+    client = login('https://example.com', 'token')
+
+    responses.add(
+        'POST', 'https://example.com/demo', body=json.dumps({'status': 'error', 'errors': [{'text': 'failure'}]})
+    )
+
+    with pytest.raises(ApiException) as e:
+        client._request('https://example.com/demo')
+
+    assert str(e.value) == 'failure'
@@ -0,0 +1,186 @@
+import json
+import time
+
+import pytest
+import responses
+from requests import PreparedRequest
+from requests.exceptions import ConnectionError, ConnectTimeout, ReadTimeout
+from urllib3.exceptions import MaxRetryError, NewConnectionError, ProtocolError
+
+from hostingde.api import login
+from hostingde.exceptions import ApiException, ClientException, TransportException
+from hostingde.model.zone_config import ZoneConfig, ZoneConfigType
+from hostingde.retry import Backoff, Failure, RetryPolicy
+
+ZONES_FIND = 'https://example.com/dns/v1/json/zonesFind'
+ZONE_CREATE = 'https://example.com/dns/v1/json/zoneCreate'
+
+ZONES = {'status': 'success', 'response': {'data': [], 'totalPages': 1, 'totalEntries': 0}}
+RATE_LIMITED = {'status': 'error', 'errors': [{'code': 10299, 'text': 'Too many requests'}]}
+
+
+class Status:
+    def __init__(self, status_code, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+def fast_client(**kwargs):
+    client = login('https://example.com', 'demotoken')
+    client.set_retry_policy(RetryPolicy(backoff=Backoff(initial=0.01, jitter=0), **kwargs))
+    return client
+
+
+def add_failing_callback(url, failures, body=ZONES):
+    """
+    Answer the first requests with the given failures, which are (status, headers, body) tuples or exceptions.
+    """
+    calls = []
+
+    def callback(r: PreparedRequest):
+        calls.append(json.loads(r.body))
+        if len(calls) <= len(failures):
+            failure = failures[len(calls) - 1]
+            if isinstance(failure, Exception):
+                raise failure
+            return failure
+        return 200, {}, json.dumps(body)
+
+    responses.add_callback('POST', url, callback)
+    return calls
+
+
+def refused():
+    return ConnectionError(MaxRetryError(None, ZONE_CREATE, NewConnectionError(None, 'Connection refused')))
+
+
+def test_classify():
+    policy = RetryPolicy(error_codes=[10299])
+
+    assert policy.classify(ClientException(), Status(429)) is Failure.NOT_PROCESSED
+    assert policy.classify(ApiException(RATE_LIMITED), Status(200)) is Failure.NOT_PROCESSED
+    assert policy.classify(ClientException(), Status(502)) is Failure.UNCERTAIN
+    assert policy.classify(ApiException({'errors': [{'code': 10200}]}), Status(503)) is Failure.UNCERTAIN
+    assert policy.classify(ApiException({'errors': [{'code': 10200}]}), Status(200)) is Failure.PERMANENT
+
+    assert policy.classify(ConnectTimeout()) is Failure.NOT_PROCESSED
+    assert policy.classify(refused()) is Failure.NOT_PROCESSED
+    assert policy.classify(ConnectionError(ProtocolError('Connection reset by peer'))) is Failure.UNCERTAIN
+    assert policy.classify(ReadTimeout()) is Failure.UNCERTAIN
+    assert policy.classify(TransportException('refused', request_sent=False)) is Failure.NOT_PROCESSED
+    assert policy.classify(TransportException('reset')) is Failure.UNCERTAIN
+    assert policy.classify(ValueError()) is Failure.PERMANENT
+
+
+def test_is_read():
+    policy = RetryPolicy()
+
+    assert policy.is_read(ZONES_FIND)
+    assert policy.is_read('https://example.com/dns/v1/json/recordsUpdateCheck')
+    assert policy.is_read('https://example.com/account/v1/json/getOwnAccount')
+    assert not policy.is_read(ZONE_CREATE)
+    assert not policy.is_read('https://example.com/dns/v1/json/recordsUpdate')
+
+
+@responses.activate
+def test_find_retries_transient_failures():
+    client = fast_client()
+    calls = add_failing_callback(
+        ZONES_FIND, [(502, {}, '<html>Bad Gateway</html>'), ConnectionError(ProtocolError('reset')), ReadTimeout()]
+    )
+
+    assert client.dns.list_zones(raw=True).fetchall() == []
+    assert len(calls) == 4
+    # Every attempt is sent with the same payload
+    assert all(call == calls[0] for call in calls)
+
+
+@responses.activate
+def test_find_gives_up():
+    client = fast_client(attempts=3)
+    calls = add_failing_callback(ZONES_FIND, [(503, {}, '<html>Unavailable</html>')] * 5)
+
+    with pytest.raises(ClientException):
+        client.dns.list_zones(raw=True).fetchall()
+
+    assert len(calls) == 3
+
+
+@responses.activate
+def test_permanent_errors_are_not_retried():
+    client = fast_client()
+    calls = add_failing_callback(ZONES_FIND, [(200, {}, json.dumps({'status': 'error', 'errors': [{'code': 1}]}))])
+
+    with pytest.raises(ApiException):
+        client.dns.list_zones(raw=True).fetchall()
+
+    assert len(calls) == 1
+
+
+@responses.activate
+def test_mutations_are_only_retried_if_not_processed():
+    client = fast_client(error_codes=[10299])
+    config = ZoneConfig(name='example.org', type=ZoneConfigType.NATIVE)
+
+    # The zone may have been created, it is not created a second time
+    calls = add_failing_callback(ZONE_CREATE, [(502, {}, '<html>Bad Gateway</html>')])
+    with pytest.raises(ClientException):
+        client.dns.create_zone(config, asynchronous=True)
+    assert len(calls) == 1
+
+    responses.reset()
+    calls = add_failing_callback(ZONE_CREATE, [ConnectionError(ProtocolError('reset'))])
+    with pytest.raises(ConnectionError):
+        client.dns.create_zone(config, asynchronous=True)
+    assert len(calls) == 1
+
+    # Rate limited and refused requests were not processed
+    responses.reset()
+    zone = {'status': 'pending', 'response': {'zoneConfig': {'name': 'example.org', 'type': 'NATIVE'}}}
+    calls = add_failing_callback(
+        ZONE_CREATE, [(429, {}, ''), (200, {}, json.dumps(RATE_LIMITED)), refused()], body=zone
+    )
+    assert client.dns.create_zone(config, asynchronous=True).zone_config.name == 'example.org'
+    assert len(calls) == 4
+
+
+@responses.activate
+def test_retry_after():
+    client = fast_client()
+    calls = add_failing_callback(ZONES_FIND, [(429, {'Retry-After': '0.2'}, '')])
+
+    started = time.monotonic()
+    client.dns.list_zones(raw=True).fetchall()
+
+    assert len(calls) == 2
+    assert time.monotonic() - started >= 0.2
+
+    # Waiting longer than allowed raises right away
+    responses.reset()
+    calls = add_failing_callback(ZONES_FIND, [(429, {'Retry-After': '3600'}, '')])
+    with pytest.raises(ClientException):
+        client.dns.list_zones(raw=True).fetchall()
+    assert len(calls) == 1
+
+
+@responses.activate
+def test_retries_disabled():
+    client = fast_client()
+    client.set_retry_policy(None)
+    calls = add_failing_callback(ZONES_FIND, [(502, {}, '<html>Bad Gateway</html>')])
+
+    with pytest.raises(ClientException):
+        client.dns.list_zones(raw=True).fetchall()
+
+    assert len(calls) == 1
+
+
+@responses.activate
+def test_retries_are_opt_in():
+    client = login('https://example.com', 'demotoken')
+    calls = add_failing_callback(ZONES_FIND, [(502, {}, '<html>Bad Gateway</html>')])
+
+    with pytest.raises(ClientException):
+        client.dns.list_zones(raw=True).fetchall()
+
+    assert len(calls) == 1
@@ -1,8 +1,21 @@
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import mock
 import pytest
+import requests
 import responses
 from requests import PreparedRequest, Response
 
-from hostingde.session import HostingDeSession
+from hostingde.api import login
+from hostingde.exceptions import ClientException
+from hostingde.model.record import Record, RecordType
+from hostingde.paginator import HostingDePaginator
+from hostingde.session import HostingDeAuth, HostingDeSession
 
 
 def test_session_create():
@@ -72,3 +85,267 @@ def test_auth_injection_without_body():
     response: Response = session.post('https://example.com')
 
     assert response.json().get('authToken') == 'demotoken'
+
+
+@responses.activate
+def test_auth_injected_before_serialization():
+    client = login('https://example.com', 'demotoken')
+    client.set_account_context('account')
+    client.set_json_codec('json')
+
+    requests = []
+
+    def echo_callback(r: PreparedRequest):
+        requests.append(r)
+        return 200, {}, json.dumps({'status': 'success'})
+
+    responses.add_callback('POST', 'https://example.com/demo', echo_callback)
+
+    record = Record.create_new_record('cloud.de', RecordType.A, '127.0.0.1')
+
+    with mock.patch.object(HostingDeAuth, '__call__', side_effect=AssertionError('body was encoded again')):
+        client._request('https://example.com/demo', record)
+        client._request('https://example.com/demo')
+
+    assert requests[0].body == json.dumps(
+        {**record.to_json(), 'authToken': 'demotoken', 'ownerAccountId': 'account'}
+    ).encode('utf-8')
+    assert requests[0].headers['Content-Type'] == 'application/json'
+    assert requests[1].body == b'{"authToken": "demotoken", "ownerAccountId": "account"}'
+
+
+def add_account_echo(url, accounts):
+    def callback(r: PreparedRequest):
+        body = json.loads(r.body)
+        accounts.append(body.get('ownerAccountId'))
+        return 200, {}, json.dumps({'status': 'success', 'response': {'account': body.get('ownerAccountId')}})
+
+    responses.add_callback('POST', url, callback)
+
+
+@responses.activate
+def test_switch_account_context():
+    client = login('https://example.com', 'demotoken')
+    accounts = []
+    add_account_echo('https://example.com/demo', accounts)
+
+    client.set_account_context('default')
+
+    with client.switch_account_context('first'):
+        client.dns._request('https://example.com/demo')
+
+        with client.switch_account_context(None):
+            client._request('https://example.com/demo')
+
+        assert client.session.get_account_context() == 'first'
+
+    client._request('https://example.com/demo')
+
+    assert accounts == ['first', None, 'default']
+    assert client.session.get_account_context() == 'default'
+
+
+@responses.activate
+def test_switch_account_context_per_thread():
+    client = login('https://example.com', 'demotoken')
+    accounts = []
+    add_account_echo('https://example.com/demo', accounts)
+
+    barrier = threading.Barrier(8)
+
+    def work(account):
+        with client.switch_account_context(account):
+            # All threads are within their context at the same time
+            barrier.wait()
+            return [client.dns._request('https://example.com/demo').response['account'] for _ in range(5)]
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(work, [f'account-{i}' for i in range(8)]))
+
+    assert results == [[f'account-{i}'] * 5 for i in range(8)]
+
+
+@responses.activate
+def test_switch_account_context_per_client():
+    first = login('https://example.com', 'first-token')
+    second = login('https://example.com', 'second-token')
+    accounts = []
+    add_account_echo('https://example.com/demo', accounts)
+
+    with first.switch_account_context('sub'):
+        second._request('https://example.com/demo')
+        first._request('https://example.com/demo')
+
+        assert second.session.get_account_context() is None
+
+        with second.switch_account_context('other'):
+            assert (first.session.get_account_context(), second.session.get_account_context()) == ('sub', 'other')
+
+        assert second.session.get_account_context() is None
+
+    assert accounts == [None, 'sub']
+    assert first.session.get_account_context() is None
+
+
+def test_account_context_per_task():
+    auth = HostingDeAuth('token', account_id='default')
+
+    async def work(account):
+        with auth.account_context(account):
+            await asyncio.sleep(0.01)
+            return auth.inject({})['ownerAccountId']
+
+    async def main():
+        return await asyncio.gather(*(work(f'account-{i}') for i in range(5)))
+
+    assert asyncio.run(main()) == [f'account-{i}' for i in range(5)]
+    assert auth.inject({})['ownerAccountId'] == 'default'
+
+
+@responses.activate
+def test_account_context_prefetch():
+    client = login('https://example.com', 'demotoken')
+    accounts = []
+
+    def callback(r: PreparedRequest):
+        body = json.loads(r.body)
+        accounts.append(body.get('ownerAccountId'))
+        return 200, {}, json.dumps({'status': 'success', 'response': {'data': [{}] * 10, 'totalPages': 3}})
+
+    responses.add_callback('POST', 'https://example.com/demo', callback)
+
+    with client.switch_account_context('sub'):
+        paginator = HostingDePaginator(client, Record, 'https://example.com/demo', limit=10, raw=True, prefetch=2)
+        assert len(paginator.fetchall()) == 30
+
+    assert accounts == ['sub', 'sub', 'sub']
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        time.sleep(self.server.delay)
+        body = json.dumps({'status': 'success', 'response': {'connection': self.headers.get('Connection')}}).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_HEAD(self):
+        self.send_response(405)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def local_server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), KeepAliveHandler)
+    server.daemon_threads = True
+    server.connections = 0
+    server.lock = threading.Lock()
+    server.delay = 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield server
+
+    server.shutdown()
+    server.server_close()
+
+
+def accepted_connections(server, expected, timeout=2.0):
+    """
+    Get the number of connections the server accepted. Connections are counted by the handler threads, so it waits a
+    moment for connections, which the client opened but the server did not count yet.
+    """
+    deadline = time.monotonic() + timeout
+    while server.connections < expected and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    return server.connections
+
+
+def test_warm_up(local_server):
+    url = f'http://127.0.0.1:{local_server.server_port}/api'
+    client = login(url, 'demotoken', warm_up=4, pool_maxsize=8)
+
+    stats = client.session.pool_stats()
+    assert [(s.connections, s.requests, s.idle, s.maxsize) for s in stats] == [(4, 0, 4, 8)]
+    assert accepted_connections(local_server, 4) == 4
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(lambda _: client.dns._request(url + '/demo'), range(40)))
+
+    # The requests reused the warmed up connections
+    (stats,) = client.session.pool_stats()
+    assert stats.host == f'http://127.0.0.1:{local_server.server_port}'
+    assert stats.requests == 40
+    assert stats.connections == 4
+    assert local_server.connections == 4
+
+
+def test_warm_up_without_pool_internals(local_server, monkeypatch):
+    url = f'http://127.0.0.1:{local_server.server_port}/api'
+    client = login(url, 'demotoken', pool_maxsize=8)
+
+    class PublicPool:
+        """
+        A pool without the private methods of urllib3 1.26.
+        """
+
+        def __init__(self, pool):
+            self.pool = pool
+
+        def __getattr__(self, name):
+            if name in ('_get_conn', '_put_conn'):
+                raise AttributeError(name)
+            return getattr(self.pool, name)
+
+    adapter = client.session.get_adapter(url)
+    get_connection = adapter.get_connection
+    monkeypatch.setattr(adapter, 'get_connection', lambda *args: PublicPool(get_connection(*args)))
+
+    assert client.session.warm_up(4) == 4
+    assert accepted_connections(local_server, 4) == 4
+    assert [(s.connections, s.idle) for s in client.session.pool_stats()] == [(4, 4)]
+
+
+def test_warm_up_unreachable():
+    client = login('http://127.0.0.1:9/api', 'demotoken')
+
+    assert client.session.warm_up(2) == 0
+    with pytest.raises(ClientException):
+        HostingDeSession().warm_up()
+
+
+def test_keep_alive_disabled(local_server):
+    url = f'http://127.0.0.1:{local_server.server_port}/api'
+    client = login(url, 'demotoken', keep_alive=False)
+
+    for _ in range(3):
+        assert client.dns._request(url + '/demo').response['connection'] == 'close'
+
+    assert local_server.connections == 3
+
+
+def test_timeouts(local_server):
+    url = f'http://127.0.0.1:{local_server.server_port}/api'
+    client = login(url, 'demotoken', connect_timeout=1, read_timeout=0.05)
+    local_server.delay = 0.3
+
+    with pytest.raises(requests.exceptions.ReadTimeout):
+        client.dns._request(url + '/demo')
+
+    # A timeout passed to the request takes precedence
+    assert client.dns._request(url + '/demo', timeout=2).status == 'success'
@@ -0,0 +1,108 @@
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import responses
+
+from hostingde.api import login
+from hostingde.exceptions import ApiException
+from hostingde.single_flight import SingleFlight
+
+NAMESERVERS = 'https://example.com/dns/v1/json/nameserverSetGetDefault'
+
+
+def add_slow_callback(url, result, requests):
+    def callback(r):
+        requests.append(json.loads(r.body))
+        time.sleep(0.2)
+        return 200, {}, json.dumps(result)
+
+    responses.add_callback('POST', url, callback)
+
+
+def concurrently(work, n=8):
+    barrier = threading.Barrier(n)
+
+    def run(i):
+        barrier.wait()
+        return work(i)
+
+    with ThreadPoolExecutor(max_workers=n) as pool:
+        return list(pool.map(run, range(n)))
+
+
+def test_applies():
+    flight = SingleFlight()
+
+    assert flight.applies('https://example.com/dns/v1/json/zonesFind')
+    assert flight.applies(NAMESERVERS)
+    assert not flight.applies('https://example.com/dns/v1/json/zoneCreate')
+
+
+@responses.activate
+def test_identical_reads_are_shared():
+    requests = []
+    add_slow_callback(NAMESERVERS, {'status': 'success', 'response': {'nameservers': ['ns1.example.com']}}, requests)
+
+    client = login('https://example.com', 'demotoken')
+    flight = SingleFlight()
+    client.set_single_flight(flight)
+
+    results = concurrently(lambda _: client.dns.get_default_nameserver())
+
+    assert results == [['ns1.example.com']] * 8
+    assert len(requests) == 1
+    assert (flight.requests, flight.shared) == (1, 7)
+
+    # Requests that are no longer in flight are sent again
+    client.dns.get_default_nameserver()
+    assert len(requests) == 2
+
+
+@responses.activate
+def test_accounts_are_not_shared():
+    requests = []
+    add_slow_callback(NAMESERVERS, {'status': 'success', 'response': {'nameservers': []}}, requests)
+
+    client = login('https://example.com', 'demotoken')
+    client.set_single_flight(SingleFlight())
+
+    def work(i):
+        with client.switch_account_context(f'account-{i % 2}'):
+            return client.dns.get_default_nameserver()
+
+    concurrently(work)
+
+    assert sorted(request['ownerAccountId'] for request in requests) == ['account-0', 'account-1']
+
+
+@responses.activate
+def test_errors_are_shared():
+    requests = []
+    add_slow_callback(NAMESERVERS, {'status': 'error', 'errors': [{'text': 'Access denied'}]}, requests)
+
+    client = login('https://example.com', 'demotoken')
+    client.set_single_flight(SingleFlight())
+
+    def work(i):
+        with pytest.raises(ApiException):
+            client.dns.get_default_nameserver()
+
+    concurrently(work, 4)
+
+    assert len(requests) == 1
+
+
+@responses.activate
+def test_mutations_are_not_shared():
+    requests = []
+    add_slow_callback('https://example.com/dns/v1/json/zoneDelete', {'status': 'success', 'response': {}}, requests)
+
+    client = login('https://example.com', 'demotoken')
+    client.set_single_flight(SingleFlight())
+
+    concurrently(lambda _: client.dns.delete_zone(zone_name='example.org', asynchronous=True), 4)
+
+    assert len(requests) == 4